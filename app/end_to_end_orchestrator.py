@@ -401,6 +401,7 @@ class EndToEndOrchestrator:
 
                 results["success"] = True
                 self.processed_files.append(results)
+                self._invalidate_chat_cache()
 
         except Exception as e:
             print(f"❌ Processing failed: {e}")
@@ -573,6 +574,7 @@ class EndToEndOrchestrator:
                 results["kb_results"] = kb_stats
                 print(f"✓ SuperKB complete: {kb_stats.get('chunks', 0)} chunks, {kb_stats.get('entities', 0)} entities")
                 results["success"] = True
+                self._invalidate_chat_cache()
 
         except Exception as e:
             print(f"❌ KB processing failed: {e}")
@@ -581,6 +583,13 @@ class EndToEndOrchestrator:
         print("=" * 80)
         return results
 
+    def _invalidate_chat_cache(self):
+        """
+        Drops cached chat answers after the knowledge base has changed.
+        """
+        if self.chat_orchestrator:
+            self.chat_orchestrator.clear_response_cache()
+
     def initialize_chat_agent(self):
         """
         Initializes the SuperChat agent with the processed knowledge base.
@@ -18,7 +18,8 @@ interacting with the Snowflake database. It includes:
   `close_database` for managing the database lifecycle.
 
 - **Custom Types**: `VariantType` for mapping Python dicts and lists to
-  Snowflake's VARIANT data type.
+  Snowflake's VARIANT data type, and `UUIDType` for storing UUID keys as
+  native UUIDs or 16-byte binary values.
 """
 
 from .connection import (
@@ -31,6 +32,7 @@ from .connection import (
     close_database,
 )
 from .variant_type import VariantType
+from .uuid_type import UUIDType
 
 __all__ = [
     "DatabaseConnection",
@@ -41,4 +43,5 @@ __all__ = [
     "test_connection",
     "close_database",
     "VariantType",
+    "UUIDType",
 ]
\ No newline at end of file
@@ -251,6 +251,7 @@ class DatabaseConnection:
         # Import all models to ensure they're registered
         from ..models.project import Project
         from ..models.schema import Schema
+        from ..models.schema_attribute import SchemaAttribute
         from ..models.node import Node
         from ..models.edge import Edge
         from ..models.file_record import FileRecord
@@ -260,6 +261,21 @@ class DatabaseConnection:
         # Create all tables
         SQLModel.metadata.create_all(engine)
 
+        # Secondary indexes. Snowflake has none on standard tables; new
+        # `projects` tables are clustered on the same keys instead (see
+        # `Project.__table_args__`), and existing ones can opt in with
+        # scripts/migrate_projects_cluster_key.py.
+        from sqlalchemy import text
+        from ..models.project import PROJECT_INDEXES
+
+        if engine.dialect.name != "snowflake":
+            with engine.begin() as conn:
+                for name, columns in PROJECT_INDEXES:
+                    conn.execute(text(
+                        f"CREATE INDEX IF NOT EXISTS {name} "
+                        f"ON {Project.__tablename__} ({', '.join(columns)})"
+                    ))
+
         self._initialized = True
         print("✓ Database initialized successfully")
 
@@ -0,0 +1,95 @@
+"""
+Custom SQLAlchemy TypeDecorator for compact UUID storage.
+
+This module provides a `UUIDType` that stores UUIDs in the dialect's native
+UUID type where one exists (e.g. PostgreSQL), and as 16-byte `BINARY` values
+everywhere else (e.g. Snowflake), instead of the 32/36-character strings used
+by the generic `Uuid` type on dialects without native support.
+
+Tables created before keys were stored as binary hold them as hex text,
+which binary binds never match in filters or joins. Convert such tables
+with `scripts/migrate_uuid_keys_to_binary.py` before deploying this type.
+"""
+
+from typing import Any, Optional
+from uuid import UUID
+
+from sqlalchemy.types import BINARY, TypeDecorator, Uuid
+
+
+class UUIDType(TypeDecorator):
+    """
+    A custom SQLAlchemy `TypeDecorator` for UUID primary and foreign keys.
+
+    On dialects with a native UUID type, values are bound and returned as
+    `uuid.UUID` objects. On other dialects, values are stored as the 16 raw
+    bytes of the UUID, which halves key and index size compared to text and
+    makes key comparisons a fixed-width byte compare.
+
+    Usage:
+        from graph_rag.db import UUIDType
+
+        class MyModel(SQLModel, table=True):
+            id: UUID = Field(default_factory=uuid4, primary_key=True, sa_type=UUIDType)
+    """
+
+    impl = BINARY(16)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        """
+        Selects the native UUID type or `BINARY(16)` for the dialect.
+
+        Args:
+            dialect: The SQLAlchemy dialect.
+
+        Returns:
+            The dialect-specific type implementation.
+        """
+        if dialect.supports_native_uuid:
+            return dialect.type_descriptor(Uuid(native_uuid=True))
+        return dialect.type_descriptor(BINARY(16))
+
+    def process_bind_param(self, value: Any, dialect) -> Any:
+        """
+        Converts a UUID (or its string form) to the stored representation.
+
+        Args:
+            value: The UUID to bind.
+            dialect: The SQLAlchemy dialect.
+
+        Returns:
+            A `uuid.UUID` on native dialects, its 16 bytes otherwise, or
+            `None` if the value is `None`.
+        """
+        if value is None:
+            return None
+
+        if not isinstance(value, UUID):
+            value = UUID(str(value))
+
+        if dialect.supports_native_uuid:
+            return value
+        return value.bytes
+
+    def process_result_value(self, value: Any, dialect) -> Optional[UUID]:
+        """
+        Converts a stored value back to a `uuid.UUID`.
+
+        Args:
+            value: The value from the database.
+            dialect: The SQLAlchemy dialect.
+
+        Returns:
+            The `uuid.UUID`, or `None` if the value is `None`.
+        """
+        if value is None or isinstance(value, UUID):
+            return value
+
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return UUID(bytes=bytes(value))
+
+        # Rows written before the switch to binary storage hold text UUIDs
+        # (readable here, but only matched by filters once migrated with
+        # `scripts/migrate_uuid_keys_to_binary.py`)
+        return UUID(str(value))
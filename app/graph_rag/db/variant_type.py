@@ -14,6 +14,37 @@ from sqlalchemy.types import TypeDecorator
 from sqlalchemy.sql import func, literal
 from snowflake.sqlalchemy import VARIANT
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def _dumps(value: Any) -> str:
+        """
+        Serializes a value to a JSON string using `orjson`, falling back to
+        the stdlib `json` for values `orjson` rejects (such as integers wider
+        than 64 bits). Note that `orjson` writes NaN and infinities as `null`.
+        """
+        try:
+            # Snowflake binds VARIANT payloads as text, so decode orjson's bytes.
+            return orjson.dumps(value, default=str, option=_ORJSON_OPTIONS).decode()
+        except TypeError:  # orjson.JSONEncodeError subclasses TypeError
+            return json.dumps(value, default=str)
+
+    _loads = orjson.loads
+    _JSONDecodeError = orjson.JSONDecodeError
+else:
+    def _dumps(value: Any) -> str:
+        """Serializes a value to a JSON string using the stdlib `json`."""
+        return json.dumps(value, default=str)
+
+    _loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
+
 
 class VariantType(TypeDecorator):
     """
@@ -77,8 +108,10 @@ class VariantType(TypeDecorator):
             value = value.model_dump()
 
         # Serialize to JSON string
-        # Snowflake connector requires JSON strings for VARIANT columns
-        return json.dumps(value)
+        # Snowflake connector requires JSON strings for VARIANT columns.
+        # `orjson` is used when installed; values it cannot encode natively
+        # (e.g. `Decimal`) fall back to `str()`.
+        return _dumps(value)
 
     def process_result_value(self, value: Any, dialect) -> Any:
         """
@@ -98,8 +131,8 @@ class VariantType(TypeDecorator):
         # Snowflake may return the value as a string or already parsed
         if isinstance(value, str):
             try:
-                return json.loads(value)
-            except json.JSONDecodeError:
+                return _loads(value)
+            except _JSONDecodeError:
                 # If it's not valid JSON, return as-is
                 return value
 
@@ -13,6 +13,9 @@ The main models are:
 - **Schema**: Defines the structure for nodes and edges. It is versioned to
   allow for schema evolution over time.
 
+- **SchemaAttribute**: One row per structured attribute of a schema, so
+  attribute-level filters run relationally instead of over JSON.
+
 - **Node**: Represents an entity in the knowledge graph, such as a person,
   place, or concept. Each node conforms to a specific schema and can contain
   both structured and unstructured data, as well as a vector embedding.
@@ -29,8 +32,16 @@ The main models are:
   and entity extraction.
 """
 
-from .project import Project, ProjectStatus, ProjectConfig, ProjectStats, ProjectQuery
+from .project import (
+    Project,
+    ProjectStatus,
+    ProjectConfig,
+    ProjectStats,
+    ProjectQuery,
+    project_batch_clock
+)
 from .schema import Schema
+from .schema_attribute import SchemaAttribute
 from .types import EntityType as SchemaType
 from .node import (
     Node,
@@ -57,9 +68,11 @@ __all__ = [
     "ProjectConfig",
     "ProjectStats",
     "ProjectQuery",
+    "project_batch_clock",
 
     # Schema
     "Schema",
+    "SchemaAttribute",
     "SchemaType",
 
     # Node
@@ -19,7 +19,7 @@ from uuid import UUID, uuid4
 
 from pydantic import Field, field_validator, model_validator
 from sqlmodel import Column, Field as SQLField, Relationship, SQLModel
-from app.graph_rag.db import VariantType
+from app.graph_rag.db import UUIDType, VariantType
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -107,6 +107,7 @@ class Edge(SQLModel, table=True):
     # Schema conformance
     schema_id: UUID = SQLField(
         foreign_key="schemas.schema_id",
+        sa_type=UUIDType,
         description="Reference to the Schema this edge conforms to"
     )
     
@@ -156,6 +157,7 @@ class Edge(SQLModel, table=True):
     # Project association
     project_id: UUID = SQLField(
         foreign_key="projects.project_id",
+        sa_type=UUIDType,
         description="Project this edge belongs to"
     )
     
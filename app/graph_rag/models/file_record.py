@@ -12,7 +12,7 @@ from uuid import UUID, uuid4
 
 from pydantic import field_validator
 from sqlmodel import Column, Field, SQLModel
-from app.graph_rag.db import VariantType
+from app.graph_rag.db import UUIDType, VariantType
 
 
 class FileRecord(SQLModel, table=True):
@@ -27,7 +27,7 @@ class FileRecord(SQLModel, table=True):
     file_id: UUID = Field(default_factory=uuid4, primary_key=True)
 
     # Project association
-    project_id: UUID = Field(foreign_key="projects.project_id")
+    project_id: UUID = Field(foreign_key="projects.project_id", sa_type=UUIDType)
 
     # File metadata
     filename: str = Field(description="Original file name")
@@ -13,7 +13,7 @@ from uuid import UUID, uuid4
 
 from pydantic import Field, field_validator, model_validator
 from sqlmodel import Column, Field as SQLField, Relationship, SQLModel
-from app.graph_rag.db import VariantType
+from app.graph_rag.db import UUIDType, VariantType
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -176,6 +176,7 @@ class Node(SQLModel, table=True):
     # Schema conformance
     schema_id: UUID = SQLField(
         foreign_key="schemas.schema_id",
+        sa_type=UUIDType,
         description="The ID of the schema this node conforms to."
     )
 
@@ -208,6 +209,7 @@ class Node(SQLModel, table=True):
     # Project association
     project_id: UUID = SQLField(
         foreign_key="projects.project_id",
+        sa_type=UUIDType,
         description="The ID of the project this node belongs to."
     )
 
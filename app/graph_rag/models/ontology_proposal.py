@@ -9,7 +9,7 @@ from typing import Any, Dict, List, Optional
 from uuid import UUID, uuid4
 
 from sqlmodel import Column, Field, SQLModel
-from app.graph_rag.db import VariantType
+from app.graph_rag.db import UUIDType, VariantType
 
 
 class OntologyProposal(SQLModel, table=True):
@@ -22,7 +22,7 @@ class OntologyProposal(SQLModel, table=True):
     proposal_id: UUID = Field(default_factory=uuid4, primary_key=True)
 
     # Project association
-    project_id: UUID = Field(foreign_key="projects.project_id")
+    project_id: UUID = Field(foreign_key="projects.project_id", sa_type=UUIDType)
 
     # Status and summary
     status: str = Field(default="processing")
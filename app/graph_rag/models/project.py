@@ -7,14 +7,22 @@ multi-tenant environment for organizing schemas, nodes, and edges. It also
 holds project-level configuration and statistics.
 """
 
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional
 from uuid import UUID, uuid4
 
 from pydantic import Field as PydanticField, field_validator
-from sqlmodel import Column, Field, Relationship, SQLModel
-from app.graph_rag.db import VariantType
+from sqlalchemy import bindparam, func
+from sqlalchemy.orm import deferred, selectinload, undefer_group
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlmodel import Column, Field, Relationship, Session, SQLModel, select
+from sqlmodel.sql.expression import Select
+from app.graph_rag.db import UUIDType, VariantType
 
 
 class ProjectStatus(str, Enum):
@@ -27,6 +35,17 @@ class ProjectStatus(str, Enum):
     MAINTENANCE = "maintenance"
 
 
+# Deletion table for the separators allowed in project names
+_NAME_SEPARATORS = str.maketrans('', '', '-_')
+
+_ACTIVE = ProjectStatus.ACTIVE
+_ARCHIVED = ProjectStatus.ARCHIVED
+_DELETED = ProjectStatus.DELETED
+_ACTIVE_VALUE = _ACTIVE.value
+_ARCHIVED_VALUE = _ARCHIVED.value
+_DELETED_VALUE = _DELETED.value
+
+
 class ProjectConfig(SQLModel):
     """
     A model for project-level configuration settings.
@@ -154,6 +173,76 @@ class ProjectStats(SQLModel):
     )
 
 
+# Secondary indexes for `projects` on dialects that support them. Dashboard
+# listings filter by owner/status and sort by creation time. They are not
+# declared on the table because the Snowflake dialect refuses to create a
+# standard table that has indexes attached.
+PROJECT_INDEXES = (
+    ("ix_projects_owner_status", ("owner_id", "status")),
+    ("ix_projects_status_created", ("status", "created_at")),
+)
+
+
+# Default `config`/`stats` payloads, computed once from the pydantic models.
+# New projects get a copy of these instead of validating a model per project.
+_DEFAULT_CONFIG_DICT = ProjectConfig().model_dump()
+_DEFAULT_STATS_DICT = ProjectStats().model_dump()
+
+
+def _default_config() -> Dict[str, Any]:
+    """Returns a fresh copy of the default project configuration."""
+    # `custom_settings` is the only nested mutable value; give each project its own
+    return {**_DEFAULT_CONFIG_DICT, "custom_settings": {}}
+
+
+def _default_stats() -> Dict[str, Any]:
+    """Returns a fresh copy of the default project statistics."""
+    return dict(_DEFAULT_STATS_DICT)
+
+
+# Timestamp shared by all project mutations inside `project_batch_clock()`.
+_batch_now: ContextVar[Optional[datetime]] = ContextVar("_batch_now", default=None)
+
+
+def _now() -> datetime:
+    """Returns the current batch timestamp, or the current UTC time outside a batch."""
+    return _batch_now.get() or datetime.utcnow()
+
+
+@contextmanager
+def project_batch_clock() -> Iterator[datetime]:
+    """
+    Freezes the clock used by `Project` mutators for the duration of a bulk
+    operation.
+
+    The clock is read once on entry, so every project touched inside the block
+    gets the same `updated_at` (and `archived_at`, `deleted_at`, ...) value.
+    Nested blocks keep the outer timestamp.
+
+    Yields:
+        The frozen timestamp.
+    """
+    now = _batch_now.get()
+    if now is not None:
+        yield now
+        return
+
+    token = _batch_now.set(datetime.utcnow())
+    try:
+        yield _batch_now.get()
+    finally:
+        _batch_now.reset(token)
+
+
+# VARIANT columns of `Project`. They are mapped as one deferred group (see
+# `Project.__mapper_args__`) so list queries only fetch the scalar columns;
+# the group is loaded on first access or up front via `Project.with_details()`.
+_config_column = Column("config", VariantType)
+_stats_column = Column("stats", VariantType)
+_tags_column = Column("tags", VariantType)
+_custom_metadata_column = Column("custom_metadata", VariantType)
+
+
 class Project(SQLModel, table=True):
     """
     The main `Project` model.
@@ -184,12 +273,25 @@ class Project(SQLModel, table=True):
     """
 
     __tablename__ = "projects"
-    __table_args__ = {'extend_existing': True}
+    # Snowflake has no secondary indexes on standard tables, so the table is
+    # clustered on the dashboard filter keys (existing tables opt in with
+    # scripts/migrate_projects_cluster_key.py); other dialects get
+    # `PROJECT_INDEXES` instead (created by `DatabaseConnection.init_db`).
+    __table_args__ = {'extend_existing': True, 'snowflake_clusterby': ["owner_id", "status"]}
+    __mapper_args__ = {
+        "properties": {
+            "config": deferred(_config_column, group="details"),
+            "stats": deferred(_stats_column, group="details"),
+            "tags": deferred(_tags_column, group="details"),
+            "custom_metadata": deferred(_custom_metadata_column, group="details"),
+        }
+    }
 
     # Primary key
     project_id: UUID = Field(
         default_factory=uuid4,
         primary_key=True,
+        sa_type=UUIDType,
         description="The unique identifier for the project."
     )
 
@@ -228,41 +330,41 @@ class Project(SQLModel, table=True):
     # Configuration (simplified for Snowflake compatibility)
     # Store as Dict instead of ProjectConfig to avoid VARIANT serialization issues
     config: Dict[str, Any] = Field(
-        sa_column=Column(VariantType),
-        default_factory=dict,
+        sa_column=_config_column,
+        default_factory=_default_config,
         description="The project-level configuration settings (JSON)."
     )
 
     # Statistics (simplified for Snowflake compatibility)
     # Store as Dict instead of ProjectStats to avoid VARIANT serialization issues
     stats: Dict[str, Any] = Field(
-        sa_column=Column(VariantType),
-        default_factory=dict,
+        sa_column=_stats_column,
+        default_factory=_default_stats,
         description="The project's statistics (nodes, edges, documents, etc.) (JSON)."
     )
 
     # Tags and categorization
     tags: List[str] = Field(
-        sa_column=Column(VariantType),
+        sa_column=_tags_column,
         default_factory=list,
         description="A list of user-defined tags for categorizing the project."
     )
 
     # Custom metadata (renamed to avoid SQLAlchemy reserved word)
     custom_metadata: Dict[str, Any] = Field(
-        sa_column=Column(VariantType),
+        sa_column=_custom_metadata_column,
         default_factory=dict,
         description="A dictionary for any additional project metadata."
     )
 
     # Timestamps
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=_now,
         description="The timestamp of when the project was created."
     )
 
     updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=_now,
         description="The timestamp of when the project was last updated."
     )
 
@@ -282,21 +384,127 @@ class Project(SQLModel, table=True):
     )
 
     # Relationships
+    # Collections are never lazy-loaded: accessing one that was not loaded
+    # up front raises instead of silently issuing a query per project (N+1).
+    # Use `Project.stmt_with(...)` / `Project.query_with_graph()` to load them.
     schemas: List["Schema"] = Relationship(
         back_populates="project",
-        sa_relationship_kwargs={"cascade": "all, delete-orphan"}
+        sa_relationship_kwargs={"cascade": "all, delete-orphan", "lazy": "raise"}
     )
 
     nodes: List["Node"] = Relationship(
         back_populates="project",
-        sa_relationship_kwargs={"cascade": "all, delete-orphan"}
+        sa_relationship_kwargs={"cascade": "all, delete-orphan", "lazy": "raise"}
     )
 
     edges: List["Edge"] = Relationship(
         back_populates="project",
-        sa_relationship_kwargs={"cascade": "all, delete-orphan"}
+        sa_relationship_kwargs={"cascade": "all, delete-orphan", "lazy": "raise"}
     )
 
+    # Query builders
+    @classmethod
+    def stmt_with(cls, *loads: str) -> Select:
+        """
+        Builds a `SELECT` over projects that eagerly loads the given relationships.
+
+        Each named relationship is loaded with `selectinload`, i.e. one extra
+        `SELECT ... WHERE project_id IN (...)` per relationship regardless of
+        how many projects are returned.
+
+        Args:
+            *loads: The relationship names to load (e.g. "schemas", "nodes").
+
+        Returns:
+            A `sqlmodel.select` statement for `Project`.
+        """
+        return select(cls).options(
+            *(selectinload(getattr(cls, name)) for name in loads)
+        )
+
+    @classmethod
+    def query_with_graph(cls) -> Select:
+        """
+        Builds a `SELECT` over projects with their schemas, nodes, and edges.
+
+        Returns:
+            A `sqlmodel.select` statement for `Project`.
+        """
+        return cls.stmt_with("schemas", "nodes", "edges")
+
+    @classmethod
+    def with_details(cls) -> Select:
+        """
+        Builds a `SELECT` over projects that also loads the deferred VARIANT
+        columns (`config`, `stats`, `tags`, `custom_metadata`).
+
+        Use this for detail views; plain `select(Project)` leaves those
+        columns unloaded until first access.
+
+        Returns:
+            A `sqlmodel.select` statement for `Project`.
+        """
+        return select(cls).options(undefer_group("details"))
+
+    # Batch loaders
+    @classmethod
+    def _prefetch(cls, session: Session, projects: List["Project"], model: Any, attr: str) -> None:
+        """
+        Loads `model` rows for all `projects` with a single `IN (...)` query and
+        attaches them to each project's `attr` collection.
+
+        The collections are set as already-loaded state, so the projects are
+        not marked dirty and no lazy load is triggered afterwards.
+        """
+        if not projects:
+            return
+
+        ids = [p.project_id for p in projects]
+        rows = session.exec(select(model).where(model.project_id.in_(ids))).all()
+
+        by_project: Dict[UUID, List[Any]] = defaultdict(list)
+        for row in rows:
+            by_project[row.project_id].append(row)
+
+        for project in projects:
+            set_committed_value(project, attr, by_project[project.project_id])
+
+    @classmethod
+    def prefetch_schemas(cls, session: Session, projects: List["Project"]) -> None:
+        """
+        Loads the schemas of several projects with one query.
+
+        Args:
+            session: The database session the projects belong to.
+            projects: The projects whose `schemas` collection should be filled.
+        """
+        from .schema import Schema
+        cls._prefetch(session, projects, Schema, "schemas")
+
+    @classmethod
+    def prefetch_nodes(cls, session: Session, projects: List["Project"]) -> None:
+        """
+        Loads the nodes of several projects with one query.
+
+        Args:
+            session: The database session the projects belong to.
+            projects: The projects whose `nodes` collection should be filled.
+        """
+        from .node import Node
+        cls._prefetch(session, projects, Node, "nodes")
+
+    @classmethod
+    def prefetch_edges(cls, session: Session, projects: List["Project"]) -> None:
+        """
+        Loads the edges of several projects with one query.
+
+        Args:
+            session: The database session the projects belong to.
+            projects: The projects whose `edges` collection should be filled.
+        """
+        from .edge import Edge
+        cls._prefetch(session, projects, Edge, "edges")
+
     # Validation
     @field_validator('project_name')
     @classmethod
@@ -307,7 +515,7 @@ class Project(SQLModel, table=True):
 
         # Project name should be lowercase, alphanumeric with hyphens/underscores
         v = v.strip().lower()
-        if not v.replace('-', '').replace('_', '').isalnum():
+        if not v.translate(_NAME_SEPARATORS).isalnum():
             raise ValueError(
                 "project_name must be alphanumeric with hyphens or underscores"
             )
@@ -329,40 +537,44 @@ class Project(SQLModel, table=True):
         return v.strip()
 
     # Helper methods
+    # Enum members are singletons, so the identity check settles the common
+    # case; the value comparison covers statuses assigned as plain strings
+    # (table models are not validated on construction or assignment).
     def is_active(self) -> bool:
         """Checks if the project is active."""
-        return self.status == ProjectStatus.ACTIVE
+        status = self.status
+        return status is _ACTIVE or status == _ACTIVE_VALUE
 
     def is_archived(self) -> bool:
         """Checks if the project is archived."""
-        return self.status == ProjectStatus.ARCHIVED
+        status = self.status
+        return status is _ARCHIVED or status == _ARCHIVED_VALUE
 
     def is_deleted(self) -> bool:
         """Checks if the project is soft-deleted."""
-        return self.status == ProjectStatus.DELETED
+        status = self.status
+        return status is _DELETED or status == _DELETED_VALUE
 
     def archive(self) -> None:
         """Archives the project, setting its status to 'archived'."""
         self.status = ProjectStatus.ARCHIVED
-        self.archived_at = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
+        self.archived_at = self.updated_at = _now()
 
     def soft_delete(self) -> None:
         """Soft-deletes the project, setting its status to 'deleted'."""
         self.status = ProjectStatus.DELETED
-        self.deleted_at = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
+        self.deleted_at = self.updated_at = _now()
 
     def restore(self) -> None:
         """Restores an archived or deleted project to 'active' status."""
         self.status = ProjectStatus.ACTIVE
         self.archived_at = None
         self.deleted_at = None
-        self.updated_at = datetime.utcnow()
+        self.updated_at = _now()
 
     def update_access_time(self) -> None:
         """Updates the last accessed timestamp to the current time."""
-        self.last_accessed_at = datetime.utcnow()
+        self.last_accessed_at = _now()
 
     def update_stats(
         self,
@@ -375,6 +587,9 @@ class Project(SQLModel, table=True):
         """
         Updates the project's statistics.
 
+        `stats` is a deferred column, so calling this on a project loaded
+        without `Project.with_details()` issues a query to load it first.
+
         Args:
             schema_count: The new schema count.
             node_count: The new node count.
@@ -393,8 +608,7 @@ class Project(SQLModel, table=True):
         if total_size_bytes is not None:
             self.stats.total_size_bytes = total_size_bytes
 
-        self.stats.last_updated = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
+        self.stats.last_updated = self.updated_at = _now()
 
     def add_tag(self, tag: str) -> None:
         """
@@ -406,7 +620,7 @@ class Project(SQLModel, table=True):
         tag = tag.strip().lower()
         if tag and tag not in self.tags:
             self.tags.append(tag)
-            self.updated_at = datetime.utcnow()
+            self.updated_at = _now()
 
     def remove_tag(self, tag: str) -> None:
         """
@@ -418,12 +632,15 @@ class Project(SQLModel, table=True):
         tag = tag.strip().lower()
         if tag in self.tags:
             self.tags.remove(tag)
-            self.updated_at = datetime.utcnow()
+            self.updated_at = _now()
 
     def update_config(self, **kwargs) -> None:
         """
         Updates the project's configuration settings.
 
+        `config` is a deferred column, so calling this on a project loaded
+        without `Project.with_details()` issues a query to load it first.
+
         Args:
             **kwargs: The configuration settings to update.
         """
@@ -431,7 +648,7 @@ class Project(SQLModel, table=True):
             if hasattr(self.config, key):
                 setattr(self.config, key, value)
 
-        self.updated_at = datetime.utcnow()
+        self.updated_at = _now()
 
     def get_config_value(self, key: str, default: Any = None) -> Any:
         """
@@ -494,6 +711,99 @@ class ProjectQuery(SQLModel):
         description="The number of results to skip."
     )
 
+    def to_statement(self) -> Select:
+        """
+        Builds the `SELECT` statement for this query.
+
+        The statement shape (which filters are set, the sort column, and the
+        sort order) is compiled once by `_compile_project_query` and reused;
+        only the filter values are bound per call.
+
+        Returns:
+            A `sqlmodel.select` statement for `Project`.
+
+        Raises:
+            ValueError: If `sort_by` is not a `Project` column or `sort_order`
+                is not 'asc' or 'desc'.
+        """
+        mask = 0
+        values: Dict[str, Any] = {}
+        for bit, name in enumerate(_PROJECT_QUERY_FILTERS):
+            value = getattr(self, name)
+            if value is not None:
+                mask |= 1 << bit
+                values[name] = value
+
+        tags = values.pop("tags", None) or []
+        for i, tag in enumerate(tags):
+            values[f"tag_{i}"] = tag
+
+        stmt = _compile_project_query(
+            mask, len(tags), self.sort_by or "created_at", self.sort_order or "desc"
+        )
+        if values:
+            stmt = stmt.params(**values)
+        return stmt.limit(self.limit).offset(self.offset)
+
+
+# Filter fields of `ProjectQuery`, in the bit order used by
+# `_compile_project_query`'s mask.
+_PROJECT_QUERY_FILTERS = (
+    "project_name",
+    "owner_id",
+    "status",
+    "tags",
+    "created_after",
+    "created_before",
+    "accessed_after",
+)
+
+
+@lru_cache(maxsize=64)
+def _compile_project_query(mask: int, tag_count: int, sort_by: str, sort_order: str) -> Select:
+    """
+    Builds a parameterized project `SELECT` for one query shape.
+
+    Args:
+        mask: A bitmask of the `_PROJECT_QUERY_FILTERS` that are set.
+        tag_count: The number of tags to match (all must be present).
+        sort_by: The `Project` column to sort by.
+        sort_order: 'asc' or 'desc'.
+
+    Returns:
+        A statement whose filter values are unbound `bindparam`s named after
+        the `ProjectQuery` fields (`tag_0`, `tag_1`, ... for tags).
+    """
+    column = Project.__table__.columns.get(sort_by)
+    if column is None:
+        raise ValueError(f"Cannot sort projects by '{sort_by}'")
+    if sort_order not in ("asc", "desc"):
+        raise ValueError("sort_order must be 'asc' or 'desc'")
+
+    def has(name: str) -> bool:
+        return bool(mask & (1 << _PROJECT_QUERY_FILTERS.index(name)))
+
+    stmt = select(Project)
+    if has("project_name"):
+        stmt = stmt.where(Project.project_name == bindparam("project_name"))
+    if has("owner_id"):
+        stmt = stmt.where(Project.owner_id == bindparam("owner_id"))
+    if has("status"):
+        stmt = stmt.where(Project.status == bindparam("status"))
+    if has("tags"):
+        for i in range(tag_count):
+            stmt = stmt.where(
+                func.ARRAY_CONTAINS(func.TO_VARIANT(bindparam(f"tag_{i}")), Project.tags)
+            )
+    if has("created_after"):
+        stmt = stmt.where(Project.created_at >= bindparam("created_after"))
+    if has("created_before"):
+        stmt = stmt.where(Project.created_at <= bindparam("created_before"))
+    if has("accessed_after"):
+        stmt = stmt.where(Project.last_accessed_at >= bindparam("accessed_after"))
+
+    return stmt.order_by(column.desc() if sort_order == "desc" else column.asc())
+
 
 # Import for relationships (avoid circular imports)
 from typing import TYPE_CHECKING
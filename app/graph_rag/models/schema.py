@@ -7,13 +7,17 @@ and supports versioning for schema evolution.
 """
 
 from datetime import datetime
+from functools import cached_property
 from typing import Optional, List, Dict, Any
 from uuid import UUID, uuid4
 
-from sqlmodel import Field, SQLModel, Column, ForeignKey, Relationship
+from sqlalchemy import BigInteger, event
+from sqlalchemy.orm import deferred, undefer_group
+from sqlmodel import Field, SQLModel, Column, ForeignKey, Relationship, select
+from sqlmodel.sql.expression import Select
 from pydantic import field_validator
 from typing import TYPE_CHECKING
-from app.graph_rag.db import VariantType
+from app.graph_rag.db import UUIDType, VariantType
 
 if TYPE_CHECKING:
     from .project import Project
@@ -26,6 +30,43 @@ from .types import (
     VectorConfig,
     UnstructuredDataConfig
 )
+from .schema_attribute import SchemaAttribute
+
+
+# Deletion table for the separators allowed in schema names
+_NAME_SEPARATORS = str.maketrans('', '', '_-')
+
+
+def _pack_version(version: str) -> int:
+    """
+    Packs a 'major.minor.patch' version string into a single integer.
+
+    The result is `(major << 32) | (minor << 16) | patch`, so integer order
+    matches semantic version order (unlike string order, where "10.0.0" <
+    "9.0.0").
+
+    Args:
+        version: The semantic version string.
+
+    Returns:
+        The packed version.
+
+    Raises:
+        ValueError: If the version is malformed or minor/patch exceed 65535.
+    """
+    major, minor, patch = (int(p) for p in version.split('.'))
+    if not (0 <= major and 0 <= minor < 1 << 16 and 0 <= patch < 1 << 16):
+        raise ValueError("Version parts must be non-negative, with minor and patch below 65536")
+    return (major << 32) | (minor << 16) | patch
+
+
+# VARIANT columns of `Schema`. They are mapped as one deferred group (see
+# `Schema.__mapper_args__`) so list queries only fetch the scalar columns;
+# the group is loaded on first access or up front via `Schema.with_details()`.
+_structured_attributes_column = Column("structured_attributes", VariantType)
+_unstructured_config_column = Column("unstructured_config", VariantType)
+_vector_config_column = Column("vector_config", VariantType)
+_config_column = Column("config", VariantType)
 
 
 class Schema(SQLModel, table=True):
@@ -40,6 +81,8 @@ class Schema(SQLModel, table=True):
         schema_name: The name of the schema (e.g., 'Person', 'WORKS_AT').
         entity_type: Whether this schema is for a `Node` or an `Edge`.
         version: The semantic version of the schema (e.g., '1.0.0').
+        version_int: The version packed into an integer, so it can be
+            ordered numerically in the database.
         is_active: Whether this version of the schema is active.
         project_id: The ID of the project this schema belongs to.
         description: A human-readable description of the schema.
@@ -54,14 +97,25 @@ class Schema(SQLModel, table=True):
         project: The project this schema belongs to.
         nodes: A list of the nodes that conform to this schema.
         edges: A list of the edges that conform to this schema.
+        attributes: The structured attributes as `schema_attributes` rows
+            (kept in sync by `sync_attributes`).
     """
     __tablename__ = "schemas"
     __table_args__ = {'extend_existing': True}
+    __mapper_args__ = {
+        "properties": {
+            "structured_attributes": deferred(_structured_attributes_column, group="details"),
+            "unstructured_config": deferred(_unstructured_config_column, group="details"),
+            "vector_config": deferred(_vector_config_column, group="details"),
+            "config": deferred(_config_column, group="details"),
+        }
+    }
 
     # Primary Key
     schema_id: UUID = Field(
         default_factory=uuid4,
         primary_key=True,
+        sa_type=UUIDType,
         description="The unique identifier for the schema."
     )
 
@@ -84,6 +138,14 @@ class Schema(SQLModel, table=True):
         description="The semantic version of the schema (e.g., '1.0.0')."
     )
 
+    # No index: Snowflake rejects CREATE INDEX on standard tables. Existing
+    # tables get the column from scripts/migrate_schema_version_int.py
+    version_int: Optional[int] = Field(
+        default=None,
+        sa_type=BigInteger,
+        description="The version packed into an integer for ordering (set on flush)."
+    )
+
     is_active: bool = Field(
         default=True,
         description="Whether this version of the schema is active."
@@ -92,6 +154,7 @@ class Schema(SQLModel, table=True):
     # Project Association
     project_id: UUID = Field(
         foreign_key="projects.project_id",
+        sa_type=UUIDType,
         description="The ID of the project this schema belongs to."
     )
 
@@ -104,28 +167,28 @@ class Schema(SQLModel, table=True):
     # Structured Data Configuration
     structured_attributes: List[AttributeDefinition] = Field(
         default_factory=list,
-        sa_column=Column(VariantType),
+        sa_column=_structured_attributes_column,
         description="A list of definitions for the structured attributes of the entity."
     )
 
     # Unstructured Data Configuration
     unstructured_config: UnstructuredDataConfig = Field(
         default_factory=UnstructuredDataConfig,
-        sa_column=Column(VariantType),
+        sa_column=_unstructured_config_column,
         description="The configuration for handling unstructured data."
     )
 
     # Vector Configuration
     vector_config: VectorConfig = Field(
         default_factory=lambda: VectorConfig(dimension=1536),
-        sa_column=Column(VariantType),
+        sa_column=_vector_config_column,
         description="The configuration for vector embeddings."
     )
 
     # Additional Settings
     config: Dict[str, Any] = Field(
         default_factory=dict,
-        sa_column=Column(VariantType),
+        sa_column=_config_column,
         description="A dictionary for any additional schema-specific configuration."
     )
 
@@ -147,9 +210,28 @@ class Schema(SQLModel, table=True):
     )
 
     # Relationships
-    project: Optional["Project"] = Relationship(back_populates="schemas")
+    project: Optional["Project"] = Relationship(
+        back_populates="schemas",
+        sa_relationship_kwargs={"lazy": "joined"}
+    )
     nodes: List["Node"] = Relationship(back_populates="schema")
     edges: List["Edge"] = Relationship(back_populates="schema")
+    attributes: List[SchemaAttribute] = Relationship(
+        back_populates="schema",
+        sa_relationship_kwargs={"cascade": "all, delete-orphan"}
+    )
+
+    @classmethod
+    def with_details(cls) -> Select:
+        """
+        Builds a `SELECT` over schemas that also loads the deferred VARIANT
+        columns (`structured_attributes`, `unstructured_config`,
+        `vector_config`, `config`).
+
+        Returns:
+            A `sqlmodel.select` statement for `Schema`.
+        """
+        return select(cls).options(undefer_group("details"))
 
     @field_validator('schema_name', mode='after')
     @classmethod
@@ -160,7 +242,7 @@ class Schema(SQLModel, table=True):
 
         # Basic naming convention: alphanumeric + underscore + hyphens
         stripped = v.strip()
-        if not stripped.replace('_', '').replace('-', '').isalnum():
+        if not stripped.translate(_NAME_SEPARATORS).isalnum():
             raise ValueError("Schema name must be alphanumeric (underscores/hyphens allowed)")
 
         return stripped
@@ -184,6 +266,20 @@ class Schema(SQLModel, table=True):
         """Returns a string representation of the schema."""
         return f"<Schema(name='{self.schema_name}', type={self.entity_type}, v={self.version})>"
 
+    def check_version(self) -> None:
+        """
+        Checks that `version` can be packed into `version_int`.
+
+        Field validators do not run on table models, so services call this
+        before flushing; otherwise a bad version only surfaces as a
+        `ValueError` from the flush listener, in the middle of the flush.
+
+        Raises:
+            ValueError: If the version is malformed or minor/patch exceed
+                65535 (see `_pack_version`).
+        """
+        _pack_version(self.version)
+
     def get_attribute_names(self) -> List[str]:
         """
         Gets a list of the structured attribute names for the schema.
@@ -203,10 +299,46 @@ class Schema(SQLModel, table=True):
         Returns:
             The `AttributeDefinition` for the attribute, or `None` if not found.
         """
+        return self._attribute_index().get(name)
+
+    def _attribute_index(self) -> Dict[str, AttributeDefinition]:
+        """
+        Gets a name -> definition index over `structured_attributes`.
+
+        The index is built on first use and rebuilt whenever the attribute
+        list's contents change, including in-place replacement of an element.
+        It is kept outside the model's fields, so it is never persisted or
+        serialized.
+
+        Returns:
+            A dictionary mapping attribute names to their definitions.
+        """
+        # A snapshot of the elements (compared by identity first) detects
+        # appends, removals and in-place replacements alike
+        snapshot = tuple(self.structured_attributes)
+        cached = self.__dict__.get("_attr_index")
+        if cached is None or cached[0] != snapshot:
+            # Reversed so the first definition wins for duplicate names,
+            # matching a front-to-back scan.
+            index = {attr.name: attr for attr in reversed(snapshot)}
+            cached = (snapshot, index)
+            object.__setattr__(self, "_attr_index", cached)
+        return cached[1]
+
+    def sync_attributes(self) -> None:
+        """
+        Rebuilds the `attributes` rows from `structured_attributes`.
+
+        Call this after creating a schema or replacing its structured
+        attributes; rows for removed attributes are deleted on flush. Names
+        are unique per schema, so for duplicate names only the first
+        definition gets a row (matching `get_attribute`).
+        """
+        rows: Dict[str, SchemaAttribute] = {}
         for attr in self.structured_attributes:
-            if attr.name == name:
-                return attr
-        return None
+            row = SchemaAttribute.from_definition(self.schema_id, attr)
+            rows.setdefault(row.name, row)
+        self.attributes = list(rows.values())
 
     def is_compatible_with(self, other: "Schema") -> bool:
         """
@@ -232,9 +364,8 @@ class Schema(SQLModel, table=True):
             attr.name for attr in other.structured_attributes
             if attr.required
         }
-        self_attrs = set(self.get_attribute_names())
 
-        return other_required.issubset(self_attrs)
+        return other_required.issubset(self._attribute_index().keys())
 
 
 class SchemaVersion(SQLModel):
@@ -249,6 +380,16 @@ class SchemaVersion(SQLModel):
     is_active: bool
     created_at: datetime
 
+    @cached_property
+    def version_int(self) -> int:
+        """
+        Gets the version packed into a single integer for comparison.
+
+        Returns:
+            The packed version (see `_pack_version`).
+        """
+        return _pack_version(self.version)
+
     @property
     def version_tuple(self) -> tuple[int, int, int]:
         """
@@ -269,4 +410,11 @@ class SchemaVersion(SQLModel):
         Returns:
             `True` if this schema version is newer, `False` otherwise.
         """
-        return self.version_tuple > other.version_tuple
\ No newline at end of file
+        return self.version_int > other.version_int
+
+
+@event.listens_for(Schema, "before_insert")
+@event.listens_for(Schema, "before_update")
+def _set_version_int(mapper, connection, target: Schema) -> None:
+    """Keeps `Schema.version_int` in sync with `Schema.version` on flush."""
+    target.version_int = _pack_version(target.version)
\ No newline at end of file
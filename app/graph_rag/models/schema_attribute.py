@@ -0,0 +1,106 @@
+"""
+This module defines the `SchemaAttribute` model for the Agentic Graph RAG
+system.
+
+A `SchemaAttribute` is one row per structured attribute of a `Schema`. It
+mirrors the entries of `Schema.structured_attributes` (a VARIANT list) in a
+relational child table, so questions like "which schemas require attribute X"
+can be answered with a plain filter instead of parsing every schema's JSON.
+"""
+
+from typing import Any, Optional
+from uuid import UUID
+
+from sqlmodel import Column, Field, Relationship, SQLModel
+from typing import TYPE_CHECKING
+from app.graph_rag.db import UUIDType, VariantType
+
+if TYPE_CHECKING:
+    from .schema import Schema
+
+
+class SchemaAttribute(SQLModel, table=True):
+    """
+    A structured attribute definition of a schema, stored as its own row.
+
+    Attributes:
+        schema_id: The ID of the schema the attribute belongs to.
+        name: The attribute name (unique within a schema).
+        data_type: The attribute's data type (see `AttributeDataType`).
+        required: Whether the attribute is required.
+        default_value: The default value, if any.
+        description: A human-readable description of the attribute.
+        schema: The schema the attribute belongs to.
+    """
+    __tablename__ = "schema_attributes"
+    __table_args__ = {'extend_existing': True}
+
+    schema_id: UUID = Field(
+        foreign_key="schemas.schema_id",
+        primary_key=True,
+        sa_type=UUIDType,
+        description="The ID of the schema the attribute belongs to."
+    )
+
+    name: str = Field(
+        primary_key=True,
+        max_length=255,
+        description="The attribute name (unique within a schema)."
+    )
+
+    data_type: str = Field(
+        max_length=20,
+        description="The attribute's data type (see `AttributeDataType`)."
+    )
+
+    required: bool = Field(
+        default=False,
+        description="Whether the attribute is required."
+    )
+
+    default_value: Optional[Any] = Field(
+        default=None,
+        sa_column=Column("default_value", VariantType),
+        description="The default value, if any."
+    )
+
+    description: Optional[str] = Field(
+        default=None,
+        description="A human-readable description of the attribute."
+    )
+
+    # Relationships
+    schema: Optional["Schema"] = Relationship(back_populates="attributes")
+
+    @classmethod
+    def from_definition(cls, schema_id: UUID, definition: Any) -> "SchemaAttribute":
+        """
+        Builds a row from an entry of `Schema.structured_attributes`.
+
+        Args:
+            schema_id: The ID of the schema the attribute belongs to.
+            definition: An `AttributeDefinition` or its dictionary form (as
+                stored in the VARIANT column).
+
+        Returns:
+            The `SchemaAttribute` row.
+        """
+        if hasattr(definition, 'model_dump'):
+            definition = definition.model_dump()
+
+        data_type = definition.get("data_type")
+        return cls(
+            schema_id=schema_id,
+            name=definition["name"],
+            data_type=getattr(data_type, "value", data_type),
+            required=bool(definition.get("required", False)),
+            default_value=definition.get("default"),
+            description=definition.get("description"),
+        )
+
+    def __repr__(self) -> str:
+        """Returns a string representation of the schema attribute."""
+        return (
+            f"<SchemaAttribute(schema={self.schema_id}, name='{self.name}', "
+            f"type={self.data_type}, required={self.required})>"
+        )
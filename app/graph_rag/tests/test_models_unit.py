@@ -6,9 +6,19 @@ validation, and helper methods.
 """
 
 import pytest
+from contextlib import contextmanager
 from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 from uuid import uuid4
 
+from app.graph_rag.models.project import (
+    Project,
+    ProjectQuery,
+    _compile_project_query,
+    project_batch_clock,
+)
+from app.superscan.project_service import ProjectService
 from app.graph_rag.models.schema import Schema
 from app.graph_rag.models.types import EntityType, AttributeDefinition, VectorConfig, UnstructuredDataConfig
 
@@ -241,5 +251,91 @@ class TestUnstructuredDataConfig:
         assert config.chunk_overlap >= 0
 
 
+
+class TestProjectBatchClock:
+    """Test the shared timestamp of project_batch_clock."""
+    
+    def test_mutations_share_timestamp(self):
+        """Test that mutations inside a batch use one timestamp."""
+        projects = [Project(project_name=f"proj-{i}", owner_id="owner") for i in range(3)]
+        
+        with project_batch_clock() as now:
+            projects[0].archive()
+            projects[1].soft_delete()
+            projects[2].add_tag("bulk")
+        
+        assert projects[0].archived_at == now
+        assert projects[1].deleted_at == now
+        assert all(p.updated_at == now for p in projects)
+    
+    def test_clock_released_after_batch(self):
+        """Test that the clock is live again outside a batch."""
+        with project_batch_clock() as now:
+            pass
+        
+        project = Project(project_name="proj", owner_id="owner")
+        project.archive()
+        assert project.archived_at >= now
+
+
+class TestProjectQueryStatement:
+    """Test the cached ProjectQuery statements used by ProjectService."""
+    
+    def _service(self):
+        """Builds a ProjectService on a mocked session that records statements."""
+        session = MagicMock()
+        session.exec.return_value.one.return_value = 0
+        session.exec.return_value.all.return_value = []
+        
+        @contextmanager
+        def get_session():
+            yield session
+        
+        return ProjectService(SimpleNamespace(get_session=get_session)), session
+    
+    def test_list_projects_binds_per_call_values(self):
+        """Test that one cached template serves calls with different values."""
+        service, session = self._service()
+        _compile_project_query.cache_clear()
+        
+        service.list_projects(owner_id="alice", limit=5)
+        service.list_projects(owner_id="bob", offset=10)
+        
+        # Each call runs a count and the page query
+        count_a, page_a, count_b, page_b = [c.args[0].compile().params for c in session.exec.call_args_list]
+        assert count_a == {"owner_id": "alice"}
+        assert count_b == {"owner_id": "bob"}
+        assert list(page_a.values()) == ["alice", 5, 0]
+        assert list(page_b.values()) == ["bob", 20, 10]
+        
+        info = _compile_project_query.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+    
+    def test_list_projects_with_schemas_uses_one_child_query(self):
+        """Test that schemas for a whole page are loaded with a single query."""
+        service, session = self._service()
+        projects = [Project(project_name=f"p{i}", owner_id="alice") for i in range(3)]
+        schemas = [
+            Schema(schema_name=f"S{i}", entity_type=EntityType.NODE, project_id=p.project_id)
+            for i, p in enumerate(projects)
+        ]
+        session.exec.return_value.one.return_value = len(projects)
+        session.exec.return_value.all.side_effect = [projects, schemas]
+        
+        result = service.list_projects(owner_id="alice", include_schemas=True)
+        
+        # Count, page and one IN (...) query for the schemas of all projects
+        assert session.exec.call_count == 3
+        assert [[s["schema_name"] for s in item["schemas"]] for item in result["items"]] == [
+            ["S0"], ["S1"], ["S2"],
+        ]
+    
+    def test_unfiltered_query_has_no_owner_filter(self):
+        """Test that omitting the owner leaves the filter out of the statement."""
+        stmt = ProjectQuery().to_statement()
+        assert "owner_id =" not in str(stmt)
+        assert "owner_id =" in str(ProjectQuery(owner_id="alice").to_statement())
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
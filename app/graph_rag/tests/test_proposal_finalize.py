@@ -0,0 +1,82 @@
+"""
+Tests for finalizing ontology proposals into schemas.
+
+These tests validate:
+- Every finalized schema gets one SchemaAttribute row per attribute
+- Duplicate attribute names produce a single row (the first definition)
+"""
+
+from contextlib import contextmanager
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from app.graph_rag.models.schema import Schema
+from app.graph_rag.models.types import EntityType
+from app.superscan.proposal_service import ProposalService
+
+
+class TestFinalizeProposal:
+    """Test ProposalService.finalize_proposal against a mocked session."""
+
+    def _finalize(self, nodes, edges=()):
+        """Finalizes a proposal and returns the schemas handed to the session."""
+        session = MagicMock()
+        session.get.return_value = SimpleNamespace(
+            project_id=uuid4(), nodes=list(nodes), edges=list(edges), status="ready"
+        )
+
+        @contextmanager
+        def get_session():
+            yield session
+
+        db = SimpleNamespace(get_session=get_session)
+        ProposalService(db).finalize_proposal(uuid4())
+
+        session.commit.assert_called_once()
+        (schemas,), _ = session.add_all.call_args
+        return schemas
+
+    def test_finalize_creates_attribute_rows(self):
+        """Test that each finalized schema carries its attribute rows."""
+        schemas = self._finalize(
+            nodes=[{
+                "schema_name": "Person",
+                "structured_attributes": [
+                    {"name": "name", "data_type": "string", "required": True},
+                    {"name": "age", "data_type": "integer"},
+                ],
+            }],
+            edges=[{
+                "schema_name": "WORKS_AT",
+                "structured_attributes": [{"name": "since", "data_type": "integer"}],
+            }],
+        )
+
+        person, works_at = schemas
+        assert isinstance(person, Schema)
+        assert person.entity_type == EntityType.NODE
+        assert works_at.entity_type == EntityType.EDGE
+
+        assert [(a.name, a.data_type, a.required) for a in person.attributes] == [
+            ("name", "string", True),
+            ("age", "integer", False),
+        ]
+        assert all(a.schema_id == person.schema_id for a in person.attributes)
+        assert [a.name for a in works_at.attributes] == ["since"]
+
+    def test_finalize_dedupes_attribute_names(self):
+        """Test that duplicate attribute names yield one row, keeping the first."""
+        (schema,) = self._finalize(
+            nodes=[{
+                "schema_name": "Company",
+                "structured_attributes": [
+                    {"name": "name", "data_type": "string", "required": True},
+                    {"name": "name", "data_type": "text"},
+                ],
+            }],
+        )
+
+        assert [(a.name, a.data_type, a.required) for a in schema.attributes] == [
+            ("name", "string", True),
+        ]
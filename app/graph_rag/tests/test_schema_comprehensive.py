@@ -11,10 +11,14 @@ These tests validate:
 """
 
 import pytest
+from contextlib import contextmanager
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 from uuid import uuid4
 from datetime import datetime
 
 from app.graph_rag.models.schema import Schema, SchemaVersion
+from app.superscan.schema_service import SchemaService
 from app.graph_rag.models.types import (
     EntityType,
     AttributeDefinition,
@@ -496,6 +500,53 @@ class TestSchemaAttributeMethods:
         assert age_attr.name == "age"
         assert age_attr.data_type == AttributeDataType.INTEGER
 
+    def test_get_attribute_after_attributes_change(self):
+        """Test that attribute lookups see appended and replaced attributes."""
+        schema = Schema(
+            schema_name="Person",
+            entity_type=EntityType.NODE,
+            project_id=uuid4(),
+            structured_attributes=[
+                AttributeDefinition(name="name", data_type=AttributeDataType.STRING)
+            ]
+        )
+        assert schema.get_attribute("age") is None
+
+        schema.structured_attributes.append(
+            AttributeDefinition(name="age", data_type=AttributeDataType.INTEGER)
+        )
+        assert schema.get_attribute("age") is not None
+
+        schema.structured_attributes = [
+            AttributeDefinition(name="email", data_type=AttributeDataType.STRING)
+        ]
+        assert schema.get_attribute("name") is None
+        assert schema.get_attribute("email") is not None
+
+    def test_get_attribute_after_in_place_replace(self):
+        """Test that attribute lookups see an element replaced in place."""
+        schema = Schema(
+            schema_name="Person",
+            entity_type=EntityType.NODE,
+            project_id=uuid4(),
+            structured_attributes=[
+                AttributeDefinition(name="name", data_type=AttributeDataType.STRING),
+                AttributeDefinition(name="age", data_type=AttributeDataType.INTEGER)
+            ]
+        )
+        assert schema.get_attribute("age") is not None
+
+        email = AttributeDefinition(name="email", data_type=AttributeDataType.STRING)
+        schema.structured_attributes[1] = email
+        assert schema.get_attribute("age") is None
+        assert schema.get_attribute("email") is email
+
+        required_name = AttributeDefinition(
+            name="name", data_type=AttributeDataType.STRING, required=True
+        )
+        schema.structured_attributes[0] = required_name
+        assert schema.get_attribute("name") is required_name
+
 
 class TestSchemaCompatibility:
     """Test schema compatibility checking."""
@@ -679,5 +730,57 @@ class TestAttributeDefinitionEdgeCases:
         assert attr.default == "active"
 
 
+class TestSchemaVersionComparison:
+    """Test SchemaVersion ordering."""
+
+    def _version(self, version):
+        return SchemaVersion(
+            schema_id=uuid4(),
+            schema_name="Person",
+            version=version,
+            is_active=True,
+            created_at=datetime.utcnow()
+        )
+
+    def test_is_newer_than_numeric_order(self):
+        """Test that versions compare numerically, not lexically."""
+        assert self._version("10.0.0").is_newer_than(self._version("9.9.9"))
+        assert self._version("1.10.0").is_newer_than(self._version("1.9.0"))
+        assert not self._version("1.0.0").is_newer_than(self._version("1.0.0"))
+
+    def test_version_int_matches_tuple_order(self):
+        """Test that the packed version orders like the version tuple."""
+        versions = ["0.0.1", "1.2.3", "1.10.0", "2.0.0", "10.0.0"]
+        packed = [self._version(v).version_int for v in versions]
+        assert packed == sorted(packed)
+
+    def test_out_of_range_version_is_caught_before_flush(self):
+        """Test that the packing range is checked by check_version, not on construction."""
+        # Field validators do not run on table models, so this constructs
+        schema = Schema(
+            schema_name="Test",
+            entity_type=EntityType.NODE,
+            project_id=uuid4(),
+            version="1.70000.0"
+        )
+        with pytest.raises(ValueError, match="below 65536"):
+            schema.check_version()
+
+        session = MagicMock()
+
+        @contextmanager
+        def get_session():
+            yield session
+
+        service = SchemaService(SimpleNamespace(get_session=get_session))
+        with pytest.raises(ValueError, match="below 65536"):
+            service.create_schema(uuid4(), {
+                "schema_name": "Test",
+                "entity_type": EntityType.NODE,
+                "version": "1.0.70000",
+            })
+        session.add.assert_not_called()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -68,6 +68,16 @@ class TestStructuredDataValidator:
         assert is_valid is False
         assert "cannot be both required and have a default" in error
     
+    def test_validate_schema_definition_invalid_pattern(self):
+        """Test schema with a pattern that does not compile."""
+        schema_def = {
+            "code": {"type": "string", "pattern": "[a-z"}
+        }
+        
+        is_valid, error = StructuredDataValidator.validate_schema_definition(schema_def)
+        assert is_valid is False
+        assert "Invalid 'pattern'" in error
+    
     def test_validate_structured_data_valid(self):
         """Test validating valid structured data."""
         schema_def = {
@@ -254,6 +264,78 @@ class TestStructuredDataValidator:
         assert is_valid is False
         assert "cannot be null" in error
 
+    
+    def test_compile_reusable_validator(self):
+        """Test validating several records with a compiled schema."""
+        schema_def = {
+            "name": {"type": "string", "required": True},
+            "age": {"type": "integer", "min": 0}
+        }
+        validate = StructuredDataValidator.compile(schema_def)
+        
+        is_valid, error, coerced = validate({"name": "Alice", "age": "30"})
+        assert is_valid is True
+        assert coerced == {"name": "Alice", "age": 30}
+        
+        is_valid, error, coerced = validate({"name": "Bob", "age": -1})
+        assert is_valid is False
+        assert "less than min" in error
+    
+    def test_validate_many_reports_first_invalid_record(self):
+        """Test batch validation reports the first failing record."""
+        schema_def = {
+            "name": {"type": "string", "required": True},
+            "age": {"type": "integer", "max": 120}
+        }
+        records = [{"name": f"user-{i}", "age": "30"} for i in range(40)]
+        
+        is_valid, error, coerced = StructuredDataValidator.validate_many(records, schema_def)
+        assert is_valid is True
+        assert coerced[0] == {"name": "user-0", "age": 30}
+        
+        records[25]["age"] = 150
+        is_valid, error, coerced = StructuredDataValidator.validate_many(records, schema_def)
+        assert is_valid is False
+        assert error.startswith("Record 25:")
+        assert "greater than max" in error
+    
+    def test_compile_invalid_schema(self):
+        """Test compiling an invalid schema raises."""
+        with pytest.raises(SchemaValidationError):
+            StructuredDataValidator.compile({"name": {"required": True}})
+        
+        with pytest.raises(SchemaValidationError):
+            StructuredDataValidator.compile({"code": {"type": "string", "pattern": "[a-z"}})
+    
+    def test_compile_leaves_schema_unchanged(self):
+        """Test compiled patterns and enums are not written into the schema."""
+        schema_def = {
+            "code": {"type": "string", "pattern": r"^[A-Z]{3}$", "enum": ["ABC", "XYZ"]}
+        }
+        snapshot = {name: dict(config) for name, config in schema_def.items()}
+        
+        validate = StructuredDataValidator.compile(schema_def)
+        assert validate({"code": "ABC"})[0] is True
+        assert validate({"code": "abc"})[0] is False
+        assert schema_def == snapshot
+
+    def test_revalidate_after_schema_changed_in_place(self):
+        """Test a schema mutated after use is validated against its new content."""
+        schema_def = {"name": {"type": "string", "required": False}}
+
+        assert StructuredDataValidator.validate_structured_data({}, schema_def)[0] is True
+        assert StructuredDataValidator.validate_schema_definition(schema_def)[0] is True
+
+        schema_def["name"]["required"] = True
+        is_valid, error, _ = StructuredDataValidator.validate_structured_data({}, schema_def)
+        assert is_valid is False
+        assert "Missing required attribute" in error
+
+        schema_def["kind"] = {"type": "bogus"}
+        is_valid, error = StructuredDataValidator.validate_schema_definition(schema_def)
+        assert is_valid is False
+        assert StructuredDataValidator.validate_structured_data({"name": "x"}, schema_def)[0] is False
+
 
 class TestUnstructuredDataValidator:
     """Test UnstructuredDataValidator."""
@@ -303,6 +385,19 @@ class TestUnstructuredDataValidator:
         is_valid, error = UnstructuredDataValidator.validate_blob_format(blob)
         assert is_valid is True
     
+    def test_validate_blob_format_memoize(self):
+        """Test memoized validation of the same blob."""
+        blob = {"blob_id": "bio", "content": "Alice is a software engineer..."}
+        
+        assert UnstructuredDataValidator.validate_blob_format(blob, memoize=True) == (True, None)
+        assert UnstructuredDataValidator.validate_blob_format(blob, memoize=True) == (True, None)
+        
+        # Invalid blobs are not memoized
+        invalid = {"blob_id": "bio"}
+        assert UnstructuredDataValidator.validate_blob_format(invalid, memoize=True)[0] is False
+        invalid["content"] = "text"
+        assert UnstructuredDataValidator.validate_blob_format(invalid, memoize=True)[0] is True
+    
     def test_validate_chunk_format_valid(self):
         """Test validating valid chunk."""
         chunk = {
@@ -405,6 +500,25 @@ class TestVectorValidator:
         assert is_valid is False
         assert "must be numeric" in error
     
+    def test_validate_vector_long_non_numeric_element(self):
+        """Test a long vector reports the offending element."""
+        vector = [0.1] * 1535 + ["x"]
+        
+        is_valid, error = VectorValidator.validate_vector(vector)
+        assert is_valid is False
+        assert "Vector element 1535 must be numeric" in error
+    
+    def test_validate_vector_numpy_array(self):
+        """Test validating a NumPy vector."""
+        np = pytest.importorskip("numpy")
+        
+        is_valid, error = VectorValidator.validate_vector(np.zeros(1536), expected_dimension=1536)
+        assert is_valid is True
+        
+        is_valid, error = VectorValidator.validate_vector(np.array(["a", "b"]))
+        assert is_valid is False
+        assert "must be numeric" in error
+    
     def test_validate_vector_dimension_match(self):
         """Test vector dimension matches expected."""
         vector = [0.1] * 1536
@@ -6,11 +6,20 @@ in the knowledge graph, including schemas, structured and unstructured data,
 and vector embeddings.
 """
 
+import json
+import re
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Set, Tuple, Union
 
 from pydantic import ValidationError
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
 
 class SchemaValidationError(Exception):
     """
@@ -19,6 +28,179 @@ class SchemaValidationError(Exception):
     pass
 
 
+# Coercion attempted for each declared type when `coerce_types` is set
+_COERCERS: Mapping[str, Callable[[Any], Any]] = MappingProxyType({
+    "string": str,
+    "str": str,
+    "integer": int,
+    "int": int,
+    "float": float,
+    "number": float,
+    "boolean": bool,
+    "bool": bool,
+})
+
+# Declared types each constraint applies to
+_NUMERIC_TYPES = frozenset({"integer", "int", "float", "number"})
+_LENGTH_TYPES = frozenset({"string", "str", "list", "array"})
+_STRING_TYPES = frozenset({"string", "str"})
+
+
+@lru_cache(maxsize=1024)
+def _compile_pattern(pattern: str) -> "re.Pattern[str]":
+    """Compiles a schema `pattern`, reusing the compiled form across calls."""
+    return re.compile(pattern)
+
+
+# Element types accepted in a vector embedding
+_VECTOR_NUMERIC_TYPES = (int, float) if np is None else (int, float, np.number, np.bool_)
+
+# Precisions accepted in a vector configuration
+_VECTOR_PRECISIONS = ("float32", "float64", "float16")
+
+# `validate_vector_config` results by config contents
+_VECTOR_CONFIG_RESULTS: Dict[Tuple[Any, ...], Tuple[bool, Optional[str]]] = {}
+_VECTOR_CONFIG_RESULTS_MAX = 256
+
+# Vectors at least this long are type-checked with a single NumPy conversion
+_NUMPY_MIN_VECTOR_LENGTH = 64
+
+
+def _is_numeric_array(vector: List[Any]) -> bool:
+    """Returns whether NumPy converts `vector` to a flat numeric array."""
+    try:
+        array = np.asarray(vector)
+    except (ValueError, TypeError):  # ragged/nested input
+        return False
+    return array.ndim == 1 and array.dtype.kind in "biuf"
+
+
+def _build_validator(
+    required: Tuple[str, ...],
+    attributes: Dict[str, Tuple[Any, ...]]
+) -> Callable[..., Tuple[bool, Optional[str], Optional[Dict[str, Any]]]]:
+    """
+    Builds the validator closure for compiled schema attributes.
+
+    `attributes` maps each attribute name to `(type, expected_type,
+    exact_type, coerce, nullable, min, max, min_length, max_length, enum,
+    pattern, pattern_re)`; constraints that are not declared are None.
+    """
+    # Required attributes cannot declare a default (see
+    # `validate_schema_definition`), so presence is a single subset test
+    required_keys = frozenset(required)
+    get_attribute = attributes.get
+
+    def validate(
+        data: Dict[str, Any],
+        coerce_types: bool = True
+    ) -> Tuple[bool, Optional[str], Optional[Dict[str, Any]]]:
+        if not isinstance(data, dict):
+            return False, "Structured data must be a dictionary", None
+
+        # Check required attributes before any per-attribute work
+        if not data.keys() >= required_keys:
+            missing = next(name for name in required if name not in data)
+            return False, f"Missing required attribute: '{missing}'", None
+
+        coerced_data = {}
+
+        # Validate each provided attribute: one lookup per attribute, then the
+        # compiled settings are read from the tuple
+        for attr_name, attr_value in data.items():
+            attribute = get_attribute(attr_name)
+            if attribute is None:
+                # Extra attributes are allowed
+                coerced_data[attr_name] = attr_value
+                continue
+
+            (attr_type, expected_type, exact_type, coerce, nullable, min_value, max_value,
+             min_length, max_length, enum, pattern, pattern_re) = attribute
+
+            # Handle null values
+            if attr_value is None:
+                if nullable:
+                    coerced_data[attr_name] = None
+                    continue
+                return False, f"Attribute '{attr_name}' cannot be null", None
+
+            if attr_type == "any":
+                coerced_data[attr_name] = attr_value
+                continue
+
+            # Type validation and coercion
+            if (
+                expected_type is not None
+                and type(attr_value) is not exact_type
+                and not isinstance(attr_value, expected_type)
+            ):
+                if not coerce_types or coerce is None:
+                    return False, (
+                        f"Attribute '{attr_name}' has invalid type. "
+                        f"Expected {attr_type}, got {type(attr_value).__name__}"
+                    ), None
+                try:
+                    attr_value = coerce(attr_value)
+                except (ValueError, TypeError) as e:
+                    return False, (
+                        f"Cannot coerce attribute '{attr_name}' to {attr_type}: {e}"
+                    ), None
+
+            # Numeric constraints
+            if min_value is not None and attr_value < min_value:
+                return False, (
+                    f"Attribute '{attr_name}' value {attr_value} is less than min {min_value}"
+                ), None
+
+            if max_value is not None and attr_value > max_value:
+                return False, (
+                    f"Attribute '{attr_name}' value {attr_value} is greater than max {max_value}"
+                ), None
+
+            # String/List length constraints
+            if min_length is not None and len(attr_value) < min_length:
+                return False, (
+                    f"Attribute '{attr_name}' length {len(attr_value)} is less than min_length {min_length}"
+                ), None
+
+            if max_length is not None and len(attr_value) > max_length:
+                return False, (
+                    f"Attribute '{attr_name}' length {len(attr_value)} is greater than max_length {max_length}"
+                ), None
+
+            # Enum validation
+            if enum is not None:
+                enum_set, enum_values = enum
+                try:
+                    allowed = attr_value in (enum_values if enum_set is None else enum_set)
+                except TypeError:  # unhashable value
+                    allowed = attr_value in enum_values
+                if not allowed:
+                    return False, (
+                        f"Attribute '{attr_name}' value '{attr_value}' not in allowed values: "
+                        f"{list(enum_values)}"
+                    ), None
+
+            # Pattern validation (for strings)
+            if pattern_re is not None and not pattern_re.match(attr_value):
+                return False, (
+                    f"Attribute '{attr_name}' value '{attr_value}' does not match pattern '{pattern}'"
+                ), None
+
+            coerced_data[attr_name] = attr_value
+
+        return True, None, coerced_data
+
+    return validate
+
+
+# `(validator, error)` by the canonical JSON form of the schema definition;
+# `validator` is None for an invalid schema (see
+# `StructuredDataValidator._compiled`)
+_COMPILED_SCHEMAS: Dict[str, Tuple[Optional[Callable[..., Any]], Optional[str]]] = {}
+_COMPILED_SCHEMAS_MAX = 256
+
+
 class StructuredDataValidator:
     """
     A validator for structured data against a schema definition.
@@ -72,6 +254,14 @@ class StructuredDataValidator:
             A tuple containing a boolean indicating whether the schema is
             valid, and an error message if it is not.
         """
+        return cls._check_schema_definition(schema_definition)
+
+    @classmethod
+    def _check_schema_definition(
+        cls,
+        schema_definition: Dict[str, Any]
+    ) -> Tuple[bool, Optional[str]]:
+        """Checks a schema definition (see `validate_schema_definition`)."""
         if not isinstance(schema_definition, dict):
             return False, "Schema definition must be a dictionary"
 
@@ -111,16 +301,20 @@ class StructuredDataValidator:
 
             # Validate constraints
             if "min" in attr_config or "max" in attr_config:
-                if attr_type not in ["integer", "int", "float", "number"]:
+                if attr_type not in _NUMERIC_TYPES:
                     return False, f"'min'/'max' constraints only apply to numeric types"
 
             if "min_length" in attr_config or "max_length" in attr_config:
-                if attr_type not in ["string", "str", "list", "array"]:
+                if attr_type not in _LENGTH_TYPES:
                     return False, f"'min_length'/'max_length' only apply to string/list types"
 
             if "pattern" in attr_config:
-                if attr_type not in ["string", "str"]:
+                if attr_type not in _STRING_TYPES:
                     return False, f"'pattern' constraint only applies to string types"
+                try:
+                    _compile_pattern(attr_config["pattern"])
+                except (re.error, TypeError) as e:
+                    return False, f"Invalid 'pattern' for '{attr_name}': {e}"
 
             if "enum" in attr_config:
                 if not isinstance(attr_config["enum"], list):
@@ -129,149 +323,204 @@ class StructuredDataValidator:
         return True, None
 
     @classmethod
-    def validate_structured_data(
+    def compile(
         cls,
-        data: Dict[str, Any],
-        schema_definition: Dict[str, Any],
-        coerce_types: bool = True
-    ) -> Tuple[bool, Optional[str], Optional[Dict[str, Any]]]:
+        schema_definition: Dict[str, Any]
+    ) -> Callable[..., Tuple[bool, Optional[str], Optional[Dict[str, Any]]]]:
         """
-        Validates structured data against a schema definition.
+        Compiles a schema definition into a reusable validator.
+
+        The schema is checked and read once: every attribute's type,
+        coercion and constraints are resolved up front, so validating a
+        record no longer interprets the schema dictionary.
 
         Args:
-            data: The structured data to validate.
-            schema_definition: The schema definition to validate against.
-            coerce_types: Whether to attempt to coerce the data to the
-                correct type.
+            schema_definition: The schema definition to compile.
 
         Returns:
-            A tuple containing a boolean indicating whether the data is
-            valid, an error message if it is not, and the coerced data.
+            A function `validate(data, coerce_types=True)` with the same
+            return value as `validate_structured_data`.
+
+        Raises:
+            SchemaValidationError: If the schema definition is invalid.
         """
-        # First validate the schema itself
-        is_valid, error = cls.validate_schema_definition(schema_definition)
+        is_valid, error = cls._check_schema_definition(schema_definition)
         if not is_valid:
-            return False, f"Invalid schema: {error}", None
-
-        if not isinstance(data, dict):
-            return False, "Structured data must be a dictionary", None
+            raise SchemaValidationError(error)
 
-        coerced_data = {}
+        return _build_validator(*cls._compile_attributes(schema_definition))
 
-        # Check required attributes
+    @classmethod
+    def _compile_attributes(
+        cls,
+        schema_definition: Dict[str, Any]
+    ) -> Tuple[Tuple[str, ...], Dict[str, Tuple[Any, ...]]]:
+        """
+        Resolves a (valid) schema definition into the required attribute names
+        and a per-attribute tuple of type, coercion and constraints (see
+        `_build_validator` for the layout).
+        """
+        required = []
+        attributes = {}
         for attr_name, attr_config in schema_definition.items():
-            is_required = attr_config.get("required", False)
+            attr_type = attr_config["type"]
 
-            if is_required and attr_name not in data:
-                # Check for default value
-                if "default" in attr_config:
-                    coerced_data[attr_name] = attr_config["default"]
-                else:
-                    return False, f"Missing required attribute: '{attr_name}'", None
+            if attr_config.get("required", False):
+                required.append(attr_name)
+
+            # Enum membership is a set lookup; the values are kept in order for
+            # unhashable members/values and for error messages
+            enum = attr_config.get("enum")
+            if enum is not None:
+                enum_values = tuple(enum)
+                try:
+                    enum = (frozenset(enum_values), enum_values)
+                except TypeError:  # unhashable members
+                    enum = (None, enum_values)
+
+            pattern = attr_config.get("pattern")
+
+            expected_type = None if attr_type == "any" else cls.TYPE_MAPPING.get(attr_type)
+            # Values of exactly this type pass the type check without an
+            # `isinstance` call (for "number", ints; floats take `isinstance`)
+            exact_type = expected_type[0] if isinstance(expected_type, tuple) else expected_type
+
+            attributes[attr_name] = (
+                attr_type,
+                expected_type,
+                exact_type,
+                _COERCERS.get(attr_type),
+                attr_config.get("nullable", True),
+                attr_config.get("min"),
+                attr_config.get("max"),
+                attr_config.get("min_length"),
+                attr_config.get("max_length"),
+                enum,
+                pattern,
+                _compile_pattern(pattern) if pattern is not None else None,
+            )
 
-        # Validate each provided attribute
-        for attr_name, attr_value in data.items():
-            # Check if attribute is defined in schema
-            if attr_name not in schema_definition:
-                # Decide whether to allow extra attributes (strict mode)
-                # For now, we'll allow them
-                coerced_data[attr_name] = attr_value
-                continue
+        return tuple(required), attributes
 
-            attr_config = schema_definition[attr_name]
-            attr_type = attr_config["type"]
+    @classmethod
+    def _compiled(
+        cls,
+        schema_definition: Dict[str, Any]
+    ) -> Callable[..., Tuple[bool, Optional[str], Optional[Dict[str, Any]]]]:
+        """
+        Returns the compiled validator for a schema definition, compiling it
+        on first use.
 
-            # Handle null values
-            if attr_value is None:
-                if attr_config.get("nullable", True):
-                    coerced_data[attr_name] = None
-                    continue
-                else:
-                    return False, f"Attribute '{attr_name}' cannot be null", None
+        Compiled validators, and the errors of invalid schemas, are memoized
+        by the content of the schema dictionary (its canonical JSON form), so
+        a schema that is changed in place is compiled again. Schemas that
+        cannot be serialized are compiled on every call.
 
-            # Type validation and coercion
-            expected_type = cls.TYPE_MAPPING.get(attr_type)
+        Raises:
+            SchemaValidationError: If the schema definition is invalid.
+        """
+        try:
+            key = json.dumps(schema_definition, sort_keys=True)
+        except (TypeError, ValueError):
+            return cls.compile(schema_definition)
+
+        cached = _COMPILED_SCHEMAS.get(key)
+        if cached is None:
+            try:
+                cached = (cls.compile(schema_definition), None)
+            except SchemaValidationError as e:
+                cached = (None, str(e))
+            if len(_COMPILED_SCHEMAS) >= _COMPILED_SCHEMAS_MAX:
+                del _COMPILED_SCHEMAS[next(iter(_COMPILED_SCHEMAS))]
+            _COMPILED_SCHEMAS[key] = cached
+
+        validate, error = cached
+        if validate is None:
+            raise SchemaValidationError(error)
+        return validate
 
-            if attr_type == "any":
-                coerced_data[attr_name] = attr_value
-                continue
+    @classmethod
+    def validate_many(
+        cls,
+        records: List[Dict[str, Any]],
+        schema_definition: Dict[str, Any],
+        coerce_types: bool = True
+    ) -> Tuple[bool, Optional[str], Optional[List[Dict[str, Any]]]]:
+        """
+        Validates a batch of records against one schema definition.
 
-            if expected_type:
-                if not isinstance(attr_value, expected_type):
-                    if coerce_types:
-                        # Attempt type coercion
-                        try:
-                            if attr_type in ["string", "str"]:
-                                coerced_value = str(attr_value)
-                            elif attr_type in ["integer", "int"]:
-                                coerced_value = int(attr_value)
-                            elif attr_type in ["float", "number"]:
-                                coerced_value = float(attr_value)
-                            elif attr_type in ["boolean", "bool"]:
-                                coerced_value = bool(attr_value)
-                            else:
-                                return False, (
-                                    f"Attribute '{attr_name}' has invalid type. "
-                                    f"Expected {attr_type}, got {type(attr_value).__name__}"
-                                ), None
-
-                            attr_value = coerced_value
-                        except (ValueError, TypeError) as e:
-                            return False, (
-                                f"Cannot coerce attribute '{attr_name}' to {attr_type}: {e}"
-                            ), None
-                    else:
-                        return False, (
-                            f"Attribute '{attr_name}' has invalid type. "
-                            f"Expected {attr_type}, got {type(attr_value).__name__}"
-                        ), None
+        The schema is resolved once for the whole batch and every record is
+        checked by the same compiled validator (see `compile`).
 
-            # Validate constraints
-            # Numeric constraints
-            if "min" in attr_config:
-                if attr_value < attr_config["min"]:
-                    return False, (
-                        f"Attribute '{attr_name}' value {attr_value} is less than min {attr_config['min']}"
-                    ), None
+        Args:
+            records: The structured data records to validate.
+            schema_definition: The schema definition to validate against.
+            coerce_types: Whether to attempt to coerce the data to the
+                correct type.
 
-            if "max" in attr_config:
-                if attr_value > attr_config["max"]:
-                    return False, (
-                        f"Attribute '{attr_name}' value {attr_value} is greater than max {attr_config['max']}"
-                    ), None
+        Returns:
+            A tuple containing a boolean indicating whether all records are
+            valid, an error message for the first invalid record, and the
+            coerced records.
+        """
+        try:
+            validate = cls._compiled(schema_definition)
+        except SchemaValidationError as e:
+            return False, f"Invalid schema: {e}", None
 
-            # String/List length constraints
-            if "min_length" in attr_config:
-                if len(attr_value) < attr_config["min_length"]:
-                    return False, (
-                        f"Attribute '{attr_name}' length {len(attr_value)} is less than min_length {attr_config['min_length']}"
-                    ), None
+        if not isinstance(records, list):
+            return False, "Records must be a list", None
 
-            if "max_length" in attr_config:
-                if len(attr_value) > attr_config["max_length"]:
-                    return False, (
-                        f"Attribute '{attr_name}' length {len(attr_value)} is greater than max_length {attr_config['max_length']}"
-                    ), None
+        coerced_records = []
+        append = coerced_records.append
+        for i, record in enumerate(records):
+            is_valid, error, coerced = validate(record, coerce_types)
+            if not is_valid:
+                return False, f"Record {i}: {error}", None
+            append(coerced)
 
-            # Enum validation
-            if "enum" in attr_config:
-                if attr_value not in attr_config["enum"]:
-                    return False, (
-                        f"Attribute '{attr_name}' value '{attr_value}' not in allowed values: {attr_config['enum']}"
-                    ), None
+        return True, None, coerced_records
 
-            # Pattern validation (for strings)
-            if "pattern" in attr_config:
-                import re
-                pattern = attr_config["pattern"]
-                if not re.match(pattern, attr_value):
-                    return False, (
-                        f"Attribute '{attr_name}' value '{attr_value}' does not match pattern '{pattern}'"
-                    ), None
+    @classmethod
+    def validate_structured_data(
+        cls,
+        data: Dict[str, Any],
+        schema_definition: Dict[str, Any],
+        coerce_types: bool = True
+    ) -> Tuple[bool, Optional[str], Optional[Dict[str, Any]]]:
+        """
+        Validates structured data against a schema definition.
 
-            coerced_data[attr_name] = attr_value
+        The schema is compiled on first use (see `compile`) and the compiled
+        validator is reused for later records against the same schema.
 
-        return True, None, coerced_data
+        Args:
+            data: The structured data to validate.
+            schema_definition: The schema definition to validate against.
+            coerce_types: Whether to attempt to coerce the data to the
+                correct type.
+
+        Returns:
+            A tuple containing a boolean indicating whether the data is
+            valid, an error message if it is not, and the coerced data.
+        """
+        try:
+            validate = cls._compiled(schema_definition)
+        except SchemaValidationError as e:
+            return False, f"Invalid schema: {e}", None
+
+        return validate(data, coerce_types)
+
+# Required blob/chunk fields, in the order missing ones are reported
+_BLOB_REQUIRED_FIELDS = ("blob_id", "content")
+_BLOB_REQUIRED_KEYS = frozenset(_BLOB_REQUIRED_FIELDS)
+_CHUNK_REQUIRED_FIELDS = ("chunk_id", "start_offset", "end_offset", "chunk_size")
+_CHUNK_REQUIRED_KEYS = frozenset(_CHUNK_REQUIRED_FIELDS)
+
+
+# Blobs that passed `validate_blob_format(..., memoize=True)`, by `id()`
+_VALIDATED_BLOBS: Dict[int, Dict[str, Any]] = {}
+_VALIDATED_BLOBS_MAX = 1024
 
 
 class UnstructuredDataValidator:
@@ -280,26 +529,49 @@ class UnstructuredDataValidator:
     """
 
     @staticmethod
-    def validate_blob_format(blob: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+    def validate_blob_format(
+        blob: Dict[str, Any],
+        memoize: bool = False
+    ) -> Tuple[bool, Optional[str]]:
         """
         Validates that a blob has the correct format.
 
         Args:
             blob: The blob to validate.
+            memoize: Whether to remember that this blob object is valid, so
+                validating the same (unmodified) blob again, e.g. in a later
+                pipeline stage, is a lookup. Only use this for blobs that are
+                no longer mutated.
 
         Returns:
             A tuple containing a boolean indicating whether the blob is
             valid, and an error message if it is not.
         """
+        if not memoize:
+            return UnstructuredDataValidator._check_blob_format(blob)
+
+        key = id(blob)
+        # The cache holds the blob itself, so its id cannot be reused
+        if _VALIDATED_BLOBS.get(key) is blob:
+            return True, None
+
+        is_valid, error = UnstructuredDataValidator._check_blob_format(blob)
+        if is_valid:
+            if len(_VALIDATED_BLOBS) >= _VALIDATED_BLOBS_MAX:
+                del _VALIDATED_BLOBS[next(iter(_VALIDATED_BLOBS))]
+            _VALIDATED_BLOBS[key] = blob
+        return is_valid, error
+
+    @staticmethod
+    def _check_blob_format(blob: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+        """Checks a blob's format (uncached; see `validate_blob_format`)."""
         if not isinstance(blob, dict):
             return False, "Blob must be a dictionary"
 
-        # Required fields
-        if "blob_id" not in blob:
-            return False, "Blob must have 'blob_id' field"
-
-        if "content" not in blob:
-            return False, "Blob must have 'content' field"
+        # Required fields: one subset test; the missing field is looked up on failure
+        if not blob.keys() >= _BLOB_REQUIRED_KEYS:
+            missing = next(field for field in _BLOB_REQUIRED_FIELDS if field not in blob)
+            return False, f"Blob must have '{missing}' field"
 
         if not isinstance(blob["blob_id"], str):
             return False, "'blob_id' must be a string"
@@ -341,10 +613,9 @@ class UnstructuredDataValidator:
         if not isinstance(chunk, dict):
             return False, "Chunk must be a dictionary"
 
-        required_fields = ["chunk_id", "start_offset", "end_offset", "chunk_size"]
-        for field in required_fields:
-            if field not in chunk:
-                return False, f"Chunk must have '{field}' field"
+        if not chunk.keys() >= _CHUNK_REQUIRED_KEYS:
+            missing = next(field for field in _CHUNK_REQUIRED_FIELDS if field not in chunk)
+            return False, f"Chunk must have '{missing}' field"
 
         if not isinstance(chunk["chunk_id"], str):
             return False, "'chunk_id' must be a string"
@@ -353,14 +624,15 @@ class UnstructuredDataValidator:
             if not isinstance(chunk[field], int):
                 return False, f"'{field}' must be an integer"
 
-        # Validate offset logic
-        if chunk["end_offset"] <= chunk["start_offset"]:
+        # Validate offset logic: one subtraction serves both checks
+        calculated_size = chunk["end_offset"] - chunk["start_offset"]
+        if calculated_size <= 0:
             return False, "'end_offset' must be greater than 'start_offset'"
 
-        calculated_size = chunk["end_offset"] - chunk["start_offset"]
-        if chunk["chunk_size"] != calculated_size:
+        chunk_size = chunk["chunk_size"]
+        if chunk_size != calculated_size:
             return False, (
-                f"'chunk_size' {chunk['chunk_size']} doesn't match "
+                f"'chunk_size' {chunk_size} doesn't match "
                 f"calculated size {calculated_size} from offsets"
             )
 
@@ -368,13 +640,16 @@ class UnstructuredDataValidator:
 
     @staticmethod
     def validate_unstructured_data(
-        unstructured_data: List[Dict[str, Any]]
+        unstructured_data: List[Dict[str, Any]],
+        memoize: bool = False
     ) -> Tuple[bool, Optional[str]]:
         """
         Validates a list of unstructured blobs.
 
         Args:
             unstructured_data: The list of blobs to validate.
+            memoize: Whether to memoize valid blobs (see
+                `validate_blob_format`).
 
         Returns:
             A tuple containing a boolean indicating whether the data is
@@ -383,9 +658,12 @@ class UnstructuredDataValidator:
         if not isinstance(unstructured_data, list):
             return False, "Unstructured data must be a list"
 
+        # Single pass: format check and duplicate detection share the loop
+        validate_blob_format = UnstructuredDataValidator.validate_blob_format
         blob_ids = set()
+        add_blob_id = blob_ids.add
         for i, blob in enumerate(unstructured_data):
-            is_valid, error = UnstructuredDataValidator.validate_blob_format(blob)
+            is_valid, error = validate_blob_format(blob, memoize)
             if not is_valid:
                 return False, f"Blob {i}: {error}"
 
@@ -393,7 +671,7 @@ class UnstructuredDataValidator:
             blob_id = blob["blob_id"]
             if blob_id in blob_ids:
                 return False, f"Duplicate blob_id: '{blob_id}'"
-            blob_ids.add(blob_id)
+            add_blob_id(blob_id)
 
         return True, None
 
@@ -413,7 +691,8 @@ class VectorValidator:
         Validates a vector embedding.
 
         Args:
-            vector: The vector to validate.
+            vector: The vector to validate, as a list or a one-dimensional
+                NumPy array.
             expected_dimension: The expected dimension of the vector.
             allow_none: Whether `None` is an acceptable value.
 
@@ -427,16 +706,24 @@ class VectorValidator:
             else:
                 return False, "Vector cannot be None"
 
+        # Arrays (e.g. straight from an embedding model) are checked by dtype,
+        # without touching the elements
+        if np is not None and isinstance(vector, np.ndarray):
+            return VectorValidator._validate_array(vector, expected_dimension)
+
         if not isinstance(vector, list):
             return False, f"Vector must be a list, got {type(vector).__name__}"
 
         if len(vector) == 0:
             return False, "Vector cannot be empty"
 
-        # Check all elements are numeric
-        for i, val in enumerate(vector):
-            if not isinstance(val, (int, float)):
-                return False, f"Vector element {i} must be numeric, got {type(val).__name__}"
+        # Check all elements are numeric. Long vectors (embeddings) are checked
+        # in one NumPy conversion; the element scan runs for short vectors, or
+        # to find the offending element when the conversion is not numeric.
+        if np is None or len(vector) < _NUMPY_MIN_VECTOR_LENGTH or not _is_numeric_array(vector):
+            for i, val in enumerate(vector):
+                if not isinstance(val, _VECTOR_NUMERIC_TYPES):
+                    return False, f"Vector element {i} must be numeric, got {type(val).__name__}"
 
         # Check dimension if specified
         if expected_dimension is not None:
@@ -448,6 +735,29 @@ class VectorValidator:
 
         return True, None
 
+    @staticmethod
+    def _validate_array(
+        vector: "np.ndarray",
+        expected_dimension: Optional[int]
+    ) -> Tuple[bool, Optional[str]]:
+        """Validates a NumPy vector (see `validate_vector`)."""
+        if vector.ndim != 1:
+            return False, f"Vector must be one-dimensional, got {vector.ndim} dimensions"
+
+        if vector.shape[0] == 0:
+            return False, "Vector cannot be empty"
+
+        if vector.dtype.kind not in "biuf":
+            return False, f"Vector elements must be numeric, got {vector.dtype}"
+
+        if expected_dimension is not None and vector.shape[0] != expected_dimension:
+            return False, (
+                f"Vector dimension {vector.shape[0]} does not match "
+                f"expected dimension {expected_dimension}"
+            )
+
+        return True, None
+
     @staticmethod
     def validate_vector_config(
         config: Dict[str, Any]
@@ -458,6 +768,9 @@ class VectorValidator:
         Args:
             config: The vector configuration to validate.
 
+        Results are cached by the config's contents, since a run typically
+        validates the same embedding configuration over and over.
+
         Returns:
             A tuple containing a boolean indicating whether the config is
             valid, and an error message if it is not.
@@ -465,6 +778,23 @@ class VectorValidator:
         if not isinstance(config, dict):
             return False, "Vector config must be a dictionary"
 
+        # Value types are part of the key: 1, 1.0 and True compare equal
+        try:
+            key = tuple(sorted((name, type(value), value) for name, value in config.items()))
+            result = _VECTOR_CONFIG_RESULTS.get(key)
+        except TypeError:  # unorderable keys or unhashable values
+            return VectorValidator._check_vector_config(config)
+
+        if result is None:
+            result = VectorValidator._check_vector_config(config)
+            if len(_VECTOR_CONFIG_RESULTS) >= _VECTOR_CONFIG_RESULTS_MAX:
+                del _VECTOR_CONFIG_RESULTS[next(iter(_VECTOR_CONFIG_RESULTS))]
+            _VECTOR_CONFIG_RESULTS[key] = result
+        return result
+
+    @staticmethod
+    def _check_vector_config(config: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+        """Checks a vector configuration (uncached; see `validate_vector_config`)."""
         if "dimension" not in config:
             return False, "Vector config must have 'dimension' field"
 
@@ -476,13 +806,27 @@ class VectorValidator:
             return False, "'model' must be a string"
 
         if "precision" in config:
-            valid_precisions = ["float32", "float64", "float16"]
-            if config["precision"] not in valid_precisions:
-                return False, f"'precision' must be one of {valid_precisions}"
+            if config["precision"] not in _VECTOR_PRECISIONS:
+                return False, f"'precision' must be one of {list(_VECTOR_PRECISIONS)}"
 
         return True, None
 
 
+@lru_cache(maxsize=256)
+def _parse_version(version: str) -> Tuple[int, int, int]:
+    """Parses a `major.minor.patch` string (see `SchemaVersionValidator.parse_version`)."""
+    parts = version.split(".")
+    if len(parts) != 3:
+        raise SchemaValidationError(
+            f"Invalid version format '{version}': Version must be in format major.minor.patch"
+        )
+    try:
+        major, minor, patch = map(int, parts)
+    except ValueError as e:
+        raise SchemaValidationError(f"Invalid version format '{version}': {e}")
+    return major, minor, patch
+
+
 class SchemaVersionValidator:
     """
     A validator for schema version compatibility.
@@ -502,15 +846,12 @@ class SchemaVersionValidator:
         Raises:
             SchemaValidationError: If the version string is invalid.
         """
-        try:
-            parts = version.split(".")
-            if len(parts) != 3:
-                raise ValueError("Version must be in format major.minor.patch")
-
-            major, minor, patch = map(int, parts)
-            return major, minor, patch
-        except Exception as e:
-            raise SchemaValidationError(f"Invalid version format '{version}': {e}")
+        if not isinstance(version, str):
+            raise SchemaValidationError(
+                f"Invalid version format '{version}': expected a string, "
+                f"got {type(version).__name__}"
+            )
+        return _parse_version(version)
 
     @staticmethod
     def is_compatible(
@@ -533,31 +874,23 @@ class SchemaVersionValidator:
         Returns:
             `True` if the versions are compatible, `False` otherwise.
         """
+        # Parsed versions are cached, so repeat checks compare the same tuples
         try:
             curr_major, curr_minor, curr_patch = SchemaVersionValidator.parse_version(current_version)
             tgt_major, tgt_minor, tgt_patch = SchemaVersionValidator.parse_version(target_version)
+        except SchemaValidationError:
+            return False
+
+        # Major version must match
+        if curr_major != tgt_major:
+            return False
+
+        # Minor upgrades are allowed within the same major version; downgrades are not
+        if curr_minor != tgt_minor and (not allow_minor_upgrades or tgt_minor < curr_minor):
+            return False
+
+        # Patch version compatibility
+        if curr_patch != tgt_patch and not allow_patch_upgrades:
+            return False
 
-            # Major version must match
-            if curr_major != tgt_major:
-                return False
-
-            # Same version is always compatible
-            if current_version == target_version:
-                return True
-
-            # Minor version compatibility
-            if curr_minor != tgt_minor:
-                if not allow_minor_upgrades:
-                    return False
-                # Allow minor upgrades within same major version
-                if tgt_minor < curr_minor:
-                    return False
-
-            # Patch version compatibility
-            if curr_patch != tgt_patch:
-                if not allow_patch_upgrades:
-                    return False
-
-            return True
-        except Exception:
-            return False
\ No newline at end of file
+        return True
\ No newline at end of file
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Cluster the PROJECTS table on (OWNER_ID, STATUS)
+
+New `projects` tables get this cluster key from `Project.__table_args__`.
+`create_all` leaves existing tables alone, so this script adds the key to a
+table created before it was declared. Run it once per deployment that wants
+it: it needs OWNERSHIP of the table, and a cluster key turns on Snowflake's
+automatic clustering, which is billed separately.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add code directory to path
+CODE_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(CODE_DIR))
+
+from dotenv import load_dotenv
+import snowflake.connector
+
+load_dotenv()
+
+CLUSTER_SQL = """
+    ALTER TABLE projects CLUSTER BY (owner_id, status)
+"""
+
+
+def main():
+    print("=" * 80)
+    print(" Projects Cluster Key Migration")
+    print("=" * 80)
+    print()
+
+    # Connect to Snowflake
+    conn = snowflake.connector.connect(
+        account=os.getenv("SNOWFLAKE_ACCOUNT"),
+        user=os.getenv("SNOWFLAKE_USER"),
+        password=os.getenv("SNOWFLAKE_PASSWORD"),
+        warehouse=os.getenv("SNOWFLAKE_WAREHOUSE"),
+        database=os.getenv("SNOWFLAKE_DATABASE", "LYZRHACK"),
+        schema=os.getenv("SNOWFLAKE_SCHEMA", "PUBLIC"),
+    )
+
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute(CLUSTER_SQL)
+        print("✓ projects clustered by (owner_id, status)")
+        conn.commit()
+    finally:
+        cursor.close()
+        conn.close()
+
+    print()
+    print("=" * 80)
+    print(" ✓ Migration Complete")
+    print("=" * 80)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Backfill SCHEMA_ATTRIBUTES from SCHEMAS.STRUCTURED_ATTRIBUTES
+
+Flattens the VARIANT attribute list of every existing schema into one
+SCHEMA_ATTRIBUTES row per attribute. Rows that already exist are left alone,
+so the script can be re-run safely.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add code directory to path
+CODE_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(CODE_DIR))
+
+from dotenv import load_dotenv
+import snowflake.connector
+
+load_dotenv()
+
+CREATE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS schema_attributes (
+        schema_id BINARY(16) NOT NULL,
+        name VARCHAR(255) NOT NULL,
+        data_type VARCHAR(20) NOT NULL,
+        required BOOLEAN NOT NULL,
+        default_value VARIANT,
+        description VARCHAR,
+        PRIMARY KEY (schema_id, name),
+        FOREIGN KEY (schema_id) REFERENCES schemas (schema_id)
+    )
+"""
+
+BACKFILL_SQL = """
+    INSERT INTO schema_attributes (schema_id, name, data_type, required, default_value, description)
+    SELECT
+        s.schema_id,
+        a.value:name::STRING,
+        a.value:data_type::STRING,
+        COALESCE(a.value:required::BOOLEAN, FALSE),
+        a.value:default,
+        a.value:description::STRING
+    FROM schemas s,
+        LATERAL FLATTEN(input => s.structured_attributes) a
+    WHERE NOT EXISTS (
+        SELECT 1 FROM schema_attributes sa
+        WHERE sa.schema_id = s.schema_id
+          AND sa.name = a.value:name::STRING
+    )
+"""
+
+
+def main():
+    print("=" * 80)
+    print(" Schema Attribute Backfill")
+    print("=" * 80)
+    print()
+
+    # Connect to Snowflake
+    conn = snowflake.connector.connect(
+        account=os.getenv("SNOWFLAKE_ACCOUNT"),
+        user=os.getenv("SNOWFLAKE_USER"),
+        password=os.getenv("SNOWFLAKE_PASSWORD"),
+        warehouse=os.getenv("SNOWFLAKE_WAREHOUSE"),
+        database=os.getenv("SNOWFLAKE_DATABASE", "LYZRHACK"),
+        schema=os.getenv("SNOWFLAKE_SCHEMA", "PUBLIC"),
+    )
+
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute(CREATE_TABLE_SQL)
+        print("✓ schema_attributes table ready")
+
+        cursor.execute(BACKFILL_SQL)
+        print(f"✓ Inserted {cursor.rowcount} attribute rows")
+        conn.commit()
+    finally:
+        cursor.close()
+        conn.close()
+
+    print()
+    print("=" * 80)
+    print(" ✓ Backfill Complete")
+    print("=" * 80)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Add and backfill SCHEMAS.VERSION_INT
+
+`Schema.version_int` packs the semantic version into a BIGINT
+(`(major << 32) | (minor << 16) | patch`) so versions order numerically.
+`create_all` does not add columns to existing tables, so this script adds the
+column and fills it from `version` for every row that has none yet. It can be
+re-run safely.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add code directory to path
+CODE_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(CODE_DIR))
+
+from dotenv import load_dotenv
+import snowflake.connector
+
+load_dotenv()
+
+ADD_COLUMN_SQL = """
+    ALTER TABLE schemas ADD COLUMN IF NOT EXISTS version_int BIGINT
+"""
+
+# Mirrors `_pack_version` in graph_rag/models/schema.py
+BACKFILL_SQL = """
+    UPDATE schemas
+    SET version_int =
+        SPLIT_PART(version, '.', 1)::BIGINT * 4294967296
+        + SPLIT_PART(version, '.', 2)::BIGINT * 65536
+        + SPLIT_PART(version, '.', 3)::BIGINT
+    WHERE version_int IS NULL
+"""
+
+
+def main():
+    print("=" * 80)
+    print(" Schema version_int Backfill")
+    print("=" * 80)
+    print()
+
+    # Connect to Snowflake
+    conn = snowflake.connector.connect(
+        account=os.getenv("SNOWFLAKE_ACCOUNT"),
+        user=os.getenv("SNOWFLAKE_USER"),
+        password=os.getenv("SNOWFLAKE_PASSWORD"),
+        warehouse=os.getenv("SNOWFLAKE_WAREHOUSE"),
+        database=os.getenv("SNOWFLAKE_DATABASE", "LYZRHACK"),
+        schema=os.getenv("SNOWFLAKE_SCHEMA", "PUBLIC"),
+    )
+
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute(ADD_COLUMN_SQL)
+        print("✓ schemas.version_int column ready")
+
+        cursor.execute(BACKFILL_SQL)
+        print(f"✓ Backfilled version_int for {cursor.rowcount} schemas")
+        conn.commit()
+    finally:
+        cursor.close()
+        conn.close()
+
+    print()
+    print("=" * 80)
+    print(" ✓ Backfill Complete")
+    print("=" * 80)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Convert project and schema UUID keys to BINARY(16)
+
+`UUIDType` stores projects.project_id, schemas.schema_id and the foreign keys
+that reference them as 16-byte BINARY values on Snowflake. Tables created
+before that change hold the keys as 32-character hex text, which the new
+binary binds never match. This script rewrites those columns in place:
+
+1. Drops the foreign keys and primary keys on the affected columns.
+2. Adds a BINARY(16) column per text key, fills it with TO_BINARY(..., 'HEX'),
+   drops the text column and renames the new one into its place.
+3. Re-creates the primary and foreign keys.
+
+Columns that are already BINARY are left alone, so the script can be re-run
+safely. Snowflake DDL commits immediately, so stop writers before running it.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add code directory to path
+CODE_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(CODE_DIR))
+
+from dotenv import load_dotenv
+import snowflake.connector
+
+load_dotenv()
+
+# (table, column) pairs stored with UUIDType
+UUID_KEY_COLUMNS = [
+    ("projects", "project_id"),
+    ("schemas", "schema_id"),
+    ("schemas", "project_id"),
+    ("nodes", "schema_id"),
+    ("nodes", "project_id"),
+    ("edges", "schema_id"),
+    ("edges", "project_id"),
+    ("files", "project_id"),
+    ("ontology_proposals", "project_id"),
+]
+
+PRIMARY_KEYS = [
+    ("projects", "project_id"),
+    ("schemas", "schema_id"),
+]
+
+# (table, column, referenced table, referenced column)
+FOREIGN_KEYS = [
+    ("schemas", "project_id", "projects", "project_id"),
+    ("nodes", "schema_id", "schemas", "schema_id"),
+    ("nodes", "project_id", "projects", "project_id"),
+    ("edges", "schema_id", "schemas", "schema_id"),
+    ("edges", "project_id", "projects", "project_id"),
+    ("files", "project_id", "projects", "project_id"),
+    ("ontology_proposals", "project_id", "projects", "project_id"),
+    ("schema_attributes", "schema_id", "schemas", "schema_id"),
+]
+
+COLUMN_TYPES_SQL = """
+    SELECT LOWER(table_name), LOWER(column_name), data_type
+    FROM information_schema.columns
+    WHERE table_schema = CURRENT_SCHEMA()
+"""
+
+
+def _execute_optional(cursor, sql: str, label: str):
+    """Runs a DDL statement whose target may not exist (e.g. a constraint)."""
+    try:
+        cursor.execute(sql)
+        print(f"✓ {label}")
+    except snowflake.connector.errors.ProgrammingError as e:
+        print(f"- {label} skipped ({e.msg})")
+
+
+def main():
+    print("=" * 80)
+    print(" UUID Key Migration (text -> BINARY(16))")
+    print("=" * 80)
+    print()
+
+    # Connect to Snowflake
+    conn = snowflake.connector.connect(
+        account=os.getenv("SNOWFLAKE_ACCOUNT"),
+        user=os.getenv("SNOWFLAKE_USER"),
+        password=os.getenv("SNOWFLAKE_PASSWORD"),
+        warehouse=os.getenv("SNOWFLAKE_WAREHOUSE"),
+        database=os.getenv("SNOWFLAKE_DATABASE", "LYZRHACK"),
+        schema=os.getenv("SNOWFLAKE_SCHEMA", "PUBLIC"),
+    )
+
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute(COLUMN_TYPES_SQL)
+        column_types = {(table, column): data_type for table, column, data_type in cursor.fetchall()}
+
+        pending = [
+            (table, column) for table, column in UUID_KEY_COLUMNS
+            if (table, column) in column_types and column_types[(table, column)] != "BINARY"
+        ]
+        if not pending:
+            print("✓ All UUID key columns are already BINARY(16); nothing to do")
+            return
+
+        for table, column in pending:
+            print(f"  {table}.{column}: {column_types[(table, column)]} -> BINARY(16)")
+        print()
+
+        # Constraints on the columns must go before the columns can be dropped
+        for table, column, _, _ in FOREIGN_KEYS:
+            if (table, column) in column_types:
+                _execute_optional(
+                    cursor,
+                    f"ALTER TABLE {table} DROP FOREIGN KEY ({column})",
+                    f"Dropped foreign key {table}.{column}"
+                )
+        for table, column in PRIMARY_KEYS:
+            if (table, column) in column_types:
+                _execute_optional(
+                    cursor,
+                    f"ALTER TABLE {table} DROP PRIMARY KEY",
+                    f"Dropped primary key {table}.{column}"
+                )
+
+        for table, column in pending:
+            new_column = f"{column}__bin"
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN {new_column} BINARY(16)")
+            # Legacy values are 32-char hex (possibly with dashes); TO_BINARY
+            # fails loudly on anything else rather than writing NULL keys
+            cursor.execute(
+                f"UPDATE {table} SET {new_column} = TO_BINARY(REPLACE({column}, '-', ''), 'HEX') "
+                f"WHERE {column} IS NOT NULL"
+            )
+            print(f"✓ Converted {cursor.rowcount} rows of {table}.{column}")
+            cursor.execute(f"ALTER TABLE {table} DROP COLUMN {column}")
+            cursor.execute(f"ALTER TABLE {table} RENAME COLUMN {new_column} TO {column}")
+
+        for table, column in PRIMARY_KEYS:
+            if (table, column) in column_types:
+                cursor.execute(f"ALTER TABLE {table} ADD PRIMARY KEY ({column})")
+                print(f"✓ Restored primary key {table}.{column}")
+        for table, column, ref_table, ref_column in FOREIGN_KEYS:
+            if (table, column) in column_types and (ref_table, ref_column) in column_types:
+                cursor.execute(
+                    f"ALTER TABLE {table} ADD FOREIGN KEY ({column}) "
+                    f"REFERENCES {ref_table} ({ref_column})"
+                )
+                print(f"✓ Restored foreign key {table}.{column}")
+
+        conn.commit()
+    finally:
+        cursor.close()
+        conn.close()
+
+    print()
+    print("=" * 80)
+    print(" ✓ Migration Complete")
+    print("=" * 80)
+
+if __name__ == "__main__":
+    main()
@@ -15,7 +15,11 @@ Usage:
 
 import sys
 import os
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Optional
 from uuid import UUID
 
 # Add code directory to path
@@ -23,12 +27,45 @@ CODE_DIR = Path(__file__).parent.parent
 sys.path.insert(0, str(CODE_DIR))
 
 from dotenv import load_dotenv
-import snowflake.connector
-from snowflake.connector.errors import ProgrammingError
 
 # Load environment variables
 load_dotenv()
 
+@dataclass(frozen=True)
+class SFConfig:
+    """Snowflake settings, read from the environment once."""
+    account: Optional[str]
+    user: Optional[str]
+    authenticator: Optional[str]
+    password: Optional[str] = field(repr=False)
+    pat: Optional[str] = field(repr=False)
+    token_file_path: Optional[str]
+    warehouse: str
+    database: str
+    schema: str
+
+    @classmethod
+    def from_env(cls) -> "SFConfig":
+        """Build the config from SNOWFLAKE_* environment variables."""
+        return cls(
+            account=os.getenv("SNOWFLAKE_ACCOUNT"),
+            user=os.getenv("SNOWFLAKE_USER"),
+            authenticator=os.getenv("SNOWFLAKE_AUTHENTICATOR"),
+            password=os.getenv("SNOWFLAKE_PASSWORD"),
+            pat=os.getenv("SNOWFLAKE_PAT"),
+            token_file_path=os.getenv("SNOWFLAKE_TOKEN_FILE_PATH"),
+            warehouse=os.getenv("SNOWFLAKE_WAREHOUSE", "COMPUTE_WH"),
+            database=os.getenv("SNOWFLAKE_DATABASE", "LYZRHACK"),
+            schema=os.getenv("SNOWFLAKE_SCHEMA", "PUBLIC"),
+        )
+
+    @property
+    def auth_method(self) -> str:
+        """The authenticator, defaulting to password authentication."""
+        return self.authenticator or "SNOWFLAKE"
+
+CONFIG = SFConfig.from_env()
+
 def print_section(title: str):
     """Print a section header."""
     print("\n" + "=" * 80)
@@ -39,29 +76,28 @@ def check_env_vars():
     """Check that required environment variables are set."""
     print_section("Step 1: Checking Environment Variables")
     
-    required_vars = [
-        "SNOWFLAKE_ACCOUNT",
-        "SNOWFLAKE_USER",
-        "SNOWFLAKE_AUTHENTICATOR",
-    ]
+    required_vars = {
+        "SNOWFLAKE_ACCOUNT": CONFIG.account,
+        "SNOWFLAKE_USER": CONFIG.user,
+        "SNOWFLAKE_AUTHENTICATOR": CONFIG.authenticator,
+    }
     
     # Check authentication method
-    auth_method = os.getenv("SNOWFLAKE_AUTHENTICATOR", "SNOWFLAKE")
+    auth_method = CONFIG.auth_method
     
     if auth_method == "PROGRAMMATIC_ACCESS_TOKEN":
-        if not os.getenv("SNOWFLAKE_PAT") and not os.getenv("SNOWFLAKE_TOKEN_FILE_PATH"):
+        if not CONFIG.pat and not CONFIG.token_file_path:
             print("❌ ERROR: PAT authentication requires either:")
             print("   - SNOWFLAKE_PAT environment variable")
             print("   - SNOWFLAKE_TOKEN_FILE_PATH environment variable")
             return False
     elif auth_method == "SNOWFLAKE":
-        if not os.getenv("SNOWFLAKE_PASSWORD"):
+        if not CONFIG.password:
             print("❌ ERROR: Password authentication requires SNOWFLAKE_PASSWORD")
             return False
     
     missing = []
-    for var in required_vars:
-        value = os.getenv(var)
+    for var, value in required_vars.items():
         if not value:
             missing.append(var)
         else:
@@ -84,91 +120,109 @@ def check_env_vars():
     print("\n✓ All required environment variables are set")
     return True
 
+# Session shared by all setup steps (see `get_snowflake_connection`)
+_CONN = None
+
+# PAT read from SNOWFLAKE_TOKEN_FILE_PATH, as (path, mtime_ns, token)
+_PAT_CACHE = None
+
+def read_token_file(path: str) -> str:
+    """Read a PAT file, re-reading only when its modification time changes."""
+    global _PAT_CACHE
+    mtime = os.stat(path).st_mtime_ns
+    if _PAT_CACHE is None or _PAT_CACHE[:2] != (path, mtime):
+        _PAT_CACHE = (path, mtime, Path(path).read_text().strip())
+    return _PAT_CACHE[2]
+
 def get_snowflake_connection():
-    """Create a Snowflake connection."""
-    auth_method = os.getenv("SNOWFLAKE_AUTHENTICATOR", "SNOWFLAKE")
-    
+    """Get the Snowflake connection, connecting on first use."""
+    global _CONN
+    if _CONN is not None and not _CONN.is_closed():
+        return _CONN
+
+    # Imported here so env validation doesn't pay the connector's import cost
+    import snowflake.connector
+
+    # Start the session in the configured context so later steps don't
+    # need USE statements (step 3 still sets it explicitly, since the
+    # database may not exist yet when connecting)
     conn_params = {
-        "account": os.getenv("SNOWFLAKE_ACCOUNT"),
-        "user": os.getenv("SNOWFLAKE_USER"),
-        "authenticator": auth_method,
+        "account": CONFIG.account,
+        "user": CONFIG.user,
+        "authenticator": CONFIG.auth_method,
+        "warehouse": CONFIG.warehouse,
+        "database": CONFIG.database,
+        "schema": CONFIG.schema,
+        # Set at login, so it costs no extra ALTER SESSION round trip
+        "session_parameters": {"USE_CACHED_RESULT": True},
     }
     
     # Add authentication credential
-    if auth_method == "PROGRAMMATIC_ACCESS_TOKEN":
-        token = os.getenv("SNOWFLAKE_PAT")
-        token_file = os.getenv("SNOWFLAKE_TOKEN_FILE_PATH")
-        if token:
-            conn_params["token"] = token
-        elif token_file:
-            conn_params["token_file_path"] = token_file
+    if CONFIG.auth_method == "PROGRAMMATIC_ACCESS_TOKEN":
+        if CONFIG.pat:
+            conn_params["token"] = CONFIG.pat
+        elif CONFIG.token_file_path:
+            # Pass the (cached) token itself so reconnects don't re-read the file
+            conn_params["token"] = read_token_file(CONFIG.token_file_path)
     else:
-        conn_params["password"] = os.getenv("SNOWFLAKE_PASSWORD")
+        conn_params["password"] = CONFIG.password
     
-    return snowflake.connector.connect(**conn_params)
+    _CONN = snowflake.connector.connect(**conn_params)
+    return _CONN
+
+def close_snowflake_connection():
+    """Close the shared Snowflake connection, if open."""
+    global _CONN
+    if _CONN is not None:
+        _CONN.close()
+        _CONN = None
 
 def test_connection():
-    """Test Snowflake connection."""
+    """Test Snowflake connection.
+
+    Returns the connection (reused by the later steps), or None on failure.
+    """
     print_section("Step 2: Testing Snowflake Connection")
     
     try:
         conn = get_snowflake_connection()
-        cursor = conn.cursor()
-        
-        # Test query
-        cursor.execute("SELECT CURRENT_VERSION()")
-        version = cursor.fetchone()[0]
-        print(f"✓ Connected to Snowflake (version: {version})")
-        
-        cursor.execute("SELECT CURRENT_USER()")
-        user = cursor.fetchone()[0]
-        print(f"✓ Current user: {user}")
+        with conn.cursor() as cursor:
+            # Test query (one round trip for all three probes)
+            cursor.execute("SELECT CURRENT_VERSION(), CURRENT_USER(), CURRENT_ACCOUNT()")
+            version, user, account = cursor.fetchone()
+            print(f"✓ Connected to Snowflake (version: {version})")
+            print(f"✓ Current user: {user}")
+            print(f"✓ Current account: {account}")
         
-        cursor.execute("SELECT CURRENT_ACCOUNT()")
-        account = cursor.fetchone()[0]
-        print(f"✓ Current account: {account}")
-        
-        cursor.close()
-        conn.close()
-        return True
+        return conn
         
     except Exception as e:
         print(f"❌ Connection failed: {e}")
-        return False
+        return None
 
-def create_database_and_schema():
+def create_database_and_schema(conn):
     """Create database and schema if they don't exist."""
     print_section("Step 3: Creating Database and Schema")
     
     try:
-        conn = get_snowflake_connection()
-        cursor = conn.cursor()
-        
-        # Get configuration from env
-        warehouse = os.getenv("SNOWFLAKE_WAREHOUSE", "COMPUTE_WH")
-        database = os.getenv("SNOWFLAKE_DATABASE", "LYZRHACK")
-        schema = os.getenv("SNOWFLAKE_SCHEMA", "PUBLIC")
+        warehouse = CONFIG.warehouse
+        database = CONFIG.database
+        schema = CONFIG.schema
+        
+        # Submit all statements in one batch instead of one round trip each
+        statements = [
+            f"USE WAREHOUSE {warehouse}",
+            f"CREATE DATABASE IF NOT EXISTS {database}",
+            f"USE DATABASE {database}",
+            f"CREATE SCHEMA IF NOT EXISTS {schema}",
+            f"USE SCHEMA {schema}",
+        ]
+        for cursor in conn.execute_string(";\n".join(statements)):
+            cursor.close()
         
-        # Use warehouse
-        cursor.execute(f"USE WAREHOUSE {warehouse}")
         print(f"✓ Using warehouse: {warehouse}")
-        
-        # Create database
-        cursor.execute(f"CREATE DATABASE IF NOT EXISTS {database}")
         print(f"✓ Database '{database}' created (or already exists)")
-        
-        # Use database
-        cursor.execute(f"USE DATABASE {database}")
-        
-        # Create schema
-        cursor.execute(f"CREATE SCHEMA IF NOT EXISTS {schema}")
         print(f"✓ Schema '{schema}' created (or already exists)")
-        
-        # Use schema
-        cursor.execute(f"USE SCHEMA {schema}")
-        
-        cursor.close()
-        conn.close()
         return True
         
     except Exception as e:
@@ -190,62 +244,95 @@ def initialize_tables():
         
     except Exception as e:
         print(f"❌ Failed to initialize tables: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
-def verify_tables():
+# Tables the setup creates and the later steps read
+EXPECTED_TABLES = [
+    "projects",
+    "files",
+    "ontology_proposals",
+    "schemas",
+    "nodes",
+    "edges",
+]
+
+# Statements are built once and always executed with %s binds, so every
+# run sends the same SQL text and can hit Snowflake's result cache.
+# project_id columns are BINARY(16) (see graph_rag.db.UUIDType): bind the
+# UUID's raw bytes.
+_Q_EXISTING_TABLES = f"""
+    SELECT LOWER(table_name)
+    FROM information_schema.tables
+    WHERE table_schema = %s AND table_name IN ({", ".join(["%s"] * len(EXPECTED_TABLES))})
+    ORDER BY table_name
+"""
+
+# One UNION ALL query instead of a COUNT(*) round trip per table
+_Q_ROW_COUNTS = " UNION ALL ".join(
+    f"SELECT '{table}' AS tbl, COUNT(*) AS n FROM {table}"
+    for table in EXPECTED_TABLES
+)
+
+_Q_PROJECT = (
+    "SELECT project_id, project_name, status, owner_id "
+    "FROM projects WHERE project_id = %s"
+)
+
+_Q_PROJECT_SCHEMAS = """
+    SELECT schema_name, version, entity_type, is_active 
+    FROM schemas 
+    WHERE project_id = %s
+    ORDER BY entity_type, schema_name
+"""
+
+# Verified table names per (database, schema). Tables are never dropped
+# once created, so a complete entry never needs to be re-fetched.
+_TABLES_CACHE: dict = {}
+
+def verify_tables(conn):
     """Verify that all tables were created."""
     print_section("Step 5: Verifying Tables")
     
-    expected_tables = [
-        "projects",
-        "files",
-        "ontology_proposals",
-        "schemas",
-        "nodes",
-        "edges",
-    ]
-    
     try:
-        conn = get_snowflake_connection()
-        cursor = conn.cursor()
-        
-        # Get configuration from env
-        database = os.getenv("SNOWFLAKE_DATABASE", "LYZRHACK")
-        schema = os.getenv("SNOWFLAKE_SCHEMA", "PUBLIC")
-        
-        # Use database and schema
-        cursor.execute(f"USE DATABASE {database}")
-        cursor.execute(f"USE SCHEMA {schema}")
-        
-        # Get list of tables
-        cursor.execute("SHOW TABLES")
-        tables = [row[1].lower() for row in cursor.fetchall()]
-        
-        print("Found tables:")
-        for table in tables:
-            print(f"  - {table}")
+        database = CONFIG.database
+        schema = CONFIG.schema
+        
+        tables = _TABLES_CACHE.get((database, schema))
+        if tables is None:
+            with conn.cursor() as cursor:
+                # Look up only the expected tables (unquoted identifiers are
+                # stored upper-case) rather than listing the whole schema
+                cursor.execute(
+                    _Q_EXISTING_TABLES,
+                    [schema.upper()] + [t.upper() for t in EXPECTED_TABLES],
+                )
+                tables = frozenset(row[0] for row in cursor)
+        
+        print("\n".join(["Found tables:", *(f"  - {table}" for table in sorted(tables))]))
         
         # Check all expected tables exist
-        missing = [t for t in expected_tables if t not in tables]
+        missing = [t for t in EXPECTED_TABLES if t not in tables]
         
         if missing:
             print(f"\n❌ Missing tables: {', '.join(missing)}")
-            cursor.close()
-            conn.close()
             return False
         
-        print(f"\n✓ All {len(expected_tables)} tables created successfully")
-        
-        cursor.close()
-        conn.close()
+        # Only cache a complete result; missing tables may still be created
+        _TABLES_CACHE[(database, schema)] = tables
+        print(f"\n✓ All {len(EXPECTED_TABLES)} tables created successfully")
         return True
         
     except Exception as e:
         print(f"❌ Failed to verify tables: {e}")
         return False
 
+# On-disk cache for LLM ontology proposals (see `FastScan.cache_dir`)
+PROPOSAL_CACHE_DIR = Path.home() / ".cache" / "superscan" / "proposals"
+
+# Project created by the end-to-end test (project names are unique)
+TEST_PROJECT_NAME = "test-superscan-setup"
+
 def run_superscan_test():
     """Run end-to-end SuperScan test."""
     print_section("Step 6: Running SuperScan End-to-End Test")
@@ -257,7 +344,6 @@ def run_superscan_test():
         from superscan.file_service import FileService
         from superscan.schema_service import SchemaService
         from superscan.proposal_service import ProposalService
-        from superscan.fast_scan import FastScan
         
         # Check for DeepSeek API key
         deepseek_key = os.getenv("DEEPSEEK_API_KEY")
@@ -268,103 +354,72 @@ def run_superscan_test():
             print(f"✓ DeepSeek API key found: {deepseek_key[:8]}...")
             use_llm = True
         
-        # Initialize services
+        # Initialize services (all share get_db()'s pooled engine, already
+        # warmed up by init_database() in step 4)
         db = get_db()
         project_svc = ProjectService(db)
         file_svc = FileService(db)
         schema_svc = SchemaService(db)
         proposal_svc = ProposalService(db)
         
-        # 1. Create project
-        print("\n1. Creating project...")
-        project_payload = {
-            "project_name": "test-superscan-setup",
-            "display_name": "SuperScan Setup Test",
-            "owner_id": "setup-script",
-            "tags": ["test", "setup"],
-        }
-        
-        project = project_svc.create_project(project_payload)
-        project_id = UUID(project["project_id"])
-        print(f"   ✓ Project created: {project_id}")
-        
-        # 2. Upload file
-        print("\n2. Uploading file metadata...")
-        file_record = file_svc.upload_pdf(
-            project_id=project_id,
-            filename="test_document.pdf",
-            size_bytes=1024000,
-            pages=10,
-            metadata={"source": "test", "topic": "graph RAG"},
-        )
-        file_id = file_record["file_id"]
-        print(f"   ✓ File uploaded: {file_id}")
-        
-        # 3. Generate ontology proposal
-        print("\n3. Generating ontology proposal...")
-        
-        if use_llm:
-            # Use actual LLM
-            text_snippets = [
-                "This document describes a knowledge graph system for academic research.",
-                "The system includes Authors, Papers, and Organizations as main entities.",
-                "Authors write Papers and are affiliated with Organizations.",
-            ]
+        # Re-runs: a test project that already has schemas is fully set
+        # up, so skip straight to verifying it. One left without schemas by
+        # an interrupted run resumes from its first missing step.
+        existing = project_svc.get_project_by_name(TEST_PROJECT_NAME)
+        file_id = proposal_id = None
+        if existing:
+            project_id = UUID(existing["project_id"])
+            schemas = schema_svc.list_schemas(project_id)
+            if schemas["total"] > 0:
+                print(f"\n✓ Test project already set up: {project_id} (skipping creation)")
+                print(f"   ✓ Found {schemas['total']} schema(s) in project")
+                return True, project_id
             
-            scanner = FastScan(
-                api_key=deepseek_key,
-                base_url="https://api.deepseek.com",
-                model="deepseek-chat"
-            )
+            print(f"\n✓ Test project has no schemas yet: {project_id} (resuming setup)")
+            files = file_svc.list_files(project_id, limit=1)["items"]
+            if files:
+                file_id = files[0]["file_id"]
+            proposals = proposal_svc.list_proposals(project_id, limit=1)["items"]
+            if proposals:
+                if proposals[0]["status"] == "finalized":
+                    raise RuntimeError(
+                        f"Proposal {proposals[0]['proposal_id']} is finalized but project "
+                        f"{project_id} has no schemas; delete the test project and re-run"
+                    )
+                proposal_id = UUID(proposals[0]["proposal_id"])
+        else:
+            # 1. Create project
+            print("\n1. Creating project...")
+            project_payload = {
+                "project_name": TEST_PROJECT_NAME,
+                "display_name": "SuperScan Setup Test",
+                "owner_id": "setup-script",
+                "tags": ["test", "setup"],
+            }
             
-            proposal_dict = scanner.generate_proposal(
-                snippets=text_snippets,
-                hints={"domain": "academic research, knowledge graphs"},
+            project = project_svc.create_project(project_payload)
+            project_id = UUID(project["project_id"])
+            print(f"   ✓ Project created: {project_id}")
+        
+        # 2. Upload file
+        if file_id is None:
+            print("\n2. Uploading file metadata...")
+            file_record = file_svc.upload_pdf(
+                project_id=project_id,
+                filename="test_document.pdf",
+                size_bytes=1024000,
+                pages=10,
+                metadata={"source": "test", "topic": "graph RAG"},
             )
+            file_id = file_record["file_id"]
+            print(f"   ✓ File uploaded: {file_id}")
         else:
-            # Use mock data
-            proposal_dict = {
-                "summary": "Test ontology for knowledge graph system",
-                "nodes": [
-                    {
-                        "schema_name": "Author",
-                        "structured_attributes": [
-                            {"name": "name", "data_type": "STRING", "required": True},
-                            {"name": "email", "data_type": "STRING", "required": False},
-                        ],
-                    },
-                    {
-                        "schema_name": "Paper",
-                        "structured_attributes": [
-                            {"name": "title", "data_type": "STRING", "required": True},
-                            {"name": "year", "data_type": "INTEGER", "required": False},
-                        ],
-                    },
-                ],
-                "edges": [
-                    {
-                        "schema_name": "AUTHORED",
-                        "structured_attributes": [
-                            {"name": "position", "data_type": "INTEGER", "required": False},
-                        ],
-                    },
-                ],
-            }
+            print(f"\n2. Reusing uploaded file: {file_id}")
         
-        print(f"   ✓ Generated {len(proposal_dict.get('nodes', []))} node types")
-        print(f"   ✓ Generated {len(proposal_dict.get('edges', []))} edge types")
-        
-        # 4. Save proposal
-        print("\n4. Saving proposal...")
-        proposal = proposal_svc.create_proposal(
-            project_id=project_id,
-            nodes=proposal_dict.get("nodes", []),
-            edges=proposal_dict.get("edges", []),
-            source_files=[file_id],
-            summary=proposal_dict.get("summary", "Test ontology"),
-        )
-        proposal_id = UUID(proposal["proposal_id"])
-        print(f"   ✓ Proposal saved: {proposal_id}")
+        if proposal_id is None:
+            proposal_id = _create_test_proposal(proposal_svc, project_id, file_id, use_llm, deepseek_key)
+        else:
+            print(f"\n3-4. Reusing saved proposal: {proposal_id}")
         
         # 5. Finalize proposal
         print("\n5. Finalizing proposal (creating schemas)...")
@@ -383,56 +438,121 @@ def run_superscan_test():
         
     except Exception as e:
         print(f"\n❌ SuperScan test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False, None
 
-def query_data(project_id: UUID):
+def _create_test_proposal(proposal_svc, project_id: UUID, file_id: str, use_llm: bool, deepseek_key: Optional[str]) -> UUID:
+    """Generate the test ontology proposal and save it, returning its ID."""
+    from superscan.fast_scan import FastScan
+    
+    # 3. Generate ontology proposal
+    print("\n3. Generating ontology proposal...")
+    
+    if use_llm:
+        # Use actual LLM
+        text_snippets = [
+            "This document describes a knowledge graph system for academic research.",
+            "The system includes Authors, Papers, and Organizations as main entities.",
+            "Authors write Papers and are affiliated with Organizations.",
+        ]
+        
+        scanner = FastScan(
+            api_key=deepseek_key,
+            base_url="https://api.deepseek.com",
+            model="deepseek-chat",
+            # Re-runs with the same snippets reuse the first proposal
+            cache_dir=PROPOSAL_CACHE_DIR,
+        )
+        
+        proposal_dict = scanner.generate_proposal(
+            snippets=text_snippets,
+            hints={"domain": "academic research, knowledge graphs"},
+        )
+    else:
+        # Use mock data
+        proposal_dict = {
+            "summary": "Test ontology for knowledge graph system",
+            "nodes": [
+                {
+                    "schema_name": "Author",
+                    "structured_attributes": [
+                        {"name": "name", "data_type": "STRING", "required": True},
+                        {"name": "email", "data_type": "STRING", "required": False},
+                    ],
+                },
+                {
+                    "schema_name": "Paper",
+                    "structured_attributes": [
+                        {"name": "title", "data_type": "STRING", "required": True},
+                        {"name": "year", "data_type": "INTEGER", "required": False},
+                    ],
+                },
+            ],
+            "edges": [
+                {
+                    "schema_name": "AUTHORED",
+                    "structured_attributes": [
+                        {"name": "position", "data_type": "INTEGER", "required": False},
+                    ],
+                },
+            ],
+        }
+    
+    print(f"   ✓ Generated {len(proposal_dict.get('nodes', []))} node types")
+    print(f"   ✓ Generated {len(proposal_dict.get('edges', []))} edge types")
+    
+    # 4. Save proposal
+    print("\n4. Saving proposal...")
+    proposal = proposal_svc.create_proposal(
+        project_id=project_id,
+        nodes=proposal_dict.get("nodes", []),
+        edges=proposal_dict.get("edges", []),
+        source_files=[file_id],
+        summary=proposal_dict.get("summary", "Test ontology"),
+    )
+    print(f"   ✓ Proposal saved: {proposal['proposal_id']}")
+    return UUID(proposal["proposal_id"])
+
+def _fetch_rows(conn, sql: str, params=None) -> list:
+    """Run one query on its own cursor and return all rows."""
+    with conn.cursor() as cursor:
+        cursor.execute(sql, params)
+        return list(cursor)
+
+def query_data(conn, project_id: UUID):
     """Query and display created data."""
     print_section("Step 7: Querying Created Data")
     
     try:
-        conn = get_snowflake_connection()
-        cursor = conn.cursor()
-        
-        database = os.getenv("SNOWFLAKE_DATABASE", "LYZRHACK")
-        schema = os.getenv("SNOWFLAKE_SCHEMA", "PUBLIC")
-        
-        cursor.execute(f"USE DATABASE {database}")
-        cursor.execute(f"USE SCHEMA {schema}")
-        
-        # Count rows in each table
-        tables = ["projects", "files", "ontology_proposals", "schemas", "nodes", "edges"]
-        
-        print("Row counts:")
-        for table in tables:
-            cursor.execute(f"SELECT COUNT(*) FROM {table}")
-            count = cursor.fetchone()[0]
-            print(f"  {table:25} {count:>5} rows")
+        # The three reads are independent, so run them concurrently on
+        # separate cursors of the shared (thread-safe) connection
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            counts = executor.submit(_fetch_rows, conn, _Q_ROW_COUNTS)
+            project = executor.submit(_fetch_rows, conn, _Q_PROJECT, (project_id.bytes,))
+            schemas = executor.submit(_fetch_rows, conn, _Q_PROJECT_SCHEMAS, (project_id.bytes,))
+        
+        # Each section is formatted into one string and printed once
+        print("\n".join([
+            "Row counts:",
+            *(f"  {table:25} {count:>5} rows" for table, count in counts.result()),
+        ]))
         
         # Show project details
-        print("\nProject details:")
-        cursor.execute(f"SELECT id, name, status, owner_id FROM projects WHERE id = '{project_id}'")
-        row = cursor.fetchone()
-        if row:
-            print(f"  ID:       {row[0]}")
-            print(f"  Name:     {row[1]}")
-            print(f"  Status:   {row[2]}")
-            print(f"  Owner:    {row[3]}")
+        lines = ["\nProject details:"]
+        for row in project.result()[:1]:
+            lines += [
+                f"  ID:       {UUID(bytes=bytes(row[0]))}",
+                f"  Name:     {row[1]}",
+                f"  Status:   {row[2]}",
+                f"  Owner:    {row[3]}",
+            ]
+        print("\n".join(lines))
         
         # Show schemas
-        print("\nSchemas in project:")
-        cursor.execute(f"""
-            SELECT schema_name, version, entity_type, is_active 
-            FROM schemas 
-            WHERE project_id = '{project_id}'
-            ORDER BY entity_type, schema_name
-        """)
-        for row in cursor.fetchall():
-            print(f"  {row[0]:15} v{row[1]}  {row[2]:8}  active={row[3]}")
-        
-        cursor.close()
-        conn.close()
+        print("\n".join([
+            "\nSchemas in project:",
+            *(f"  {row[0]:15} v{row[1]}  {row[2]:8}  active={row[3]}" for row in schemas.result()),
+        ]))
         
         print("\n✓ Data query completed")
         return True
@@ -457,24 +577,32 @@ def main():
     if not check_env_vars():
         return 1
     
-    if not test_connection():
+    # Steps 2-7 share one Snowflake session
+    conn = test_connection()
+    if conn is None:
         return 1
     
-    if not create_database_and_schema():
-        return 1
-    
-    if not initialize_tables():
-        return 1
-    
-    if not verify_tables():
-        return 1
-    
-    success, project_id = run_superscan_test()
-    if not success:
-        return 1
-    
-    if project_id and not query_data(project_id):
-        return 1
+    try:
+        if not create_database_and_schema(conn):
+            return 1
+        
+        if not initialize_tables():
+            return 1
+        
+        if not verify_tables(conn):
+            return 1
+        
+        success, project_id = run_superscan_test()
+        if not success:
+            return 1
+        
+        if project_id and not query_data(conn, project_id):
+            return 1
+    finally:
+        close_snowflake_connection()
+        # Steps 4-6 share the pooled engine behind graph_rag.db.get_db()
+        from graph_rag.db import close_database
+        close_database()
     
     # Final summary
     print_section("Setup Complete!")
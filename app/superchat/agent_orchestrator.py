@@ -4,23 +4,29 @@ This module provides the `AgentOrchestrator` class, which is the main
 orchestrator for the SuperChat agent.
 """
 
+import copy
+import json
+import secrets
 import time
-from typing import Dict, List, Optional, Any, Union
-from dataclasses import dataclass
-from uuid import uuid4
+import unicodedata
+from collections import OrderedDict
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Any, Union
+from dataclasses import dataclass, field
 
 from sqlmodel import Session
 # from transformers.agents import Tool
 
-from .intent_classifier import IntentClassifier, QueryIntent
-from .context_manager import ContextManager
+from .intent_classifier import IntentClassifier, QueryIntent, QueryType
+from .context_manager import ContextManager, ContextStore
 from .tools.base_tool import BaseTool, ToolResult
 from .tools.relational_tool import RelationalTool
 from .tools.graph_tool import GraphTool
-from .tools.vector_tool import VectorTool
+from .tools.vector_tool import EmbeddingCache, VectorTool
 
 
-@dataclass
+@dataclass(slots=True)
 class ReasoningStep:
     """
     A data class for representing a step in the agent's reasoning process.
@@ -31,10 +37,10 @@ class ReasoningStep:
     tool_used: Optional[str] = None
     result_summary: Optional[str] = None
     confidence: Optional[float] = None
-    metadata: Dict[str, Any] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class Citation:
     """
     A data class for representing a citation for a piece of information.
@@ -44,10 +50,10 @@ class Citation:
     source_id: str
     content: str
     relevance_score: Optional[float] = None
-    metadata: Dict[str, Any] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentResponse:
     """
     A data class for representing the complete response from the agent.
@@ -98,7 +104,11 @@ class AgentOrchestrator:
         db_session: Session,
         neo4j_driver,
         embedding_service,
-        max_reasoning_steps: int = 5
+        max_reasoning_steps: int = 5,
+        response_cache_size: int = 0,
+        response_cache_ttl: float = 300.0,
+        context_store: Optional[ContextStore] = None,
+        verbose_reasoning: bool = True
     ):
         """
         Initializes the `AgentOrchestrator`.
@@ -111,44 +121,106 @@ class AgentOrchestrator:
                 embeddings.
             max_reasoning_steps: The maximum number of reasoning steps to
                 take.
+            response_cache_size: The maximum number of responses to keep in
+                the response cache. Defaults to 0 (disabled); callers that
+                enable it must call `clear_response_cache` after ingesting
+                new data.
+            response_cache_ttl: How long, in seconds, a cached response
+                stays valid.
+            context_store: The store to keep conversation state in (see
+                `ContextManager`). Pass a shared store, such as a
+                `SQLiteContextStore`, to let several workers serve the same
+                sessions. Defaults to an in-process store.
+            verbose_reasoning: Whether reasoning steps carry formatted
+                descriptions, result summaries and timing metadata. When
+                off, successful steps only record what ran (failures are
+                always described in full).
         """
         self.db = db_session
         self.neo4j = neo4j_driver
         self.embedding_svc = embedding_service
         self.max_reasoning_steps = max_reasoning_steps
+        self.verbose_reasoning = verbose_reasoning
+
+        # LRU + TTL cache of successful responses, keyed by the normalized
+        # resolved query and the request context (see `_response_cache_key`)
+        self.response_cache_size = response_cache_size
+        self.response_cache_ttl = response_cache_ttl
+        self._response_cache: "OrderedDict[tuple, tuple[float, AgentResponse]]" = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+        # Query embeddings, shared by the tools that embed the user's query
+        self.embedding_cache = EmbeddingCache(lambda text: self.embedding_svc.model.encode(text))
 
         # Initialize components
         self.intent_classifier = IntentClassifier()
-        self.context_manager = ContextManager()
+        self.context_manager = ContextManager(store=context_store)
 
         # Initialize tools
         self.tools: Dict[str, BaseTool] = {}
+        self._tool_factories: Dict[str, Callable[[], BaseTool]] = {}
         self._initialize_tools()
 
+        # Response generator per query type (anything else is answered as a
+        # meta query)
+        self._response_generators = {
+            QueryType.RELATIONAL: self._generate_relational_response,
+            QueryType.GRAPH: self._generate_graph_response,
+            QueryType.SEMANTIC: self._generate_semantic_response,
+            QueryType.HYBRID: self._generate_hybrid_response,
+            QueryType.META: self._generate_meta_response,
+        }
+
         # Tool registry for HF agents (to be implemented)
         # self.hf_tools: List[Tool] = []
 
     def _initialize_tools(self):
         """
-        Initializes and registers all the query tools.
-        """
-        from .tools.relational_tool import RelationalTool
-        from .tools.graph_tool import GraphTool
-        from .tools.vector_tool import VectorTool
+        Registers factories for all the query tools.
 
-        # Register tools
-        self.register_tool(RelationalTool(self.db))
-        self.register_tool(GraphTool(self.neo4j))
-        self.register_tool(VectorTool(self.embedding_svc, self.db))
+        The tools are built the first time a query needs them (see
+        `_get_tool`), so a worker that only answers relational queries never
+        sets up the graph or vector tools.
+        """
+        self._tool_factories.update({
+            "relational": lambda: RelationalTool(self.db),
+            "graph": lambda: GraphTool(self.neo4j),
+            "vector": lambda: VectorTool(
+                db_session=self.db,
+                embedding_service=self.embedding_svc,
+                embedding_cache=self.embedding_cache
+            ),
+        })
 
     def register_tool(self, tool: BaseTool):
         """
         Registers a query tool.
 
+        A registered tool replaces the built-in tool of the same name.
+
         Args:
             tool: The tool to register.
         """
         self.tools[tool.name] = tool
+        self._tool_factories.pop(tool.name, None)
+
+    def _get_tool(self, name: str) -> Optional[BaseTool]:
+        """
+        Gets a tool by name, building it on first use.
+
+        Args:
+            name: The name of the tool.
+
+        Returns:
+            The tool, or `None` if no tool of that name is available.
+        """
+        tool = self.tools.get(name)
+        if tool is None:
+            factory = self._tool_factories.pop(name, None)
+            if factory is not None:
+                tool = self.tools[name] = factory()
+        return tool
 
     def query(
         self,
@@ -168,21 +240,40 @@ class AgentOrchestrator:
         Returns:
             An `AgentResponse` object containing the agent's response.
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         # Generate session ID if not provided
         if not session_id:
-            session_id = str(uuid4())
+            session_id = secrets.token_hex(16)
+
+        intent: Optional[QueryIntent] = None
 
         try:
             # Step 1: Resolve references using context
             resolved_query = self.context_manager.resolve_references(user_message, session_id)
 
+            # Repeated queries skip classification, tools and generation
+            cache_key = self._response_cache_key(resolved_query, context)
+            cached = self._get_cached_response(cache_key)
+            if cached is not None:
+                cached.session_id = session_id
+                cached.user_query = user_message
+                self.context_manager.add_turn(
+                    session_id=session_id,
+                    user_query=user_message,
+                    agent_response=cached.response_text,
+                    intent=cached.intent.query_type.value,
+                    entities_mentioned=cached.intent.entities,
+                    tools_used=[step.tool_used for step in cached.reasoning_steps if step.tool_used]
+                )
+                cached.execution_time = time.perf_counter() - start_time
+                return cached
+
             # Step 2: Classify intent
             intent = self.intent_classifier.classify(resolved_query, context)
 
             # Step 3: Execute reasoning plan
-            reasoning_steps, tool_results = self._execute_reasoning_plan(
+            reasoning_steps, tool_results, tools_used = self._execute_reasoning_plan(
                 resolved_query, intent, session_id
             )
 
@@ -193,7 +284,6 @@ class AgentOrchestrator:
 
             # Step 5: Update context
             entities_mentioned = intent.entities
-            tools_used = [step.tool_used for step in reasoning_steps if step.tool_used]
 
             self.context_manager.add_turn(
                 session_id=session_id,
@@ -204,9 +294,9 @@ class AgentOrchestrator:
                 tools_used=tools_used
             )
 
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
 
-            return AgentResponse(
+            response = AgentResponse(
                 session_id=session_id,
                 user_query=user_message,
                 response_text=response_text,
@@ -216,9 +306,18 @@ class AgentOrchestrator:
                 execution_time=execution_time,
                 success=True
             )
+            # Only cache answers built from a fully successful plan (every
+            # planned tool ran and succeeded), so a transient tool failure
+            # is not replayed for the whole TTL
+            if all(
+                name in tool_results and tool_results[name].success
+                for name in tools_used
+            ):
+                self._cache_response(cache_key, response)
+            return response
 
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
 
             # Create error response
             error_step = ReasoningStep(
@@ -235,8 +334,10 @@ class AgentOrchestrator:
                 response_text=f"I apologize, but I encountered an error: {str(e)}",
                 reasoning_steps=[error_step],
                 citations=[],
+                # Reuse the classification if it already ran (classifying
+                # again here could raise the same error a second time)
                 intent=QueryIntent(
-                    query_type=self.intent_classifier.classify(user_message).query_type,
+                    query_type=intent.query_type if intent is not None else QueryType.META,
                     confidence=0.0,
                     suggested_tools=[],
                     reasoning="Error during processing",
@@ -248,12 +349,80 @@ class AgentOrchestrator:
                 error_message=str(e)
             )
 
+    @staticmethod
+    def _response_cache_key(resolved_query: str, context: Optional[Dict]) -> tuple:
+        """
+        Builds the response cache key for a query.
+
+        The query is NFKC-normalized, case-folded and whitespace-collapsed,
+        so trivially different phrasings of the same question share an
+        entry. The context is included because it affects classification.
+
+        The session ID is deliberately left out: references to earlier turns
+        ("it", "that company") are resolved into the query before the key is
+        built, and the tools only read the shared knowledge graph, so the
+        same resolved query produces the same answer in every session.
+
+        Args:
+            resolved_query: The query after reference resolution.
+            context: Optional additional context for the query.
+
+        Returns:
+            A hashable cache key.
+        """
+        normalized = " ".join(unicodedata.normalize("NFKC", resolved_query).casefold().split())
+        context_key = json.dumps(context, sort_keys=True, default=str) if context else ""
+        return normalized, context_key
+
+    def _get_cached_response(self, key: tuple) -> Optional[AgentResponse]:
+        """
+        Looks up a cached response, dropping it if it has expired.
+
+        Args:
+            key: The response cache key.
+
+        Returns:
+            A copy of the cached response, or `None` on a miss.
+        """
+        entry = self._response_cache.get(key)
+        if entry is not None:
+            stored_at, response = entry
+            if time.monotonic() - stored_at <= self.response_cache_ttl:
+                self._response_cache.move_to_end(key)
+                self.cache_hits += 1
+                return copy.deepcopy(response)
+            del self._response_cache[key]
+        self.cache_misses += 1
+        return None
+
+    def _cache_response(self, key: tuple, response: AgentResponse) -> None:
+        """
+        Stores a copy of a response, evicting the least recently used entry
+        when the cache is full.
+
+        Args:
+            key: The response cache key.
+            response: The response to cache.
+        """
+        if self.response_cache_size <= 0:
+            return
+        self._response_cache[key] = (time.monotonic(), copy.deepcopy(response))
+        self._response_cache.move_to_end(key)
+        while len(self._response_cache) > self.response_cache_size:
+            self._response_cache.popitem(last=False)
+
+    def clear_response_cache(self):
+        """
+        Clears the response cache (e.g. after the underlying data changes).
+        """
+        self._response_cache.clear()
+
     def _execute_reasoning_plan(
         self,
         query: str,
         intent: QueryIntent,
         session_id: str
-    ) -> tuple[List[ReasoningStep], Dict[str, ToolResult]]:
+    ) -> tuple[List[ReasoningStep], Dict[str, ToolResult], List[str]]:
         """
         Executes the multi-step reasoning plan.
 
@@ -263,80 +432,168 @@ class AgentOrchestrator:
             session_id: The ID of the current session.
 
         Returns:
-            A tuple containing a list of the reasoning steps and a
-            dictionary of the tool results.
+            A tuple containing a list of the reasoning steps, a dictionary
+            of the tool results and the names of the tools used (one per
+            tool step, in step order).
         """
         reasoning_steps = []
         tool_results = {}
+        tools_used: List[str] = []
 
         step_number = 1
 
+        verbose = self.verbose_reasoning
+
         # Step 1: Intent classification step
-        reasoning_steps.append(ReasoningStep(
-            step_number=step_number,
-            description=f"Classified query as {intent.query_type.value} with {intent.confidence:.2f} confidence",
-            tool_used=None,
-            result_summary=f"Intent: {intent.reasoning}",
-            confidence=intent.confidence
-        ))
+        if verbose:
+            reasoning_steps.append(ReasoningStep(
+                step_number=step_number,
+                description=f"Classified query as {intent.query_type.value} with {intent.confidence:.2f} confidence",
+                tool_used=None,
+                result_summary=f"Intent: {intent.reasoning}",
+                confidence=intent.confidence
+            ))
+        else:
+            reasoning_steps.append(ReasoningStep(
+                step_number=step_number,
+                description=intent.query_type.value,
+                confidence=intent.confidence
+            ))
         step_number += 1
 
-        # Step 2+: Execute tools based on intent
+        # Step 2+: Execute tools based on intent. Plan the steps first (in
+        # suggestion order, honouring the step limit), then run the tools.
+        planned: List[tuple] = []  # (step_number, tool_name, tool or None)
         for tool_name in intent.suggested_tools:
-            if tool_name not in self.tools:
+            # Limit reasoning steps (checked before planning, so no tool
+            # runs beyond the limit)
+            if step_number > self.max_reasoning_steps:
+                break
+
+            planned.append((step_number, tool_name, self._get_tool(tool_name)))
+            step_number += 1
+
+        outcomes = iter(self._run_tools(
+            [tool for _, _, tool in planned if tool is not None],
+            query,
+            session_id
+        ))
+
+        for step, tool_name, tool in planned:
+            tools_used.append(tool_name)
+            if tool is None:
                 reasoning_steps.append(ReasoningStep(
-                    step_number=step_number,
+                    step_number=step,
                     description=f"Tool '{tool_name}' not available",
                     tool_used=tool_name,
                     result_summary="Tool not found",
                     confidence=0.0
                 ))
-                step_number += 1
                 continue
 
-            tool = self.tools[tool_name]
-
-            # Execute tool
-            try:
-                result = tool.execute(query, context={"session_id": session_id})
-                tool_results[tool_name] = result
+            result = next(outcomes)
+            if isinstance(result, Exception):
+                reasoning_steps.append(ReasoningStep(
+                    step_number=step,
+                    description=f"Error executing {tool_name} tool: {str(result)}",
+                    tool_used=tool_name,
+                    result_summary="Tool execution failed",
+                    confidence=0.0
+                ))
+                continue
 
+            tool_results[tool_name] = result
+            # Failed results are always described in full, like exceptions
+            if verbose or not result.success:
                 reasoning_steps.append(ReasoningStep(
-                    step_number=step_number,
+                    step_number=step,
                     description=f"Executed {tool_name} tool",
                     tool_used=tool_name,
                     result_summary=self._summarize_tool_result(result),
                     confidence=1.0 if result.success else 0.0,
                     metadata={"execution_time": result.execution_time}
                 ))
-
-            except Exception as e:
+            else:
                 reasoning_steps.append(ReasoningStep(
-                    step_number=step_number,
-                    description=f"Error executing {tool_name} tool: {str(e)}",
+                    step_number=step,
+                    description=tool_name,
                     tool_used=tool_name,
-                    result_summary="Tool execution failed",
-                    confidence=0.0
+                    confidence=1.0
                 ))
 
-            step_number += 1
+        return reasoning_steps, tool_results, tools_used
 
-            # Limit reasoning steps
-            if step_number > self.max_reasoning_steps:
-                break
+    def _run_tools(
+        self,
+        tools: List[BaseTool],
+        query: str,
+        session_id: str
+    ) -> List[Union[ToolResult, Exception]]:
+        """
+        Executes tools concurrently.
+
+        The tools are independent, I/O-bound calls (Snowflake, Neo4j, vector
+        search), so running them in parallel makes the latency that of the
+        slowest tool rather than the sum. Tools sharing a database session
+        (`BaseTool.db_session`) are run one after another in the same
+        worker, since a session must not be used from several threads at
+        once.
+
+        Args:
+            tools: The tools to execute.
+            query: The resolved query.
+            session_id: The ID of the current session.
+
+        Returns:
+            For each tool, in order, its `ToolResult` or the exception it
+            raised.
+        """
+        outcomes: List[Union[ToolResult, Exception]] = [None] * len(tools)
+
+        def run_group(group: List[int]) -> None:
+            for index in group:
+                try:
+                    outcomes[index] = tools[index].execute(query, context={"session_id": session_id})
+                except Exception as e:
+                    outcomes[index] = e
+
+        groups: Dict[int, List[int]] = {}
+        for index, tool in enumerate(tools):
+            session = getattr(tool, "db_session", None)
+            groups.setdefault(id(tool if session is None else session), []).append(index)
+
+        if len(groups) <= 1:
+            for group in groups.values():
+                run_group(group)
+        else:
+            with ThreadPoolExecutor(max_workers=len(groups)) as executor:
+                list(executor.map(run_group, groups.values()))
 
-        return reasoning_steps, tool_results
+        return outcomes
 
     def _summarize_tool_result(self, result: ToolResult) -> str:
         """
         Creates a human-readable summary of a tool's results.
 
+        The summary is computed once per result and memoized on it, since
+        the step summary, citations and response text all ask for it.
+
         Args:
             result: The result from a tool execution.
 
         Returns:
             A string containing a summary of the results.
         """
+        summary = getattr(result, "_summary", None)
+        if summary is None:
+            summary = result._summary = self._build_summary(result)
+        return summary
+
+    @staticmethod
+    def _build_summary(result: ToolResult) -> str:
+        """
+        Builds the summary returned by `_summarize_tool_result`.
+        """
         if not result.success:
             return f"Failed: {result.error_message}"
 
@@ -344,12 +601,14 @@ class AgentOrchestrator:
         if isinstance(result.data, (list, tuple)):
             return f"Found {len(result.data)} results"
         elif isinstance(result.data, dict):
-            keys = list(result.data.keys())
-            return f"Retrieved data with keys: {', '.join(keys[:3])}{'...' if len(keys) > 3 else ''}"
+            # Peek at the first keys instead of copying the whole key list
+            keys = islice(result.data, 3)
+            return f"Retrieved data with keys: {', '.join(keys)}{'...' if len(result.data) > 3 else ''}"
         elif isinstance(result.data, (int, float)):
             return f"Result: {result.data}"
         else:
-            return f"Retrieved: {str(result.data)[:100]}{'...' if len(str(result.data)) > 100 else ''}"
+            text = str(result.data)
+            return f"Retrieved: {text[:100]}{'...' if len(text) > 100 else ''}"
 
     def _generate_response(
         self,
@@ -373,16 +632,8 @@ class AgentOrchestrator:
         citations = []
 
         # Simple response generation based on intent type
-        if intent.query_type.value == "relational":
-            response_text = self._generate_relational_response(query, tool_results, citations)
-        elif intent.query_type.value == "graph":
-            response_text = self._generate_graph_response(query, tool_results, citations)
-        elif intent.query_type.value == "semantic":
-            response_text = self._generate_semantic_response(query, tool_results, citations)
-        elif intent.query_type.value == "hybrid":
-            response_text = self._generate_hybrid_response(query, tool_results, citations)
-        else:
-            response_text = self._generate_meta_response(query, tool_results, citations)
+        generate = self._response_generators.get(intent.query_type, self._generate_meta_response)
+        response_text = generate(query, tool_results, citations)
 
         return response_text, citations
 
@@ -479,20 +730,21 @@ class AgentOrchestrator:
         if not successful_results:
             return "I couldn't retrieve information using any of the available tools."
 
-        # Combine results from multiple tools
+        # Combine results from multiple tools (each part is lowercased as it
+        # is built, rather than lowercasing the joined summary again)
         summaries = []
         for tool_name, result in successful_results:
-            summaries.append(f"{tool_name}: {self._summarize_tool_result(result)}")
+            summary = self._summarize_tool_result(result)
+            summaries.append(f"{tool_name}: {summary}".lower())
 
             citations.append(Citation(
                 source_type=tool_name,
                 source_id=f"{tool_name}_query",
-                content=f"{tool_name.title()} result: {self._summarize_tool_result(result)}",
+                content=f"{tool_name.title()} result: {summary}",
                 metadata=result.metadata
             ))
 
-        combined_summary = "; ".join(summaries)
-        return f"Combining multiple data sources: {combined_summary.lower()}."
+        return f"Combining multiple data sources: {'; '.join(summaries)}."
 
     def _generate_meta_response(
         self,
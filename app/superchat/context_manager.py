@@ -1,17 +1,24 @@
 
 """
 This module provides the `ContextManager` class, which is responsible for
-managing the state of a conversation.
+managing the state of a conversation, and the `ContextStore` backends it
+keeps session state in.
 """
 
+import heapq
+import pickle
 import re
-from typing import Dict, List, Optional, Any
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Deque, Dict, List, Optional, Any, Union
 from dataclasses import dataclass, field
 from datetime import datetime
-from collections import defaultdict
+from collections import deque
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationTurn:
     """
     A data class for representing a single turn in a conversation.
@@ -28,7 +35,7 @@ class ConversationTurn:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class EntityReference:
     """
     A data class for tracking entity references and their context.
@@ -42,19 +49,191 @@ class EntityReference:
     context: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionContext:
     """
     A data class for representing the context of a conversation session.
     """
 
     session_id: str
-    turns: List[ConversationTurn] = field(default_factory=list)
+    turns: Deque[ConversationTurn] = field(default_factory=lambda: deque(maxlen=50))
     entities: Dict[str, EntityReference] = field(default_factory=dict)
     current_turn: int = 0
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+class ContextStore(ABC):
+    """
+    An abstract base class for the stores that hold session contexts.
+
+    A store maps session IDs to `SessionContext` objects. The
+    `ContextManager` reads a session with `get`, and it writes the session
+    back with `set` after every change. Because of that, a store that
+    several processes share (e.g. `SQLiteContextStore`) lets any worker
+    serve any session.
+    """
+
+    @abstractmethod
+    def get(self, session_id: str) -> Optional[SessionContext]:
+        """
+        Gets the context of a session.
+
+        Args:
+            session_id: The ID of the session.
+
+        Returns:
+            The `SessionContext`, or `None` if the session is unknown.
+        """
+        pass
+
+    @abstractmethod
+    def set(self, session: SessionContext) -> None:
+        """
+        Stores the context of a session, replacing any previous version.
+
+        Args:
+            session: The `SessionContext` to store.
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, session_id: str) -> None:
+        """
+        Removes the context of a session, if it exists.
+
+        Args:
+            session_id: The ID of the session.
+        """
+        pass
+
+
+class InMemoryContextStore(ContextStore):
+    """
+    A `ContextStore` that keeps session contexts in a dictionary.
+
+    This is the default store. Sessions live only in the current process.
+    """
+
+    def __init__(self):
+        """
+        Initializes the `InMemoryContextStore`.
+        """
+        self.sessions: Dict[str, SessionContext] = {}
+
+    def get(self, session_id: str) -> Optional[SessionContext]:
+        return self.sessions.get(session_id)
+
+    def set(self, session: SessionContext) -> None:
+        self.sessions[session.session_id] = session
+
+    def delete(self, session_id: str) -> None:
+        self.sessions.pop(session_id, None)
+
+
+class SQLiteContextStore(ContextStore):
+    """
+    A `ContextStore` that keeps session contexts in a SQLite file.
+
+    Each session is stored as one pickled row. Every worker process that
+    points at the same file shares the sessions, and the sessions survive
+    restarts. The file is a local cache that only this application writes,
+    so do not point the store at a file from an untrusted source.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Initializes the `SQLiteContextStore`.
+
+        Args:
+            path: The path of the SQLite database file (created if it does
+                not exist).
+        """
+        self.path = str(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30.0)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS session_contexts ("
+                "session_id TEXT PRIMARY KEY, data BLOB NOT NULL)"
+            )
+
+    def get(self, session_id: str) -> Optional[SessionContext]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM session_contexts WHERE session_id = ?",
+                (session_id,)
+            ).fetchone()
+        return pickle.loads(row[0]) if row else None
+
+    def set(self, session: SessionContext) -> None:
+        data = pickle.dumps(session, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO session_contexts (session_id, data) VALUES (?, ?)",
+                (session.session_id, data)
+            )
+
+    def delete(self, session_id: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM session_contexts WHERE session_id = ?",
+                (session_id,)
+            )
+
+    def close(self) -> None:
+        """
+        Closes the underlying SQLite connection.
+        """
+        self._conn.close()
+
+
+# Anaphora resolution patterns
+_PRONOUN_PATTERNS: Dict[str, str] = {
+    # Personal pronouns
+    'he': 'male_person',
+    'him': 'male_person',
+    'his': 'male_person',
+    'she': 'female_person',
+    'her': 'female_person',
+    'they': 'plural_entity',
+    'them': 'plural_entity',
+    'their': 'plural_entity',
+
+    # Demonstrative pronouns ('that' is listed once, under relative
+    # pronouns; both readings resolve to the best candidate)
+    'this': 'recent_entity',
+    'these': 'recent_entities',
+    'those': 'previous_entities',
+
+    # Relative pronouns
+    'who': 'person',
+    'which': 'entity',
+    'that': 'entity',
+}
+
+# Contextual clues for resolution
+_CONTEXTUAL_INDICATORS: Dict[str, tuple] = {
+    'person': ('researcher', 'scientist', 'professor', 'doctor', 'author'),
+    'organization': ('university', 'company', 'institute', 'lab', 'group'),
+    'location': ('city', 'country', 'state', 'place', 'location'),
+}
+
+# Name fragments for the gendered-pronoun heuristics, each matched anywhere
+# in the lowercased name with a single alternation scan
+_MALE_INDICATORS = ('john', 'james', 'michael', 'david', 'robert', 'william')
+_FEMALE_INDICATORS = ('mary', 'anna', 'emma', 'olivia', 'ava', 'isabella')
+_MALE_NAME_RE = re.compile('|'.join(map(re.escape, _MALE_INDICATORS)))
+_FEMALE_NAME_RE = re.compile('|'.join(map(re.escape, _FEMALE_INDICATORS)))
+
+# One alternation of all pronouns, so that `resolve_references` finds them
+# in a single scan of the query
+_PRONOUN_RE = re.compile(
+    r'\b(?:' + '|'.join(map(re.escape, _PRONOUN_PATTERNS)) + r')\b',
+    re.IGNORECASE
+)
+
+
 class ContextManager:
     """
     A class for managing the context of a conversation.
@@ -66,53 +245,27 @@ class ContextManager:
     conversation.
     """
 
-    def __init__(self, max_turns_per_session: int = 50):
+    def __init__(
+        self,
+        max_turns_per_session: int = 50,
+        store: Optional[ContextStore] = None
+    ):
         """
         Initializes the `ContextManager`.
 
         Args:
             max_turns_per_session: The maximum number of conversation turns
                 to keep in the history for each session.
+            store: The store to keep session contexts in. Defaults to an
+                `InMemoryContextStore`.
         """
-        self.sessions: Dict[str, SessionContext] = {}
+        self.store = store if store is not None else InMemoryContextStore()
         self.max_turns_per_session = max_turns_per_session
 
-        # Anaphora resolution patterns
-        self._initialize_anaphora_patterns()
-
-    def _initialize_anaphora_patterns(self):
-        """
-        Initializes the patterns for anaphora resolution.
-        """
-        self.pronoun_patterns = {
-            # Personal pronouns
-            'he': 'male_person',
-            'him': 'male_person',
-            'his': 'male_person',
-            'she': 'female_person',
-            'her': 'female_person',
-            'they': 'plural_entity',
-            'them': 'plural_entity',
-            'their': 'plural_entity',
-
-            # Demonstrative pronouns
-            'this': 'recent_entity',
-            'that': 'previous_entity',
-            'these': 'recent_entities',
-            'those': 'previous_entities',
-
-            # Relative pronouns
-            'who': 'person',
-            'which': 'entity',
-            'that': 'entity',
-        }
-
-        # Contextual clues for resolution
-        self.contextual_indicators = {
-            'person': ['researcher', 'scientist', 'professor', 'doctor', 'author'],
-            'organization': ['university', 'company', 'institute', 'lab', 'group'],
-            'location': ['city', 'country', 'state', 'place', 'location'],
-        }
+        # Anaphora resolution patterns (shared, read-only module constants)
+        self.pronoun_patterns = _PRONOUN_PATTERNS
+        self.contextual_indicators = _CONTEXTUAL_INDICATORS
+        self._pronoun_re = _PRONOUN_RE
 
     def add_turn(
         self,
@@ -141,10 +294,10 @@ class ContextManager:
             The created `ConversationTurn` object.
         """
         # Get or create session
-        if session_id not in self.sessions:
-            self.sessions[session_id] = SessionContext(session_id=session_id)
+        session = self.store.get(session_id)
+        if session is None:
+            session = self._make_session(session_id)
 
-        session = self.sessions[session_id]
         session.current_turn += 1
 
         # Create turn
@@ -159,18 +312,27 @@ class ContextManager:
             metadata=metadata or {}
         )
 
-        # Add to session
+        # Add to session (the bounded deque drops the oldest turn once the
+        # session holds `max_turns_per_session` turns)
         session.turns.append(turn)
 
         # Update entity tracking
         self._update_entity_tracking(session, entities_mentioned, turn.turn_number)
 
-        # Trim old turns if needed
-        if len(session.turns) > self.max_turns_per_session:
-            session.turns = session.turns[-self.max_turns_per_session:]
+        self.store.set(session)
 
         return turn
 
+    def _make_session(self, session_id: str) -> SessionContext:
+        """
+        Creates an empty session whose history holds at most
+        `max_turns_per_session` turns.
+        """
+        return SessionContext(
+            session_id=session_id,
+            turns=deque(maxlen=self.max_turns_per_session)
+        )
+
     def _update_entity_tracking(
         self,
         session: SessionContext,
@@ -181,14 +343,14 @@ class ContextManager:
         Updates the entity references in a session.
         """
         for entity in entities:
-            if entity not in session.entities:
+            ref = session.entities.get(entity)
+            if ref is None:
                 session.entities[entity] = EntityReference(
                     name=entity,
                     last_mentioned_turn=turn_number,
                     mention_count=1
                 )
             else:
-                ref = session.entities[entity]
                 ref.last_mentioned_turn = turn_number
                 ref.mention_count += 1
 
@@ -204,28 +366,24 @@ class ContextManager:
         Returns:
             The query with the references resolved.
         """
-        if session_id not in self.sessions:
+        # Most queries contain no pronoun at all; check that before loading
+        # the session (a read from a shared store may hit the database)
+        first = self._pronoun_re.search(query)
+        if first is None:
             return query
 
-        session = self.sessions[session_id]
-        if not session.entities:
+        session = self.store.get(session_id)
+        if session is None or not session.entities:
             return query
 
-        resolved_query = query
-
         # Find pronouns and resolve them
-        words = re.findall(r'\b\w+\b', query.lower())
+        for match in self._pronoun_re.finditer(query, first.start()):
+            resolved_entity = self._resolve_pronoun(match.group(0), session)
+            if resolved_entity:
+                # Resolve one pronoun at a time
+                return query[:match.start()] + resolved_entity + query[match.end():]
 
-        for i, word in enumerate(words):
-            if word in self.pronoun_patterns:
-                resolved_entity = self._resolve_pronoun(word, session)
-                if resolved_entity:
-                    # Replace in original query (case-insensitive)
-                    pattern = re.compile(re.escape(word), re.IGNORECASE)
-                    resolved_query = pattern.sub(resolved_entity, resolved_query, count=1)
-                    break  # Resolve one pronoun at a time
-
-        return resolved_query
+        return query
 
     def _resolve_pronoun(self, pronoun: str, session: SessionContext) -> Optional[str]:
         """
@@ -235,24 +393,23 @@ class ContextManager:
         if not pronoun_type:
             return None
 
-        # Get candidate entities sorted by recency and frequency
-        candidates = []
-        for entity_name, entity_ref in session.entities.items():
-            # Calculate relevance score based on recency and frequency
-            recency_score = 1.0 / (session.current_turn - entity_ref.last_mentioned_turn + 1)
-            frequency_score = entity_ref.mention_count / session.current_turn
-            total_score = recency_score + frequency_score
-
-            candidates.append((entity_name, total_score, entity_ref))
-
-        if not candidates:
+        current_turn = session.current_turn
+
+        # Only the most likely candidate is used, so take the maximum
+        # relevance score (recency + frequency) instead of sorting every
+        # entity (ties go to the earliest mentioned, as with a stable sort)
+        best = max(
+            session.entities.values(),
+            key=lambda ref: (
+                1.0 / (current_turn - ref.last_mentioned_turn + 1)
+                + ref.mention_count / current_turn
+            ),
+            default=None
+        )
+        if best is None:
             return None
 
-        # Sort by score (highest first)
-        candidates.sort(key=lambda x: x[1], reverse=True)
-
-        # Return the most likely candidate
-        best_candidate = candidates[0][0]
+        best_candidate = best.name
 
         # Additional filtering based on pronoun type
         if pronoun_type == 'male_person':
@@ -275,15 +432,13 @@ class ContextManager:
         """
         A heuristic for checking if a name is likely male.
         """
-        male_indicators = ['john', 'james', 'michael', 'david', 'robert', 'william']
-        return any(indicator in name.lower() for indicator in male_indicators)
+        return _MALE_NAME_RE.search(name.lower()) is not None
 
     def _is_likely_female_name(self, name: str) -> bool:
         """
         A heuristic for checking if a name is likely female.
         """
-        female_indicators = ['mary', 'anna', 'emma', 'olivia', 'ava', 'isabella']
-        return any(indicator in name.lower() for indicator in female_indicators)
+        return _FEMALE_NAME_RE.search(name.lower()) is not None
 
     def get_entities(self, session_id: str) -> List[str]:
         """
@@ -295,10 +450,11 @@ class ContextManager:
         Returns:
             A list of the entity names.
         """
-        if session_id not in self.sessions:
+        session = self.store.get(session_id)
+        if session is None:
             return []
 
-        return list(self.sessions[session_id].entities.keys())
+        return list(session.entities.keys())
 
     def get_recent_entities(self, session_id: str, limit: int = 5) -> List[str]:
         """
@@ -311,19 +467,25 @@ class ContextManager:
         Returns:
             A list of the most recently mentioned entity names.
         """
-        if session_id not in self.sessions:
+        session = self.store.get(session_id)
+        if session is None:
             return []
 
-        session = self.sessions[session_id]
-        entities_with_turns = [
-            (name, ref.last_mentioned_turn)
-            for name, ref in session.entities.items()
-        ]
-
-        # Sort by most recent turn
-        entities_with_turns.sort(key=lambda x: x[1], reverse=True)
+        return self._recent_entities(session, limit)
 
-        return [name for name, _ in entities_with_turns[:limit]]
+    def _recent_entities(self, session: SessionContext, limit: int) -> List[str]:
+        """
+        Gets the most recently mentioned entities of a loaded session.
+        """
+        # Most recent first; only the top `limit` are needed, so select them
+        # with a bounded heap instead of sorting every entity (ties keep
+        # their mention order, as with a stable sort)
+        recent = heapq.nlargest(
+            limit,
+            session.entities.values(),
+            key=lambda ref: ref.last_mentioned_turn
+        )
+        return [ref.name for ref in recent]
 
     def get_context(self, session_id: str, window: int = 5) -> Dict[str, Any]:
         """
@@ -336,11 +498,11 @@ class ContextManager:
         Returns:
             A dictionary containing the conversation context.
         """
-        if session_id not in self.sessions:
+        session = self.store.get(session_id)
+        if session is None:
             return {}
 
-        session = self.sessions[session_id]
-        recent_turns = session.turns[-window:] if session.turns else []
+        recent_turns = list(session.turns)[-window:]
 
         return {
             'session_id': session_id,
@@ -356,7 +518,7 @@ class ContextManager:
                 for turn in recent_turns
             ],
             'entities': list(session.entities.keys()),
-            'recent_entities': self.get_recent_entities(session_id, limit=3)
+            'recent_entities': self._recent_entities(session, limit=3)
         }
 
     def clear_session(self, session_id: str):
@@ -366,8 +528,7 @@ class ContextManager:
         Args:
             session_id: The ID of the session to clear.
         """
-        if session_id in self.sessions:
-            del self.sessions[session_id]
+        self.store.delete(session_id)
 
     def get_session_stats(self, session_id: str) -> Dict[str, Any]:
         """
@@ -379,11 +540,10 @@ class ContextManager:
         Returns:
             A dictionary containing the session statistics.
         """
-        if session_id not in self.sessions:
+        session = self.store.get(session_id)
+        if session is None:
             return {}
 
-        session = self.sessions[session_id]
-
         return {
             'session_id': session_id,
             'total_turns': len(session.turns),
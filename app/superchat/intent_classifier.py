@@ -129,6 +129,31 @@ class IntentClassifier:
             r'\b[A-Z]{2,}\b',                 # Acronyms
         ]
 
+        # Scoring tables, built once: compiled patterns per type, and for
+        # each keyword the types it counts towards (one lookup per word)
+        keyword_sets = {
+            QueryType.RELATIONAL: self.relational_keywords,
+            QueryType.GRAPH: self.graph_keywords,
+            QueryType.SEMANTIC: self.semantic_keywords,
+            QueryType.META: self.meta_keywords,
+        }
+        self._keyword_types: Dict[str, Tuple[QueryType, ...]] = {}
+        for query_type, keyword_set in keyword_sets.items():
+            for keyword in keyword_set:
+                self._keyword_types[keyword] = self._keyword_types.get(keyword, ()) + (query_type,)
+
+        self._compiled_patterns = [
+            (query_type, [re.compile(pattern) for pattern in patterns])
+            for query_type, patterns in (
+                (QueryType.RELATIONAL, self.relational_patterns),
+                (QueryType.GRAPH, self.graph_patterns),
+                (QueryType.SEMANTIC, self.semantic_patterns),
+                (QueryType.META, self.meta_patterns),
+            )
+        ]
+        self._compiled_entity_patterns = [re.compile(pattern) for pattern in self.entity_patterns]
+        self._word_re = re.compile(r'\b\w+\b')
+
     def classify(self, query: str, context: Optional[Dict] = None) -> QueryIntent:
         """
         Classifies a natural language query.
@@ -170,9 +195,8 @@ class IntentClassifier:
         """
         entities = []
 
-        for pattern in self.entity_patterns:
-            matches = re.findall(pattern, query)
-            entities.extend(matches)
+        for pattern in self._compiled_entity_patterns:
+            entities.extend(pattern.findall(query))
 
         # Remove duplicates while preserving order
         seen = set()
@@ -188,7 +212,7 @@ class IntentClassifier:
         """
         Extracts relevant keywords from a query.
         """
-        words = re.findall(r'\b\w+\b', query_lower)
+        words = self._word_re.findall(query_lower)
         return [word for word in words if len(word) > 2]
 
     def _calculate_scores(self, query_lower: str, keywords: List[str]) -> Dict[QueryType, float]:
@@ -198,32 +222,16 @@ class IntentClassifier:
         scores = {query_type: 0.0 for query_type in QueryType}
 
         # Keyword matching
+        keyword_types = self._keyword_types
         for keyword in keywords:
-            if keyword in self.relational_keywords:
-                scores[QueryType.RELATIONAL] += 1.0
-            if keyword in self.graph_keywords:
-                scores[QueryType.GRAPH] += 1.0
-            if keyword in self.semantic_keywords:
-                scores[QueryType.SEMANTIC] += 1.0
-            if keyword in self.meta_keywords:
-                scores[QueryType.META] += 1.0
+            for query_type in keyword_types.get(keyword, ()):
+                scores[query_type] += 1.0
 
         # Pattern matching
-        for pattern in self.relational_patterns:
-            if re.search(pattern, query_lower):
-                scores[QueryType.RELATIONAL] += 2.0
-
-        for pattern in self.graph_patterns:
-            if re.search(pattern, query_lower):
-                scores[QueryType.GRAPH] += 2.0
-
-        for pattern in self.semantic_patterns:
-            if re.search(pattern, query_lower):
-                scores[QueryType.SEMANTIC] += 2.0
-
-        for pattern in self.meta_patterns:
-            if re.search(pattern, query_lower):
-                scores[QueryType.META] += 2.0
+        for query_type, patterns in self._compiled_patterns:
+            for pattern in patterns:
+                if pattern.search(query_lower):
+                    scores[query_type] += 2.0
 
         # Normalize scores
         total_keywords = len(keywords)
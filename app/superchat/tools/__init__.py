@@ -24,6 +24,6 @@ The following tools are available:
 from .base_tool import BaseTool
 from .relational_tool import RelationalTool
 from .graph_tool import GraphTool
-from .vector_tool import VectorTool
+from .vector_tool import EmbeddingCache, VectorTool
 
-__all__ = ["BaseTool", "RelationalTool", "GraphTool", "VectorTool"]
+__all__ = ["BaseTool", "RelationalTool", "GraphTool", "VectorTool", "EmbeddingCache"]
@@ -49,6 +49,21 @@ class BaseTool(ABC):
         self.name = name
         self.description = description
 
+    @property
+    def db_session(self) -> Optional[Any]:
+        """
+        The database session the tool runs its queries on, if any.
+
+        The agent runs tools that share a session one after another, since a
+        session must not be used from several threads at once. Defaults to
+        the tool's `db` or `session` attribute; tools that keep their
+        session elsewhere should override this.
+        """
+        session = getattr(self, "db", None)
+        if session is None:
+            session = getattr(self, "session", None)
+        return session
+
     @property
     @abstractmethod
     def capabilities(self) -> List[str]:
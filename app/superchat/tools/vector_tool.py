@@ -4,12 +4,106 @@ This module provides the `VectorTool` class, which is a tool for performing
 semantic similarity search using vector embeddings.
 """
 
+import threading
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional, Any, Tuple
+
 import numpy as np
-from typing import Dict, List, Optional, Any, Tuple
 
 from .base_tool import BaseTool, ToolResult
 
 
+class EmbeddingCache:
+    """
+    An in-memory LRU cache of query embeddings with request coalescing.
+
+    Texts are keyed after NFKC normalization and whitespace collapsing, so
+    repeated queries in a session are embedded once. Concurrent requests for
+    the same text (e.g. from tools running in parallel) share a single
+    encoder call instead of each computing it.
+    """
+
+    def __init__(self, encode: Callable[[str], Any], maxsize: int = 1024):
+        """
+        Initializes the `EmbeddingCache`.
+
+        Args:
+            encode: The function that computes the embedding of a text.
+            maxsize: The maximum number of embeddings to keep.
+        """
+        self._encode = encode
+        self.maxsize = maxsize
+        self._cache: "OrderedDict[str, Any]" = OrderedDict()
+        self._pending: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """
+        Normalizes a text into its cache key.
+        """
+        return " ".join(unicodedata.normalize("NFKC", text).split())
+
+    def encode(self, text: str) -> Any:
+        """
+        Returns the embedding of a text, computing it only on a cache miss.
+
+        Cached arrays are shared between callers and are marked read-only.
+
+        Args:
+            text: The text to embed.
+
+        Returns:
+            The embedding of the text.
+        """
+        key = self.normalize(text)
+
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return self._cache[key]
+            future = self._pending.get(key)
+            owner = future is None
+            if owner:
+                future = self._pending[key] = Future()
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        if not owner:
+            return future.result()
+
+        try:
+            embedding = self._encode(key)
+            if isinstance(embedding, np.ndarray):
+                embedding.setflags(write=False)
+        except BaseException as e:
+            with self._lock:
+                del self._pending[key]
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            del self._pending[key]
+            self._cache[key] = embedding
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+        future.set_result(embedding)
+        return embedding
+
+    def clear(self):
+        """
+        Clears all cached embeddings.
+        """
+        with self._lock:
+            self._cache.clear()
+
+
 class VectorTool(BaseTool):
     """
     A tool for performing semantic similarity search using vector embeddings.
@@ -19,7 +113,12 @@ class VectorTool(BaseTool):
     semantic similarity with metadata filters.
     """
 
-    def __init__(self, db_session, embedding_service):
+    def __init__(
+        self,
+        db_session,
+        embedding_service,
+        embedding_cache: Optional[EmbeddingCache] = None
+    ):
         """
         Initializes the `VectorTool`.
 
@@ -27,6 +126,9 @@ class VectorTool(BaseTool):
             db_session: A database session object.
             embedding_service: An embedding service for generating vector
                 embeddings.
+            embedding_cache: An optional `EmbeddingCache` to share query
+                embeddings with other components. A private one is created
+                if not provided.
         """
         super().__init__(
             name="vector",
@@ -34,6 +136,9 @@ class VectorTool(BaseTool):
         )
         self.db = db_session
         self.embedding_svc = embedding_service
+        self.embedding_cache = embedding_cache or EmbeddingCache(
+            lambda text: self.embedding_svc.model.encode(text)
+        )
 
     @property
     def capabilities(self) -> List[str]:
@@ -133,7 +238,7 @@ class VectorTool(BaseTool):
 
         try:
             # Generate embedding for query
-            query_embedding = self.embedding_svc.model.encode(query)
+            query_embedding = self.embedding_cache.encode(query)
 
             # In a real implementation, this would search a vector database
             # For demo purposes, we'll simulate search results
@@ -162,7 +267,7 @@ class VectorTool(BaseTool):
 
         try:
             # Generate embedding for query
-            query_embedding = self.embedding_svc.model.encode(query)
+            query_embedding = self.embedding_cache.encode(query)
 
             # Simulate chunk search
             results = self._simulate_chunk_search(query, query_embedding, filters)
@@ -371,7 +476,7 @@ class VectorTool(BaseTool):
         """
         # Generate embedding for concept
         try:
-            concept_embedding = self.embedding_svc.model.encode(concept)
+            concept_embedding = self.embedding_cache.encode(concept)
 
             # Simulate concept-based search
             results = self._simulate_node_search(concept, concept_embedding, 10)
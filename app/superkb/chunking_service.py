@@ -3,10 +3,11 @@ This module provides the `ChunkingService` class, which is responsible for
 splitting documents into smaller text chunks.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 from uuid import UUID
 import re
 
+from sqlalchemy import delete, func
 from sqlmodel import Session, select
 
 from app.graph_rag.db import get_db
@@ -14,6 +15,53 @@ from app.graph_rag.models.chunk import Chunk
 from app.graph_rag.models.file_record import FileRecord
 
 
+# Split points, in order of preference: paragraphs, lines, sentences,
+# clauses, then words. The capturing group keeps the separators, so the
+# pieces can be reassembled into chunks verbatim.
+_SEPARATOR_RE = re.compile(r'(\n\n|\n|\. |! |\? |; |, | )')
+
+# Demo document returned by `_extract_text_from_file`; only the filename
+# varies, so the text is built once and filled in with `str.format`
+_MOCK_TEXT_TEMPLATE = """
+        {filename} - Research Paper on Knowledge Graphs
+
+        Abstract:
+        This paper presents a novel approach to knowledge graph construction using
+        multimodal database architectures. We demonstrate how relational, graph, and
+        vector databases can be unified through a single schema definition.
+
+        Introduction:
+        Knowledge graphs have become essential for modern information retrieval systems.
+        However, traditional approaches struggle with multimodal data representation.
+
+        Methods:
+        We propose a three-tier architecture:
+        1. Relational layer for structured data
+        2. Graph layer for relationship traversal
+        3. Vector layer for semantic search
+
+        The system uses schema-guided extraction to identify entities and relationships
+        automatically from source documents.
+
+        Results:
+        Our experiments show significant improvements in retrieval accuracy and speed
+        compared to traditional single-database approaches.
+
+        Conclusion:
+        Multimodal knowledge graphs represent the future of information retrieval,
+        combining the strengths of multiple database paradigms.
+
+        Authors:
+        Dr. Jane Smith (MIT), Prof. John Doe (Stanford), Dr. Alice Johnson (Berkeley)
+
+        Organizations:
+        Massachusetts Institute of Technology, Stanford University, UC Berkeley
+
+        The authors are affiliated with leading research institutions and have 
+        collaborated on this work as part of a multi-year research project.
+        """
+
+
 class ChunkingService:
     """
     A service for splitting documents into smaller text chunks.
@@ -66,9 +114,9 @@ class ChunkingService:
         # Split into chunks using simple recursive splitting
         text_chunks = self._split_text(text, chunk_size, chunk_overlap)
 
-        # Create chunk records
-        # Insert one at a time to avoid Snowflake executemany issues with VARIANT columns
-        result = []
+        # Create chunk records. IDs and timestamps are generated client-side,
+        # so the chunks are added in one batch and committed once.
+        chunks = []
         for chunk_index, chunk_text in enumerate(text_chunks):
             chunk_metadata = {
                 "strategy": "recursive_split",
@@ -87,11 +135,13 @@ class ChunkingService:
                 chunk_metadata=chunk_metadata,
                 embedding=None  # Generated later by embedding service
             )
+            chunks.append(chunk)
+
+        # Serialize before committing, since the commit expires the objects
+        result = [chunk.to_dict() for chunk in chunks]
 
-            self.db.add(chunk)
-            self.db.commit()  # Commit each chunk individually
-            self.db.refresh(chunk)
-            result.append(chunk.to_dict())
+        self.db.add_all(chunks)
+        self.db.commit()
 
         return result
 
@@ -132,9 +182,8 @@ class ChunkingService:
         Returns:
             The number of chunks for the file.
         """
-        statement = select(Chunk).where(Chunk.file_id == file_id)
-        chunks = self.db.exec(statement).all()
-        return len(chunks)
+        statement = select(func.count()).select_from(Chunk).where(Chunk.file_id == file_id)
+        return self.db.exec(statement).one()
 
     def delete_chunks(self, file_id: UUID) -> int:
         """
@@ -146,16 +195,9 @@ class ChunkingService:
         Returns:
             The number of chunks that were deleted.
         """
-        statement = select(Chunk).where(Chunk.file_id == file_id)
-        chunks = self.db.exec(statement).all()
-
-        count = 0
-        for chunk in chunks:
-            self.db.delete(chunk)
-            count += 1
-
+        result = self.db.execute(delete(Chunk).where(Chunk.file_id == file_id))
         self.db.commit()
-        return count
+        return result.rowcount
 
     def _extract_text_from_file(self, file_record: FileRecord) -> str:
         """
@@ -178,46 +220,7 @@ class ChunkingService:
         # - Use PDFParser or other parser
         # - Return actual extracted text
 
-        mock_text = f"""
-        {file_record.filename} - Research Paper on Knowledge Graphs
-
-        Abstract:
-        This paper presents a novel approach to knowledge graph construction using
-        multimodal database architectures. We demonstrate how relational, graph, and
-        vector databases can be unified through a single schema definition.
-
-        Introduction:
-        Knowledge graphs have become essential for modern information retrieval systems.
-        However, traditional approaches struggle with multimodal data representation.
-
-        Methods:
-        We propose a three-tier architecture:
-        1. Relational layer for structured data
-        2. Graph layer for relationship traversal
-        3. Vector layer for semantic search
-
-        The system uses schema-guided extraction to identify entities and relationships
-        automatically from source documents.
-
-        Results:
-        Our experiments show significant improvements in retrieval accuracy and speed
-        compared to traditional single-database approaches.
-
-        Conclusion:
-        Multimodal knowledge graphs represent the future of information retrieval,
-        combining the strengths of multiple database paradigms.
-
-        Authors:
-        Dr. Jane Smith (MIT), Prof. John Doe (Stanford), Dr. Alice Johnson (Berkeley)
-
-        Organizations:
-        Massachusetts Institute of Technology, Stanford University, UC Berkeley
-
-        The authors are affiliated with leading research institutions and have 
-        collaborated on this work as part of a multi-year research project.
-        """
-        
-        return mock_text.strip()
+        return _MOCK_TEXT_TEMPLATE.format(filename=file_record.filename).strip()
 
     def _split_text(self, text: str, chunk_size: int, chunk_overlap: int) -> List[str]:
         """
@@ -243,16 +246,11 @@ class ChunkingService:
         if not text or chunk_size <= 0:
             return []
         
-        # Separators in order of preference
-        separators = ["\n\n", "\n", ". ", "! ", "? ", "; ", ", ", " "]
-        
         chunks = []
         current_chunk = ""
         
-        # Split by preferred separators
-        parts = re.split(r'(\n\n|\n|\. |! |\? |; |, | )', text)
-        
-        for part in parts:
+        # Walk the pieces between (and including) the preferred separators
+        for part in self._iter_parts(text):
             # Skip empty parts
             if not part or part.isspace():
                 continue
@@ -283,4 +281,39 @@ class ChunkingService:
             chunks.append(current_chunk.strip())
         
         # Filter out empty chunks
-        return [c for c in chunks if c]
\ No newline at end of file
+        return [c for c in chunks if c]
+
+    @staticmethod
+    def _iter_parts(text: str) -> Iterator[str]:
+        """
+        Yields the same pieces as `_SEPARATOR_RE.split(text)`, one at a time.
+
+        Splitting a large document up front would hold every piece in memory
+        at once (roughly twice the size of the text). Instead, the text is cut
+        at paragraph breaks (`\n\n`, the highest-priority separator) with
+        `str.find`, and each paragraph is split with the regex on its own, so
+        only one paragraph's pieces are held at a time while the splitting
+        itself stays in C.
+
+        This gives exactly the pieces of a whole-text split: no other
+        separator can overlap the first `\n\n` found from a position, so the
+        regex would match it there too.
+
+        Args:
+            text: The text to split.
+
+        Yields:
+            The text between separators and the separators themselves, in
+            order.
+        """
+        split = _SEPARATOR_RE.split
+        find = text.find
+        last_end = 0
+        while True:
+            cut = find("\n\n", last_end)
+            if cut == -1:
+                yield from split(text[last_end:])
+                return
+            yield from split(text[last_end:cut])
+            yield "\n\n"
+            last_end = cut + 2
\ No newline at end of file
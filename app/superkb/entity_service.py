@@ -4,16 +4,43 @@ for extracting entities from text chunks using a HuggingFace NER model.
 """
 
 import os
+import shutil
+import tempfile
+from pathlib import Path
 from typing import Dict, List, Optional
 from uuid import UUID
 
 from sqlmodel import Session, select
-from transformers import pipeline
+from transformers import AutoTokenizer, pipeline
+
+try:
+    from optimum.onnxruntime import ORTModelForTokenClassification, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+except ImportError:  # pragma: no cover - optimum[onnxruntime] is optional
+    ORTModelForTokenClassification = None
 
 from app.graph_rag.models.chunk import Chunk
 from app.graph_rag.models.node import Node
 
 
+# Where the INT8-quantized ONNX exports of NER models are kept
+NER_ONNX_CACHE_DIR = Path(
+    os.getenv("SUPERKB_NER_CACHE_DIR", Path.home() / ".cache" / "superkb_ner")
+)
+
+# Text the quantized model must tag exactly like the PyTorch model before it
+# replaces it (INT8 quantization can shift borderline tokens)
+NER_PARITY_TEXT = (
+    "Tim Cook said on Monday that Apple will open a research lab in Berlin "
+    "together with the University of Oxford and Siemens."
+)
+
+
+def _entity_spans(entities: List[Dict]) -> List[tuple]:
+    """Reduces NER pipeline output to its (group, start, end) spans."""
+    return [(e["entity_group"], e["start"], e["end"]) for e in entities]
+
+
 class EntityExtractionService:
     """
     A service for extracting entities from text chunks.
@@ -24,16 +51,25 @@ class EntityExtractionService:
     in the knowledge graph.
     """
 
-    def __init__(self, db: Session, model_name: str = "dslim/bert-base-NER"):
+    def __init__(
+        self,
+        db: Session,
+        model_name: str = "dslim/bert-base-NER",
+        batch_size: Optional[int] = None
+    ):
         """
         Initializes the `EntityExtractionService`.
 
         Args:
             db: A database session object.
             model_name: The name of the HuggingFace NER model to use.
+            batch_size: The number of chunks the NER model processes per
+                forward pass. Defaults to the `NER_BATCH_SIZE` environment
+                variable, or 16.
         """
         self.db = db
         self.model_name = model_name
+        self.batch_size = batch_size or int(os.getenv("NER_BATCH_SIZE", "16"))
 
         # Initialize NER pipeline (lazy loading - only when needed)
         self._ner_pipeline = None
@@ -47,17 +83,96 @@ class EntityExtractionService:
             # Get HF token if available
             hf_token = os.getenv("HUGGINGFACE_TOKEN")
 
+            # Unlike sentence-transformers, pipelines stay on the CPU unless
+            # a device is given
+            import torch
+            device = 0 if torch.cuda.is_available() else -1
+
             print(f"Loading NER model: {self.model_name}...")
-            self._ner_pipeline = pipeline(
+
+            torch_pipeline = pipeline(
                 "ner",
                 model=self.model_name,
                 aggregation_strategy="simple",  # Group tokens into entities
-                token=hf_token
+                token=hf_token,
+                device=device
             )
-            print("✓ NER model loaded")
+
+            # On the CPU, SUPERKB_NER_ONNX=1 opts into an INT8-quantized ONNX
+            # Runtime model (needs requirements-onnx.txt). It is only used if
+            # it tags the parity text exactly like the PyTorch model.
+            if (
+                device < 0
+                and ORTModelForTokenClassification is not None
+                and os.getenv("SUPERKB_NER_ONNX") == "1"
+            ):
+                try:
+                    onnx_pipeline = self._load_onnx_pipeline(hf_token)
+                    expected = _entity_spans(torch_pipeline(NER_PARITY_TEXT))
+                    if _entity_spans(onnx_pipeline(NER_PARITY_TEXT)) != expected:
+                        raise ValueError("quantized model output differs from PyTorch")
+                    self._ner_pipeline = onnx_pipeline
+                    print("✓ NER model loaded (onnxruntime, int8)")
+                except Exception as e:
+                    print(f"⚠️  ONNX NER model unavailable, using PyTorch: {e}")
+
+            if self._ner_pipeline is None:
+                self._ner_pipeline = torch_pipeline
+                print(f"✓ NER model loaded ({'cuda' if device >= 0 else 'cpu'})")
 
         return self._ner_pipeline
 
+    def _load_onnx_pipeline(self, hf_token: Optional[str]):
+        """
+        Builds an NER pipeline on an INT8-quantized ONNX Runtime model.
+
+        The first call exports the model to ONNX and applies dynamic INT8
+        quantization, caching the result under `NER_ONNX_CACHE_DIR`; later
+        calls (and other processes) load the cached model directly. The
+        export is written to a temporary directory and renamed into place, so
+        concurrent first runs never read a half-written model.
+
+        Args:
+            hf_token: An optional HuggingFace token for downloading the model.
+
+        Returns:
+            A `transformers` NER pipeline backed by ONNX Runtime.
+        """
+        model_dir = NER_ONNX_CACHE_DIR / self.model_name.replace("/", "__")
+        quantized_file = "model_quantized.onnx"
+
+        if not (model_dir / quantized_file).exists():
+            print("Exporting NER model to ONNX (first run only)...")
+            NER_ONNX_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            export_dir = tempfile.mkdtemp(dir=NER_ONNX_CACHE_DIR, prefix=f"{model_dir.name}.")
+            try:
+                onnx_model = ORTModelForTokenClassification.from_pretrained(
+                    self.model_name, export=True, token=hf_token
+                )
+                quantizer = ORTQuantizer.from_pretrained(onnx_model)
+                quantizer.quantize(
+                    save_dir=export_dir,
+                    quantization_config=AutoQuantizationConfig.avx512_vnni(
+                        is_static=False, per_channel=False
+                    )
+                )
+                AutoTokenizer.from_pretrained(self.model_name, token=hf_token).save_pretrained(export_dir)
+                try:
+                    os.replace(export_dir, model_dir)
+                except OSError:
+                    # Another process finished its export first; use that one
+                    if not (model_dir / quantized_file).exists():
+                        raise
+            finally:
+                shutil.rmtree(export_dir, ignore_errors=True)
+
+        return pipeline(
+            "ner",
+            model=ORTModelForTokenClassification.from_pretrained(model_dir, file_name=quantized_file),
+            tokenizer=AutoTokenizer.from_pretrained(model_dir),
+            aggregation_strategy="simple"  # Group tokens into entities
+        )
+
     def extract_entities_from_chunks(
         self,
         file_id: UUID,
@@ -84,9 +199,12 @@ class EntityExtractionService:
 
         print(f"Extracting entities from {len(chunks)} chunks...")
 
+        # Run NER over all chunks in one call, so the pipeline batches them
+        results = self.ner([chunk.content for chunk in chunks], batch_size=self.batch_size)
+
         all_nodes = []
-        for chunk in chunks:
-            nodes = self._extract_entities_from_chunk(chunk, schema_id)
+        for chunk, entities in zip(chunks, results):
+            nodes = self._create_entity_nodes(chunk, entities, schema_id)
             all_nodes.extend(nodes)
 
         print(f"✓ Extracted {len(all_nodes)} entities")
@@ -111,7 +229,27 @@ class EntityExtractionService:
         """
         # Run NER on chunk content
         entities = self.ner(chunk.content)
+        return self._create_entity_nodes(chunk, entities, schema_id)
+
+    def _create_entity_nodes(
+        self,
+        chunk: Chunk,
+        entities: List[Dict],
+        schema_id: Optional[UUID] = None
+    ) -> List[Dict]:
+        """
+        Creates nodes for the entities that NER found in a chunk.
 
+        Args:
+            chunk: The chunk the entities were extracted from.
+            entities: The NER pipeline's output for the chunk.
+            schema_id: An optional schema ID to associate the extracted
+                entities with.
+
+        Returns:
+            A list of dictionaries, where each dictionary represents a
+            created node.
+        """
         # Create node for each entity
         nodes = []
         for entity in entities:
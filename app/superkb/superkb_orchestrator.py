@@ -475,7 +475,7 @@ class SuperKBOrchestrator:
         # Step 5: Generate Embeddings
         print("Step 5: Embedding Generation")
         print("-" * 80)
-        chunk_emb = self.embedding_svc.generate_chunk_embeddings(file_id)
+        chunk_emb = self.embedding_svc.generate_embeddings_for_files([file_id])
         node_emb = self.embedding_svc.generate_node_embeddings()
         stats["embeddings"] = chunk_emb + node_emb
         print(f"✓ Generated {chunk_emb} chunk embeddings")
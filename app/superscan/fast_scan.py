@@ -3,7 +3,9 @@ This module provides the `FastScan` class, which is responsible for generating
 an ontology proposal from a document using a large language model (LLM).
 """
 
-from typing import Any, Dict, List
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import hashlib
 import json
 
 class FastScan:
@@ -16,7 +18,10 @@ class FastScan:
     candidate nodes, edges, and their attributes.
     """
 
-    def __init__(self, api_key: str = None, base_url: str = None, model: str = None):
+    def __init__(
+        self, api_key: str = None, base_url: str = None, model: str = None,
+        cache_dir: Optional[str | Path] = None
+    ):
         """
         Initializes the `FastScan` class with an LLM client.
 
@@ -27,10 +32,14 @@ class FastScan:
                 is used for custom endpoints like DeepSeek.
             model: The name of the model to use. Defaults to 'gpt-3.5-turbo'
                 for OpenAI or 'deepseek-chat' for DeepSeek.
+            cache_dir: An optional directory for caching LLM proposals on
+                disk. When set, a proposal for the same snippets, hints and
+                model is read back instead of calling the LLM again.
         """
         self.api_key = api_key
         self.base_url = base_url
         self.model = model or ("deepseek-chat" if base_url and "deepseek" in base_url else "gpt-3.5-turbo")
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else None
 
         try:
             import openai
@@ -215,12 +224,31 @@ Instructions:
             "summary": "Default schema proposal (LLM unavailable)",
         }
 
+    def _cache_path(self, snippets: List[str], hints: Dict[str, Any] | None) -> Optional[Path]:
+        """
+        Returns the cache file for a proposal request, if caching is enabled.
+
+        Args:
+            snippets: A list of text snippets from the document.
+            hints: A dictionary of hints to guide the LLM.
+
+        Returns:
+            The path of the cached proposal, or `None` without a `cache_dir`.
+        """
+        if self.cache_dir is None:
+            return None
+        key = hashlib.sha256(
+            json.dumps([snippets, hints, self.model], sort_keys=True, default=str).encode()
+        ).hexdigest()
+        return self.cache_dir / f"{key}.json"
+
     def generate_proposal(self, snippets: List[str], hints: Dict[str, Any] | None = None) -> Dict[str, Any]:
         """
         Generates an ontology proposal from text snippets using an LLM.
 
         Tries DeepSeek first, falls back to HuggingFace if DeepSeek fails,
-        and uses a default schema if both fail.
+        and uses a default schema if both fail. With a `cache_dir`, DeepSeek
+        proposals are cached on disk (fallback results are not).
 
         Args:
             snippets: A list of text snippets from the document.
@@ -234,6 +262,15 @@ Instructions:
             print("⚠️ No DeepSeek client configured, trying HuggingFace...")
             return self._try_huggingface_fallback(snippets, hints)
 
+        cache_path = self._cache_path(snippets, hints)
+        if cache_path is not None and cache_path.exists():
+            try:
+                proposal = json.loads(cache_path.read_text())
+                print(f"📦 Using cached proposal ({cache_path.name[:12]})")
+                return proposal
+            except (OSError, ValueError):
+                pass  # Unreadable cache entry; regenerate it
+
         # Try DeepSeek first
         try:
             print(f"🤖 Trying DeepSeek API ({self.model})...")
@@ -254,6 +291,12 @@ Instructions:
             if proposal.get("nodes") or proposal.get("edges"):
                 proposal.setdefault("summary", f"Ontology proposal from {self.model}")
                 print(f"✅ DeepSeek generated {len(proposal.get('nodes', []))} node schemas")
+                if cache_path is not None:
+                    try:
+                        cache_path.parent.mkdir(parents=True, exist_ok=True)
+                        cache_path.write_text(json.dumps(proposal))
+                    except OSError as e:
+                        print(f"⚠️ Could not cache proposal: {e}")
                 return proposal
             else:
                 print("⚠️ DeepSeek returned empty proposal, trying HuggingFace...")
@@ -83,33 +83,80 @@ class ProjectService:
                 "updated_at": obj.updated_at.isoformat(),
             }
 
-    def list_projects(self, owner_id: Optional[str] = None, limit: int = 20, offset: int = 0) -> Dict[str, Any]:
+    def get_project_by_name(self, project_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Gets a project by its unique name.
+
+        Only the scalar columns are loaded; the deferred VARIANT columns
+        (`config`, `stats`, `tags`, ...) are left out.
+
+        Args:
+            project_name: The name of the project to retrieve.
+
+        Returns:
+            A dictionary representing the project, or `None` if not found.
+        """
+        from app.graph_rag.models.project import Project, ProjectQuery
+        with self.db.get_session() as session:
+            stmt = ProjectQuery(project_name=project_name, limit=1).to_statement()
+            obj = session.exec(stmt).first()
+            if not obj:
+                return None
+            return {
+                "project_id": str(obj.project_id),
+                "project_name": obj.project_name,
+                "display_name": obj.display_name,
+                "owner_id": obj.owner_id,
+                "status": obj.status.value,
+                "created_at": obj.created_at.isoformat(),
+            }
+
+    def list_projects(
+        self,
+        owner_id: Optional[str] = None,
+        limit: int = 20,
+        offset: int = 0,
+        include_schemas: bool = False,
+    ) -> Dict[str, Any]:
         """
         Lists the projects.
 
         Args:
             owner_id: An optional owner ID to filter the projects by.
-            limit: The maximum number of projects to return.
+            limit: The maximum number of projects to return (at most 100).
             offset: The number of projects to skip.
+            include_schemas: Whether to include each project's schemas. They
+                are loaded for the whole page with one query.
 
         Returns:
             A dictionary containing a list of projects and the total
             number of projects.
         """
-        from app.graph_rag.models import Project
+        from sqlmodel import func, select
+        from app.graph_rag.models.project import Project, ProjectQuery
         with self.db.get_session() as session:
-            query = session.query(Project)
-            if owner_id:
-                query = query.filter(Project.owner_id == owner_id)
-            total = query.count()
-            items = query.order_by(Project.created_at.desc()).limit(limit).offset(offset).all()
-            return {
-                "items": [
-                    {"project_id": str(p.project_id), "project_name": p.project_name}
-                    for p in items
-                ],
-                "total": total,
-            }
+            # The statement template is cached per filter shape; only the
+            # owner ID and paging values are bound per call
+            stmt = ProjectQuery(owner_id=owner_id or None, limit=limit, offset=offset).to_statement()
+            unpaged = stmt.limit(None).offset(None).order_by(None).subquery()
+            total = session.exec(select(func.count()).select_from(unpaged)).one()
+            items = session.exec(stmt).all()
+            if include_schemas:
+                Project.prefetch_schemas(session, items)
+            result = []
+            for p in items:
+                item = {"project_id": str(p.project_id), "project_name": p.project_name}
+                if include_schemas:
+                    item["schemas"] = [
+                        {
+                            "schema_id": str(s.schema_id),
+                            "schema_name": s.schema_name,
+                            "entity_type": s.entity_type.value,
+                        }
+                        for s in p.schemas
+                    ]
+                result.append(item)
+            return {"items": result, "total": total}
 
     def patch_project(self, project_id: UUID, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
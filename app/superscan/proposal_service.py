@@ -237,47 +237,38 @@ class ProposalService:
             if not p:
                 raise ValueError(f"Proposal {proposal_id} not found")
 
-            created_schemas = []
-
-            # Create schemas for nodes
-            for node_def in p.nodes:
-                schema = Schema(
+            # Build every schema before flushing: their IDs are generated
+            # client-side, so no per-row flush is needed and the unit of work
+            # sends all schema INSERTs as one executemany batch on commit.
+            schemas = [
+                Schema(
                     project_id=p.project_id,
-                    schema_name=node_def["schema_name"],
-                    entity_type=EntityType.NODE,
+                    schema_name=definition["schema_name"],
+                    entity_type=entity_type,
                     version="1.0.0",
-                    description=node_def.get("notes", ""),
-                    structured_attributes=node_def.get("structured_attributes", []),
+                    description=definition.get("notes", ""),
+                    structured_attributes=definition.get("structured_attributes", []),
                     is_active=True,
                 )
-                session.add(schema)
-                session.flush()
-                created_schemas.append({
-                    "schema_id": str(schema.schema_id),
-                    "schema_name": schema.schema_name,
-                    "entity_type": "NODE",
-                    "version": schema.version,
-                })
-
-            # Create schemas for edges
-            for edge_def in p.edges:
-                schema = Schema(
-                    project_id=p.project_id,
-                    schema_name=edge_def["schema_name"],
-                    entity_type=EntityType.EDGE,
-                    version="1.0.0",
-                    description=edge_def.get("notes", ""),
-                    structured_attributes=edge_def.get("structured_attributes", []),
-                    is_active=True,
+                for entity_type, definitions in (
+                    (EntityType.NODE, p.nodes),
+                    (EntityType.EDGE, p.edges),
                 )
-                session.add(schema)
-                session.flush()
-                created_schemas.append({
+                for definition in definitions
+            ]
+            for schema in schemas:
+                schema.sync_attributes()
+            session.add_all(schemas)
+
+            created_schemas = [
+                {
                     "schema_id": str(schema.schema_id),
                     "schema_name": schema.schema_name,
-                    "entity_type": "EDGE",
+                    "entity_type": schema.entity_type.name,
                     "version": schema.version,
-                })
+                }
+                for schema in schemas
+            ]
 
             # Mark proposal as finalized
             p.status = "finalized"
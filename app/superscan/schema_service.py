@@ -35,10 +35,16 @@ class SchemaService:
 
         Returns:
             A dictionary representing the created schema.
+
+        Raises:
+            ValueError: If the version cannot be stored (see
+                `Schema.check_version`).
         """
         from app.graph_rag.models import Schema
         with self.db.get_session() as session:
             schema = Schema(project_id=project_id, **payload)
+            schema.check_version()
+            schema.sync_attributes()
             session.add(schema)
             session.commit()
             session.refresh(schema)
@@ -119,6 +125,10 @@ class SchemaService:
         Returns:
             A dictionary representing the updated schema, or `None` if the
             schema was not found.
+
+        Raises:
+            ValueError: If the new version cannot be stored (see
+                `Schema.check_version`).
         """
         from app.graph_rag.models import Schema
         with self.db.get_session() as session:
@@ -128,6 +138,10 @@ class SchemaService:
             for k, v in payload.items():
                 if hasattr(s, k):
                     setattr(s, k, v)
+            if "version" in payload:
+                s.check_version()
+            if "structured_attributes" in payload:
+                s.sync_attributes()
             session.add(s)
             session.commit()
             session.refresh(s)
@@ -0,0 +1,98 @@
+"""
+Unit tests for SuperChat (context management and agent orchestration).
+
+These tests use in-memory stores and mock tools, so they run without
+Snowflake, Neo4j or an LLM.
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from app.superchat.agent_orchestrator import AgentOrchestrator
+from app.superchat.context_manager import ContextManager
+from app.superchat.tools.base_tool import BaseTool, ToolResult
+
+
+class TestResolveReferences:
+    """Tests for pronoun resolution in ContextManager."""
+
+    def _manager_with_entity(self, entity: str) -> ContextManager:
+        """Builds a manager whose session 's1' has mentioned one entity."""
+        manager = ContextManager()
+        manager.add_turn(
+            session_id="s1",
+            user_query=f"Who is {entity}?",
+            agent_response=f"{entity} is a researcher.",
+            intent="factual",
+            entities_mentioned=[entity],
+            tools_used=[],
+        )
+        return manager
+
+    def test_pronoun_is_replaced_as_a_whole_word(self):
+        """Test that a resolvable pronoun is replaced by the entity."""
+        manager = self._manager_with_entity("John Smith")
+
+        assert manager.resolve_references("what did he write", "s1") == "what did John Smith write"
+
+    def test_pronoun_letters_inside_words_are_left_alone(self):
+        """Test that 'he' inside 'where', 'these' and 'other' is not replaced."""
+        manager = self._manager_with_entity("John Smith")
+
+        assert (
+            manager.resolve_references("where did he publish these", "s1")
+            == "where did John Smith publish these"
+        )
+        assert (
+            manager.resolve_references("the other paper he wrote", "s1")
+            == "the other paper John Smith wrote"
+        )
+        assert (
+            manager.resolve_references("where are the other results", "s1")
+            == "where are the other results"
+        )
+
+
+class _SessionTool(BaseTool):
+    """A tool that records whether its session was used concurrently."""
+
+    def __init__(self, name: str, session, attribute: str):
+        super().__init__(name, f"{name} test tool")
+        setattr(self, attribute, session)
+
+    @property
+    def capabilities(self):
+        return [self.name]
+
+    def execute(self, query, context=None):
+        session = self.db_session
+        if not session.lock.acquire(blocking=False):
+            session.overlaps += 1
+        else:
+            time.sleep(0.05)
+            session.lock.release()
+        return ToolResult(success=True, data=[], metadata={}, execution_time=0.0)
+
+
+class TestRunTools:
+    """Tests for concurrent tool execution in AgentOrchestrator."""
+
+    def test_tools_sharing_a_session_run_sequentially(self):
+        """Test that tools holding the same session as `db` or `session` never overlap."""
+        shared = SimpleNamespace(lock=threading.Lock(), overlaps=0)
+        other = SimpleNamespace(lock=threading.Lock(), overlaps=0)
+        tools = [
+            _SessionTool("relational", shared, "db"),
+            _SessionTool("graph", shared, "session"),
+            _SessionTool("vector", shared, "db"),
+            _SessionTool("external", other, "session"),
+        ]
+        orchestrator = AgentOrchestrator(MagicMock(), None, None)
+
+        results = orchestrator._run_tools(tools, "who wrote it", "s1")
+
+        assert all(result.success for result in results)
+        assert shared.overlaps == 0
+        assert tools[1].db_session is shared
@@ -122,10 +122,11 @@ class SuperKBVerifier:
 
             # Mock NER pipeline
             mock_ner = Mock()
-            mock_ner.return_value = [
+            # One list of entities per chunk (the pipeline is called on a batch)
+            mock_ner.return_value = [[
                 {'entity_group': 'PER', 'word': 'John Doe', 'score': 0.95, 'start': 0, 'end': 8},
                 {'entity_group': 'ORG', 'word': 'MIT', 'score': 0.88, 'start': 10, 'end': 13}
-            ]
+            ]]
             mock_pipeline.return_value = mock_ner
 
             # Mock node
@@ -147,7 +148,7 @@ class SuperKBVerifier:
             entities = service.extract_entities_from_chunks(mock_chunk.file_id)
 
             # Verify NER pipeline was used
-            mock_ner.assert_called_with(mock_chunk.content)
+            mock_ner.assert_called_with([mock_chunk.content], batch_size=service.batch_size)
             self.log_test("NER pipeline called on chunk content", True)
 
             # Verify entities were extracted